@@ -0,0 +1,26 @@
+"""add notified/start_datetime index to schedule
+
+Revision ID: 3c8e5a1f7b20
+Revises: f2b7c4e91a3d
+Create Date: 2026-10-16 14:05:27.514302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8e5a1f7b20'
+down_revision: Union[str, None] = 'f2b7c4e91a3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_schedule_notified_start', 'schedule', ['notified', 'start_datetime'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_schedule_notified_start', table_name='schedule')
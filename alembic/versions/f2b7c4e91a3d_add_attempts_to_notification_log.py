@@ -0,0 +1,28 @@
+"""add attempts to notification_log
+
+Revision ID: f2b7c4e91a3d
+Revises: d91648dc4f04
+Create Date: 2026-10-16 10:12:41.308115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7c4e91a3d'
+down_revision: Union[str, None] = 'd91648dc4f04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One log entry per phone now summarizes all its retries; existing rows
+    # each recorded a single attempt
+    op.add_column('notification_log', sa.Column('attempts', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade() -> None:
+    op.drop_column('notification_log', 'attempts')
@@ -5,6 +5,7 @@ FastAPI router for shift configuration CRUD operations.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -23,7 +24,8 @@ from src.services import (
 from src.api.routes.auth import require_auth, require_admin
 
 
-router = APIRouter()
+# orjson serializes the validated response models faster than stdlib json
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("/", response_model=List[ShiftResponse])
@@ -44,8 +46,7 @@ def list_shifts(
         GET /api/v1/shifts/
     """
     service = ShiftService(db)
-    shifts = service.get_all()
-    return shifts
+    return service.get_all()
 
 
 @router.get("/{shift_id}", response_model=ShiftResponse)
@@ -55,6 +55,7 @@ class NotificationLogResponse(BaseModel):
     error_message: Optional[str] = Field(None, description="Error details if failed")
     recipient_name: Optional[str] = Field(None, description="Recipient name at time of notification (snapshot)")
     recipient_phone: Optional[str] = Field(None, description="Recipient phone at time of notification (snapshot)")
+    attempts: int = Field(1, description="Number of send attempts summarized by this entry")
 
     class Config:
         from_attributes = True
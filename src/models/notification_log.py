@@ -26,6 +26,8 @@ class NotificationLog(Base):
         error_message: Error details if notification failed
         recipient_name: Team member name at time of notification (snapshot)
         recipient_phone: Team member phone at time of notification (snapshot)
+        attempts: Number of send attempts this entry covers (retries are
+            summarized into one entry per phone)
 
     Relationships:
         schedule: The schedule assignment this notification is for
@@ -61,6 +63,9 @@ class NotificationLog(Base):
     recipient_name = Column(String(100), nullable=True)  # Name at time of notification
     recipient_phone = Column(String(15), nullable=True)  # Phone at time of notification
 
+    # Send attempts summarized by this entry (1 unless retries were needed)
+    attempts = Column(Integer, nullable=False, default=1, server_default="1")
+
     # Relationships
     schedule = relationship("Schedule", back_populates="notification_logs")
 
@@ -92,6 +97,7 @@ class NotificationLog(Base):
             "error_message": self.error_message,
             "recipient_name": self.recipient_name,
             "recipient_phone": self.recipient_phone,
+            "attempts": self.attempts,
         }
 
     @property
@@ -4,7 +4,7 @@ Schedule model for WhoseOnFirst.
 Represents a specific assignment of a team member to a shift.
 """
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -77,6 +77,12 @@ class Schedule(Base):
         cascade="all, delete-orphan"
     )
 
+    # Indexes for common queries
+    __table_args__ = (
+        # Pending notifications: notified equality, then start_datetime range
+        Index('ix_schedule_notified_start', 'notified', 'start_datetime'),
+    )
+
     def __repr__(self):
         """String representation of Schedule."""
         return (
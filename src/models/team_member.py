@@ -4,11 +4,16 @@ TeamMember model for WhoseOnFirst.
 Represents a team member who can be assigned to on-call shifts.
 """
 
+import re
+
 from sqlalchemy import Column, Integer, String, Boolean, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
 
+# E.164 format: +1 followed by 10 digits
+_E164_RE = re.compile(r'^\+1\d{10}$')
+
 
 class TeamMember(Base):
     """
@@ -96,10 +101,7 @@ class TeamMember(Base):
         Returns:
             True if valid, False otherwise
         """
-        import re
-        # E.164 format: +1 followed by 10 digits
-        pattern = r'^\+1\d{10}$'
-        return bool(re.match(pattern, phone))
+        return isinstance(phone, str) and _E164_RE.match(phone) is not None
 
     def sanitize_phone_for_log(self) -> str:
         """
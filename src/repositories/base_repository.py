@@ -5,6 +5,7 @@ Provides generic database operations that can be inherited by specific repositor
 """
 
 from typing import Generic, TypeVar, Type, List, Optional, Dict, Any
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -108,17 +109,34 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Updated model instance if found, None otherwise
 
+        Raises:
+            Exception: If database operation fails
+        """
+        instance = self.get_by_id(item_id)
+        if instance is None:
+            return None
+        return self.update_instance(instance, data)
+
+    def update_instance(self, instance: ModelType, data: Dict[str, Any]) -> ModelType:
+        """
+        Update an already-loaded record.
+
+        Args:
+            instance: Model instance to update
+            data: Dictionary of field values to update
+
+        Returns:
+            Updated model instance
+
         Raises:
             Exception: If database operation fails
         """
         try:
-            instance = self.get_by_id(item_id)
-            if instance:
-                for key, value in data.items():
-                    if hasattr(instance, key):
-                        setattr(instance, key, value)
-                self.db.commit()
-                self.db.refresh(instance)
+            for key, value in data.items():
+                if hasattr(instance, key):
+                    setattr(instance, key, value)
+            self.db.commit()
+            self.db.refresh(instance)
             return instance
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -156,7 +174,7 @@ class BaseRepository(Generic[ModelType]):
             Total count of records in the table
         """
         try:
-            return self.db.query(self.model).count()
+            return self.db.query(func.count(self.model.id)).scalar()
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error counting {self.model.__name__}: {str(e)}")
@@ -172,7 +190,9 @@ class BaseRepository(Generic[ModelType]):
             True if record exists, False otherwise
         """
         try:
-            return self.db.query(self.model).filter(self.model.id == item_id).count() > 0
+            return self.db.query(
+                self.db.query(self.model).filter(self.model.id == item_id).exists()
+            ).scalar()
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error checking existence of {self.model.__name__}: {str(e)}")
@@ -5,11 +5,11 @@ Handles all database operations related to SMS notification tracking,
 including logging attempts, tracking failures, and audit queries.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
 from .base_repository import BaseRepository
 from ..models.notification_log import NotificationLog
@@ -236,6 +236,9 @@ class NotificationLogRepository(BaseRepository[NotificationLog]):
         """
         Get the number of retry attempts for a schedule.
 
+        Sums the attempts column, since one log entry can cover several
+        retries of the same phone.
+
         Args:
             schedule_id: Schedule ID to count retries for
 
@@ -247,14 +250,45 @@ class NotificationLogRepository(BaseRepository[NotificationLog]):
         """
         try:
             return (
-                self.db.query(self.model)
+                self.db.query(func.coalesce(func.sum(self.model.attempts), 0))
                 .filter(self.model.schedule_id == schedule_id)
-                .count()
+                .scalar()
             )
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error counting retries: {str(e)}")
 
+    def get_retry_counts_for_schedules(self, schedule_ids: List[int]) -> Dict[int, int]:
+        """
+        Get notification attempt counts for many schedules in one query.
+
+        Batch counterpart of get_retry_count_for_schedule.
+
+        Args:
+            schedule_ids: Schedule IDs to count retries for
+
+        Returns:
+            Dictionary mapping schedule ID to attempt count. Schedules with
+            no attempts are omitted.
+
+        Raises:
+            Exception: If database operation fails
+        """
+        if not schedule_ids:
+            return {}
+
+        try:
+            rows = (
+                self.db.query(self.model.schedule_id, func.sum(self.model.attempts))
+                .filter(self.model.schedule_id.in_(schedule_ids))
+                .group_by(self.model.schedule_id)
+                .all()
+            )
+            return {schedule_id: count for schedule_id, count in rows}
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error counting retries: {str(e)}")
+
     def get_success_rate(
         self,
         start_date: Optional[datetime] = None,
@@ -381,7 +415,8 @@ class NotificationLogRepository(BaseRepository[NotificationLog]):
         twilio_sid: Optional[str] = None,
         error_message: Optional[str] = None,
         recipient_name: Optional[str] = None,
-        recipient_phone: Optional[str] = None
+        recipient_phone: Optional[str] = None,
+        attempts: int = 1
     ) -> NotificationLog:
         """
         Create a new notification log entry.
@@ -396,6 +431,7 @@ class NotificationLogRepository(BaseRepository[NotificationLog]):
             error_message: Optional error message if failed
             recipient_name: Team member name at time of notification (snapshot)
             recipient_phone: Team member phone at time of notification (snapshot)
+            attempts: Number of send attempts this entry summarizes
 
         Returns:
             Created NotificationLog instance
@@ -411,7 +447,8 @@ class NotificationLogRepository(BaseRepository[NotificationLog]):
                 "twilio_sid": twilio_sid,
                 "error_message": error_message,
                 "recipient_name": recipient_name,
-                "recipient_phone": recipient_phone
+                "recipient_phone": recipient_phone,
+                "attempts": attempts
             }
 
             return self.create(log_data)
@@ -419,3 +456,61 @@ class NotificationLogRepository(BaseRepository[NotificationLog]):
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error logging notification attempt: {str(e)}")
+
+    def bulk_log_notification_attempts(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Insert many notification log entries in a single commit.
+
+        Used when a batch of sends buffers its log writes instead of
+        committing one row per attempt. Entries take the same fields as
+        log_notification_attempt; sent_at defaults to now when missing.
+
+        Args:
+            entries: List of notification log field dictionaries
+
+        Raises:
+            Exception: If database operation fails
+        """
+        if not entries:
+            return
+
+        try:
+            now = datetime.now()
+            mappings = [{"sent_at": now, **entry} for entry in entries]
+            self.db.bulk_insert_mappings(self.model, mappings)
+            self.db.commit()
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error bulk logging notification attempts: {str(e)}")
+
+    def log_notification_attempts(self, entries: List[Dict[str, Any]]) -> List[NotificationLog]:
+        """
+        Create several notification log entries in a single commit.
+
+        Unlike bulk_log_notification_attempts, the created instances are
+        returned with their IDs populated. Entries take the same fields as
+        log_notification_attempt; sent_at defaults to now when missing.
+
+        Args:
+            entries: List of notification log field dictionaries
+
+        Returns:
+            Created NotificationLog instances, in the order given
+
+        Raises:
+            Exception: If database operation fails
+        """
+        if not entries:
+            return []
+
+        try:
+            now = datetime.now()
+            logs = [self.model(**{"sent_at": now, **entry}) for entry in entries]
+            self.db.add_all(logs)
+            self.db.commit()
+            return logs
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error logging notification attempts: {str(e)}")
@@ -9,7 +9,7 @@ from typing import List, Optional
 from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_
+from sqlalchemy import and_, insert
 
 from .base_repository import BaseRepository
 from ..models.schedule import Schedule
@@ -119,6 +119,7 @@ class ScheduleRepository(BaseRepository[Schedule]):
                 query = query.filter(self.model.start_datetime <= end_naive)
 
             return query.options(
+                joinedload(self.model.team_member),
                 joinedload(self.model.shift)
             ).order_by(self.model.start_datetime).all()
 
@@ -239,6 +240,41 @@ class ScheduleRepository(BaseRepository[Schedule]):
             self.db.rollback()
             raise Exception(f"Database error getting pending notifications: {str(e)}")
 
+    def load_relationships(self, schedule_ids: List[int]) -> List[Schedule]:
+        """
+        Load schedules with team_member and shift eagerly in one query.
+
+        Instances already in the session get their unloaded relationships
+        populated, so this can be used to warm a batch of schedules that
+        were loaded without eager options.
+
+        Args:
+            schedule_ids: IDs of the schedules to load
+
+        Returns:
+            List of Schedule instances with team_member and shift loaded
+
+        Raises:
+            Exception: If database operation fails
+        """
+        if not schedule_ids:
+            return []
+
+        try:
+            return (
+                self.db.query(self.model)
+                .filter(self.model.id.in_(schedule_ids))
+                .options(
+                    joinedload(self.model.team_member),
+                    joinedload(self.model.shift)
+                )
+                .all()
+            )
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error loading schedule relationships: {str(e)}")
+
     def mark_as_notified(self, schedule_id: int) -> Optional[Schedule]:
         """
         Mark a schedule assignment as notified.
@@ -264,6 +300,43 @@ class ScheduleRepository(BaseRepository[Schedule]):
             self.db.rollback()
             raise Exception(f"Database error marking schedule as notified: {str(e)}")
 
+    def mark_many_as_notified(
+        self,
+        schedule_ids: List[int],
+        commit: bool = True
+    ) -> int:
+        """
+        Mark several schedule assignments as notified with a single UPDATE.
+
+        Schedules already loaded in the session are updated in place.
+
+        Args:
+            schedule_ids: IDs of schedules to mark as notified
+            commit: If False, leave the UPDATE for the caller to commit
+
+        Returns:
+            Number of schedules updated
+
+        Raises:
+            Exception: If database operation fails
+        """
+        if not schedule_ids:
+            return 0
+
+        try:
+            updated_count = (
+                self.db.query(self.model)
+                .filter(self.model.id.in_(schedule_ids))
+                .update({self.model.notified: True}, synchronize_session="evaluate")
+            )
+            if commit:
+                self.db.commit()
+            return updated_count
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error marking schedules as notified: {str(e)}")
+
     def get_active_assignments(self) -> List[Schedule]:
         """
         Get currently active schedule assignments.
@@ -415,16 +488,21 @@ class ScheduleRepository(BaseRepository[Schedule]):
         Raises:
             Exception: If database operation fails
         """
-        try:
-            schedules = [self.model(**data) for data in schedules_data]
+        if not schedules_data:
+            return []
 
-            # Use add_all instead of bulk_save_objects to keep objects in session
-            self.db.add_all(schedules)
+        try:
+            # One executemany INSERT ... RETURNING; SQLAlchemy batches the
+            # rows to stay within SQLite's bound-parameter limit
+            schedules = self.db.scalars(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                schedules_data
+            ).all()
+            schedule_ids = [schedule.id for schedule in schedules]
             self.db.commit()
 
-            # Refresh to get IDs and load relationships
-            for schedule in schedules:
-                self.db.refresh(schedule)
+            # Reload the expired instances, with team_member and shift, in one query
+            self.load_relationships(schedule_ids)
 
             return schedules
 
@@ -150,7 +150,7 @@ class ShiftRepository(BaseRepository[Shift]):
             if exclude_id is not None:
                 query = query.filter(self.model.id != exclude_id)
 
-            return query.count() > 0
+            return self.db.query(query.exists()).scalar()
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error checking shift number existence: {str(e)}")
@@ -5,7 +5,8 @@ Handles all database operations related to team members,
 including phone validation and active member queries.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from sqlalchemy import case, func, select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -36,6 +37,61 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
         """
         super().__init__(db, TeamMember)
 
+    def get_by_id(self, item_id: int) -> Optional[TeamMember]:
+        """
+        Retrieve a team member by ID.
+
+        Uses Session.get, so a member already loaded in this session is
+        returned from the identity map without issuing a SELECT.
+
+        Args:
+            item_id: Team member ID
+
+        Returns:
+            TeamMember instance if found, None otherwise
+
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            return self.db.get(self.model, item_id)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error getting TeamMember by id: {str(e)}")
+
+    def _next_rotation_order(self):
+        """
+        SQL expression for the slot after the last active member.
+
+        Evaluated inside the INSERT/UPDATE that uses it, so reading the max
+        and writing the new value happen in one statement.
+        """
+        return (
+            select(func.coalesce(func.max(self.model.rotation_order) + 1, 0))
+            .where(self.model.is_active.is_(True))
+            .scalar_subquery()
+        )
+
+    def create(self, data: Dict[str, Any]) -> TeamMember:
+        """
+        Create a new team member.
+
+        Active members created without an explicit rotation_order are placed
+        at the end of the rotation.
+
+        Args:
+            data: Dictionary of field values to create the member
+
+        Returns:
+            Created TeamMember instance with ID populated
+
+        Raises:
+            Exception: If database operation fails
+        """
+        if data.get("is_active", True) and "rotation_order" not in data:
+            data = {**data, "rotation_order": self._next_rotation_order()}
+        return super().create(data)
+
     def get_active(self) -> List[TeamMember]:
         """
         Get all active team members.
@@ -101,6 +157,32 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
             self.db.rollback()
             raise Exception(f"Database error getting team member by phone: {str(e)}")
 
+    def get_by_ids(self, member_ids: List[int]) -> List[TeamMember]:
+        """
+        Get several team members by ID in a single query.
+
+        Args:
+            member_ids: IDs of the team members to load
+
+        Returns:
+            List of TeamMember instances found (missing IDs are omitted)
+
+        Raises:
+            Exception: If database operation fails
+        """
+        if not member_ids:
+            return []
+
+        try:
+            return (
+                self.db.query(self.model)
+                .filter(self.model.id.in_(member_ids))
+                .all()
+            )
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error getting team members by id: {str(e)}")
+
     def phone_exists(self, phone: str, exclude_id: Optional[int] = None) -> bool:
         """
         Check if phone number already exists in database.
@@ -123,7 +205,7 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
             if exclude_id is not None:
                 query = query.filter(self.model.id != exclude_id)
 
-            return query.count() > 0
+            return self.db.query(query.exists()).scalar()
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error checking phone existence: {str(e)}")
@@ -155,11 +237,87 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
             self.db.rollback()
             raise Exception(f"Database error deactivating team member: {str(e)}")
 
+    def deactivate_and_renumber(self, member_id: int) -> Optional[TeamMember]:
+        """
+        Deactivate a team member and close the gap in the rotation.
+
+        Clears the member's rotation_order and renumbers the remaining active
+        members to consecutive values (0, 1, 2, ...) in their current rotation
+        order. Both UPDATE statements run in one transaction, and the member
+        row comes back from the first one via RETURNING.
+
+        Args:
+            member_id: Team member ID to deactivate
+
+        Returns:
+            Updated TeamMember instance if found, None otherwise
+
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            # UPDATE ... RETURNING hands back the member row, so no follow-up SELECT
+            member = self.db.execute(
+                update(self.model)
+                .where(self.model.id == member_id)
+                .values(is_active=False, rotation_order=None)
+                .returning(self.model)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            ).scalar_one_or_none()
+            if member is None:
+                self.db.rollback()
+                return None
+
+            self.renumber_active_rotation(commit=False)
+            self.db.commit()
+
+            return member
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error deactivating team member: {str(e)}")
+
+    def renumber_active_rotation(self, commit: bool = True) -> None:
+        """
+        Renumber active members to consecutive rotation_order values.
+
+        Keeps the current rotation order (rotation_order, nulls last, then ID)
+        and rewrites it as 0, 1, 2, ... with a single UPDATE driven by a
+        row_number() window.
+
+        Args:
+            commit: If False, leave the UPDATE for the caller to commit
+
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            ranked = (
+                select(
+                    self.model.id.label("id"),
+                    (func.row_number().over(
+                        order_by=(self.model.rotation_order.nullslast(), self.model.id)
+                    ) - 1).label("position")
+                )
+                .where(self.model.is_active.is_(True))
+                .cte("ranked")
+            )
+            self.db.execute(
+                update(self.model)
+                .where(self.model.id == ranked.c.id)
+                .values(rotation_order=ranked.c.position)
+                .execution_options(synchronize_session=False)
+            )
+            if commit:
+                self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error renumbering rotation: {str(e)}")
+
     def activate(self, member_id: int) -> Optional[TeamMember]:
         """
         Activate a team member.
 
-        Sets is_active to True to add them back to rotation.
+        Sets is_active to True and places them at the end of the rotation.
 
         Args:
             member_id: Team member ID to activate
@@ -174,6 +332,7 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
             member = self.get_by_id(member_id)
             if member:
                 member.is_active = True
+                member.rotation_order = self._next_rotation_order()
                 self.db.commit()
                 self.db.refresh(member)
             return member
@@ -195,9 +354,9 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
         """
         try:
             return (
-                self.db.query(self.model)
+                self.db.query(func.count(self.model.id))
                 .filter(self.model.is_active.is_(True))
-                .count()
+                .scalar()
             )
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -261,26 +420,30 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
                           Example: {1: 0, 2: 1, 3: 2}
 
         Returns:
-            List of updated TeamMember instances
+            List of updated TeamMember instances, ordered by new rotation_order
 
         Raises:
             Exception: If database operation fails
         """
-        try:
-            updated_members = []
-            for member_id, new_order in order_mapping.items():
-                member = self.get_by_id(member_id)
-                if member:
-                    member.rotation_order = new_order
-                    updated_members.append(member)
+        if not order_mapping:
+            return []
 
+        try:
+            # One UPDATE ... SET rotation_order = CASE id WHEN ... END for all members
+            self.db.execute(
+                update(self.model)
+                .where(self.model.id.in_(order_mapping))
+                .values(rotation_order=case(order_mapping, value=self.model.id))
+                .execution_options(synchronize_session=False)
+            )
             self.db.commit()
 
-            # Refresh all updated members
-            for member in updated_members:
-                self.db.refresh(member)
-
-            return updated_members
+            return (
+                self.db.query(self.model)
+                .filter(self.model.id.in_(order_mapping))
+                .order_by(self.model.rotation_order)
+                .all()
+            )
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Database error updating rotation orders: {str(e)}")
@@ -12,12 +12,13 @@ Key responsibilities:
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from contextlib import contextmanager
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
 from pytz import timezone
 
@@ -296,7 +297,7 @@ def send_daily_notifications(force: bool = False) -> dict:
         force: If True, resend notifications even if already sent (for testing)
 
     Returns:
-        dict: Result summary with counts (successful, failed, skipped, total)
+        dict: Result summary with counts (successful, failed, pending_retry, skipped, total)
 
     Note: This function runs in a background thread, so it must manage
     its own database session.
@@ -321,22 +322,30 @@ def send_daily_notifications(force: bool = False) -> dict:
                 return {
                     'successful': 0,
                     'failed': 0,
+                    'pending_retry': 0,
                     'skipped': 0,
                     'total': 0
                 }
 
             logger.info("Found %d schedules requiring notification", len(pending_schedules))
 
-            # Initialize SMS service
-            sms_service = SMSService(db)
+            # Initialize SMS service; while the scheduler is running, retries
+            # are queued as one-off jobs instead of sleeping in this thread
+            manager = get_schedule_manager()
+            sms_service = SMSService(
+                db,
+                retry_scheduler=schedule_notification_retry if manager.is_running else None
+            )
 
             # Send notifications using batch method
             result = sms_service.send_batch_notifications(pending_schedules, force=force)
 
             logger.info(
-                "Notification job complete: %d successful, %d failed, %d skipped out of %d total",
+                "Notification job complete: %d successful, %d failed, %d pending retry, "
+                "%d skipped out of %d total",
                 result['successful'],
                 result['failed'],
+                result['pending_retry'],
                 result['skipped'],
                 result['total']
             )
@@ -348,6 +357,79 @@ def send_daily_notifications(force: bool = False) -> dict:
             raise
 
 
+def schedule_notification_retry(
+    schedule_id: int,
+    phone_type: str,
+    attempt: int,
+    delay: float
+) -> None:
+    """
+    Queue a deferred SMS retry as a one-off scheduler job.
+
+    Passed to SMSService as its retry_scheduler so the exponential backoff
+    between attempts is spent in the job store rather than in a sleeping
+    worker thread.
+
+    Args:
+        schedule_id: Schedule the notification is for
+        phone_type: "primary" or "secondary"
+        attempt: 1-based number of the attempt to make
+        delay: Seconds to wait before the attempt
+    """
+    run_date = datetime.now(CHICAGO_TZ) + timedelta(seconds=delay)
+    get_schedule_manager().scheduler.add_job(
+        func=retry_notification,
+        trigger=DateTrigger(run_date=run_date, timezone=CHICAGO_TZ),
+        args=[schedule_id, phone_type, attempt],
+        id=f'notification_retry_{schedule_id}_{phone_type}',
+        name=f'SMS Retry (schedule {schedule_id}, {phone_type})',
+        replace_existing=True
+    )
+    logger.info(
+        "Queued SMS retry %d for %s phone of schedule %d in %ss",
+        attempt,
+        phone_type,
+        schedule_id,
+        delay
+    )
+
+
+def retry_notification(schedule_id: int, phone_type: str, attempt: int) -> dict:
+    """
+    Make one deferred SMS retry attempt for a schedule.
+
+    This function is executed by APScheduler at the time chosen by
+    schedule_notification_retry(). A further retryable failure queues the
+    next attempt.
+
+    Args:
+        schedule_id: Schedule the notification is for
+        phone_type: "primary" or "secondary"
+        attempt: 1-based number of the attempt to make
+
+    Returns:
+        dict: Result for this phone, or an empty dict if the schedule is gone
+
+    Note: This function runs in a background thread, so it must manage
+    its own database session.
+    """
+    logger.info("Starting SMS retry %d for %s phone of schedule %d", attempt, phone_type, schedule_id)
+
+    with get_db_session() as db:
+        try:
+            schedule = ScheduleService(db).schedule_repo.get_by_id(schedule_id)
+            if schedule is None:
+                logger.warning("Schedule %d no longer exists, dropping SMS retry", schedule_id)
+                return {}
+
+            sms_service = SMSService(db, retry_scheduler=schedule_notification_retry)
+            return sms_service.retry_notification(schedule, phone_type, attempt)
+
+        except Exception as e:
+            logger.error("Error in SMS retry job: %s", str(e), exc_info=True)
+            raise
+
+
 def trigger_notifications_manually(force: bool = False) -> dict:
     """
     Manually trigger the notification job for testing.
@@ -359,7 +441,8 @@ def trigger_notifications_manually(force: bool = False) -> dict:
         force: If True, resend notifications even if already sent (for testing)
 
     Returns:
-        dict: Result summary with counts (successful, failed, skipped, total) and status
+        dict: Result summary with counts (successful, failed, pending_retry, skipped,
+            total) and status
     """
     logger.info("Manual notification trigger requested (force=%s)", force)
 
@@ -371,6 +454,7 @@ def trigger_notifications_manually(force: bool = False) -> dict:
             'timestamp': datetime.now(CHICAGO_TZ).isoformat(),
             'successful': result['successful'],
             'failed': result['failed'],
+            'pending_retry': result['pending_retry'],
             'skipped': result['skipped'],
             'total': result['total']
         }
@@ -382,6 +466,7 @@ def trigger_notifications_manually(force: bool = False) -> dict:
             'timestamp': datetime.now(CHICAGO_TZ).isoformat(),
             'successful': 0,
             'failed': 0,
+            'pending_retry': 0,
             'skipped': 0,
             'total': 0
         }
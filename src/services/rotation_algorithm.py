@@ -134,43 +134,45 @@ class RotationAlgorithmService:
         # Normalize start_date to Monday of that week
         monday = self._get_week_start(start_date)
 
+        # Resolve per-shift values once rather than for every week
+        member_ids = [member.id for member in members]
+        shift_plan = [
+            (
+                shift.id,
+                self._get_day_offset(shift),
+                timedelta(hours=shift.duration_hours)
+            )
+            for shift in shifts
+        ]
+        shifts_per_week = len(shift_plan)
+        member_count = len(member_ids)
+
         # Generate schedule entries
         schedule_entries = []
 
         for week in range(weeks):
-            # Assign members to shifts for this week
-            for shift_index, shift in enumerate(shifts):
-                # Circular rotation: continuously cycle through all team members
-                # Calculate total shifts elapsed (week * shifts_per_week + current_shift)
-                # This ensures all members rotate through regardless of team size vs. shifts
-                shifts_elapsed = (week * len(shifts)) + shift_index
-                member_index = shifts_elapsed % len(members)
-                member = members[member_index]
-
-                # Calculate shift start datetime
-                shift_start_datetime = self._calculate_shift_start(
-                    monday, week, shift
-                )
-
-                # Calculate shift end datetime
-                shift_end_datetime = shift_start_datetime + timedelta(
-                    hours=shift.duration_hours
-                )
-
-                # Get ISO week number
-                week_number = shift_start_datetime.isocalendar()[1]
-
-                # Create schedule entry
-                entry = {
-                    "team_member_id": member.id,
-                    "shift_id": shift.id,
-                    "week_number": week_number,
+            # Circular rotation: continuously cycle through all team members.
+            # Total shifts elapsed (week * shifts_per_week + shift_index) picks
+            # the member, so all members rotate through regardless of team size
+            # vs. shifts.
+            week_offset = week * shifts_per_week
+
+            for shift_index, (shift_id, day_offset, duration) in enumerate(shift_plan):
+                member_id = member_ids[(week_offset + shift_index) % member_count]
+
+                # Shifts start at 8:00 AM on their first day
+                shift_start_datetime = (
+                    monday + timedelta(days=(week * 7) + day_offset)
+                ).replace(hour=8, minute=0, second=0, microsecond=0)
+
+                schedule_entries.append({
+                    "team_member_id": member_id,
+                    "shift_id": shift_id,
+                    "week_number": shift_start_datetime.isocalendar()[1],
                     "start_datetime": shift_start_datetime,
-                    "end_datetime": shift_end_datetime,
+                    "end_datetime": shift_start_datetime + duration,
                     "notified": False
-                }
-
-                schedule_entries.append(entry)
+                })
 
         return schedule_entries
 
@@ -240,22 +242,15 @@ class RotationAlgorithmService:
 
         return monday_midnight
 
-    def _calculate_shift_start(
-        self,
-        base_monday: datetime,
-        week: int,
-        shift
-    ) -> datetime:
+    def _get_day_offset(self, shift) -> int:
         """
-        Calculate the start datetime for a shift.
+        Get the weekday offset (Monday = 0) on which a shift starts.
 
         Args:
-            base_monday: The Monday of the first week (at midnight)
-            week: Week offset (0 = first week, 1 = second week, etc.)
-            shift: Shift object with day_of_week and duration_hours
+            shift: Shift object with day_of_week
 
         Returns:
-            Timezone-aware datetime when the shift starts (8:00 AM Chicago time)
+            Number of days after Monday the shift starts
 
         Note:
             Shifts start at 8:00 AM per PRD requirements. Double shifts like
@@ -264,12 +259,4 @@ class RotationAlgorithmService:
         # Handle double shifts like "Tuesday-Wednesday" -> use "Tuesday"
         day_name = shift.day_of_week.split('-')[0]
 
-        # Get the day offset (Monday = 0, Tuesday = 1, etc.)
-        day_offset = self.DAY_OFFSET_MAP[day_name]
-
-        # Calculate the actual datetime: base Monday + week/day offsets
-        # Then set to 8:00 AM using replace()
-        shift_start = base_monday + timedelta(days=(week * 7) + day_offset)
-        shift_start = shift_start.replace(hour=8, minute=0, second=0, microsecond=0)
-
-        return shift_start
+        return self.DAY_OFFSET_MAP[day_name]
@@ -30,6 +30,26 @@ Hi {name}, you are now on-call starting at {start_time} CST until {end_time} CST
 
 Your shift lasts {duration}. Thank you for being available!"""
 
+# Bumped whenever the SMS template is written, so callers caching the
+# template (e.g. SMSService) can tell their copy is stale.
+_sms_template_version = 0
+
+
+def get_sms_template_version() -> int:
+    """
+    Get the in-process SMS template version counter.
+
+    Returns:
+        Number of SMS template writes seen by this process
+    """
+    return _sms_template_version
+
+
+def _bump_sms_template_version() -> None:
+    """Mark any cached SMS template as stale."""
+    global _sms_template_version
+    _sms_template_version += 1
+
 
 class SettingsService:
     """
@@ -105,7 +125,10 @@ class SettingsService:
         # Convert value to string for storage
         str_value = str(value).lower() if isinstance(value, bool) else str(value)
 
-        return self.repository.set_value(key, str_value, value_type, description)
+        setting = self.repository.set_value(key, str_value, value_type, description)
+        if key == SMS_TEMPLATE:
+            _bump_sms_template_version()
+        return setting
 
     def delete_setting(self, key: str) -> bool:
         """
@@ -117,7 +140,10 @@ class SettingsService:
         Returns:
             True if deleted, False if not found
         """
-        return self.repository.delete_by_key(key)
+        deleted = self.repository.delete_by_key(key)
+        if key == SMS_TEMPLATE:
+            _bump_sms_template_version()
+        return deleted
 
     # Auto-renewal specific methods
     def is_auto_renew_enabled(self) -> bool:
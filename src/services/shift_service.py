@@ -46,6 +46,8 @@ class ShiftService:
     Attributes:
         db: SQLAlchemy database session
         repository: ShiftRepository instance for data access
+        _ordered_cache: Shifts from the last ordered get_all() call, or None
+            if not loaded yet. Cleared on create/update/delete.
     """
 
     # Valid shift durations in hours
@@ -57,6 +59,10 @@ class ShiftService:
         "Tuesday-Wednesday"  # Special case for 48h shift
     ]
 
+    # Pre-joined forms of the valid values, used in validation error messages
+    _VALID_DURATIONS_STR = ", ".join(str(d) for d in VALID_DURATIONS)
+    _VALID_DAYS_STR = ", ".join(VALID_DAY_NAMES)
+
     # Weekend shift numbers (Saturday=5, Sunday=6 per PRD)
     WEEKEND_SHIFT_NUMBERS = [5, 6]
 
@@ -69,6 +75,7 @@ class ShiftService:
         """
         self.db = db
         self.repository = ShiftRepository(db)
+        self._ordered_cache: Optional[List[Shift]] = None
 
     def create(self, shift_data: Dict[str, Any]) -> Shift:
         """
@@ -104,6 +111,7 @@ class ShiftService:
 
         try:
             shift = self.repository.create(shift_data)
+            self._ordered_cache = None
             return shift
 
         except IntegrityError as e:
@@ -156,7 +164,9 @@ class ShiftService:
             List of Shift instances
         """
         if ordered:
-            return self.repository.get_all_ordered()
+            if self._ordered_cache is None:
+                self._ordered_cache = self.repository.get_all_ordered()
+            return list(self._ordered_cache)
         return self.repository.get_all()
 
     def get_weekend_shifts(self) -> List[Shift]:
@@ -183,9 +193,13 @@ class ShiftService:
         """
         if duration_hours not in self.VALID_DURATIONS:
             raise InvalidShiftDataError(
-                f"Invalid duration. Must be one of {self.VALID_DURATIONS}"
+                f"Invalid duration. Must be one of [{self._VALID_DURATIONS_STR}]"
             )
 
+        # Shift table is tiny - filter in-process once get_all() has loaded it
+        if self._ordered_cache is not None:
+            return [s for s in self._ordered_cache if s.duration_hours == duration_hours]
+
         return self.repository.get_by_duration(duration_hours)
 
     def get_by_day_of_week(self, day_of_week: str) -> List[Shift]:
@@ -203,9 +217,14 @@ class ShiftService:
         """
         if day_of_week not in self.VALID_DAY_NAMES:
             raise InvalidShiftDataError(
-                f"Invalid day_of_week. Must be one of {self.VALID_DAY_NAMES}"
+                f"Invalid day_of_week. Must be one of [{self._VALID_DAYS_STR}]"
             )
 
+        # Mirror the repository's case-insensitive partial match
+        if self._ordered_cache is not None:
+            needle = day_of_week.lower()
+            return [s for s in self._ordered_cache if needle in s.day_of_week.lower()]
+
         return self.repository.get_by_day_of_week(day_of_week)
 
     def update(
@@ -230,8 +249,8 @@ class ShiftService:
             InvalidShiftDataError: If update data is invalid
             DuplicateShiftNumberError: If new shift number already exists
         """
-        # Check shift exists
-        _ = self.get_by_id(shift_id)
+        # Single lookup; a missing shift is reported before any validation
+        shift = self.get_by_id(shift_id)
 
         # Validate update data
         self._validate_shift_data(update_data, partial=True)
@@ -248,7 +267,8 @@ class ShiftService:
                 )
 
         try:
-            updated_shift = self.repository.update(shift_id, update_data)
+            updated_shift = self.repository.update_instance(shift, update_data)
+            self._ordered_cache = None
             return updated_shift
 
         except IntegrityError as e:
@@ -275,8 +295,10 @@ class ShiftService:
         Raises:
             ShiftNotFoundError: If shift not found
         """
-        shift = self.get_by_id(shift_id)
-        return self.repository.delete(shift_id)
+        if not self.repository.delete(shift_id):
+            raise ShiftNotFoundError(f"Shift not found: {shift_id}")
+        self._ordered_cache = None
+        return True
 
     def shift_number_exists(
         self,
@@ -353,54 +375,72 @@ class ShiftService:
                     f"Missing required fields: {', '.join(missing_fields)}"
                 )
 
-        # Validate shift_number
-        if "shift_number" in shift_data:
-            shift_number = shift_data["shift_number"]
-            if not isinstance(shift_number, int) or shift_number < 1:
-                raise InvalidShiftDataError(
-                    "shift_number must be a positive integer"
-                )
-
-        # Validate day_of_week
-        if "day_of_week" in shift_data:
-            day_of_week = shift_data["day_of_week"]
-            if not isinstance(day_of_week, str):
-                raise InvalidShiftDataError(
-                    f"day_of_week must be a string day name, got: {type(day_of_week)}"
-                )
-            if day_of_week not in self.VALID_DAY_NAMES:
-                raise InvalidShiftDataError(
-                    f"day_of_week must be one of {self.VALID_DAY_NAMES}, got: {day_of_week}"
-                )
-
-        # Validate duration_hours
-        if "duration_hours" in shift_data:
-            duration = shift_data["duration_hours"]
-            if duration not in self.VALID_DURATIONS:
-                raise InvalidShiftDataError(
-                    f"duration_hours must be one of {self.VALID_DURATIONS}, got: {duration}"
-                )
-
-        # Validate start_time format if provided
-        if "start_time" in shift_data and shift_data["start_time"] is not None:
-            start_time = shift_data["start_time"]
-            if not isinstance(start_time, str):
-                raise InvalidShiftDataError(
-                    "start_time must be a string in HH:MM:SS format"
-                )
-            # Basic format validation
-            parts = start_time.split(":")
-            if len(parts) != 3:
-                raise InvalidShiftDataError(
-                    "start_time must be in HH:MM:SS format"
-                )
-            try:
-                hours, minutes, seconds = map(int, parts)
-                if not (0 <= hours <= 23 and 0 <= minutes <= 59 and 0 <= seconds <= 59):
-                    raise InvalidShiftDataError(
-                        "start_time has invalid hour, minute, or second values"
-                    )
-            except ValueError:
-                raise InvalidShiftDataError(
-                    "start_time must contain valid integers in HH:MM:SS format"
-                )
+        # Validate each supplied field via the dispatch table
+        for field, value in shift_data.items():
+            validator = _FIELD_VALIDATORS.get(field)
+            if validator is not None:
+                validator(value)
+
+
+def _validate_shift_number(shift_number: Any) -> None:
+    """Validate shift_number is a positive integer."""
+    # type() check rather than isinstance() so bools are rejected
+    if type(shift_number) is not int or shift_number < 1:
+        raise InvalidShiftDataError(
+            "shift_number must be a positive integer"
+        )
+
+
+def _validate_day_of_week(day_of_week: Any) -> None:
+    """Validate day_of_week is one of the supported day names."""
+    if not isinstance(day_of_week, str):
+        raise InvalidShiftDataError(
+            f"day_of_week must be a string day name, got: {type(day_of_week)}"
+        )
+    if day_of_week not in ShiftService.VALID_DAY_NAMES:
+        raise InvalidShiftDataError(
+            f"day_of_week must be one of [{ShiftService._VALID_DAYS_STR}], got: {day_of_week}"
+        )
+
+
+def _validate_duration_hours(duration: Any) -> None:
+    """Validate duration_hours is one of the supported durations."""
+    if type(duration) is not int or duration not in ShiftService.VALID_DURATIONS:
+        raise InvalidShiftDataError(
+            f"duration_hours must be one of [{ShiftService._VALID_DURATIONS_STR}], got: {duration}"
+        )
+
+
+def _validate_start_time(start_time: Any) -> None:
+    """Validate optional start_time is in HH:MM:SS format."""
+    if start_time is None:
+        return
+    if not isinstance(start_time, str):
+        raise InvalidShiftDataError(
+            "start_time must be a string in HH:MM:SS format"
+        )
+    # Basic format validation
+    parts = start_time.split(":")
+    if len(parts) != 3:
+        raise InvalidShiftDataError(
+            "start_time must be in HH:MM:SS format"
+        )
+    try:
+        hours, minutes, seconds = map(int, parts)
+        if not (0 <= hours <= 23 and 0 <= minutes <= 59 and 0 <= seconds <= 59):
+            raise InvalidShiftDataError(
+                "start_time has invalid hour, minute, or second values"
+            )
+    except ValueError:
+        raise InvalidShiftDataError(
+            "start_time must contain valid integers in HH:MM:SS format"
+        )
+
+
+# Field name -> validator, used by ShiftService._validate_shift_data
+_FIELD_VALIDATORS = {
+    "shift_number": _validate_shift_number,
+    "day_of_week": _validate_day_of_week,
+    "duration_hours": _validate_duration_hours,
+    "start_time": _validate_start_time,
+}
@@ -5,22 +5,68 @@ Handles SMS delivery with retry logic, error handling, and notification logging.
 """
 
 import os
+import json
+import itertools
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime
-from time import sleep
-
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Callable
+from datetime import datetime, timedelta
+from time import sleep, monotonic
+
+from pytz import timezone
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
 from ..repositories import NotificationLogRepository, ScheduleRepository, ScheduleOverrideRepository
 from ..models import Schedule
-from .settings_service import SettingsService
+from .settings_service import SettingsService, get_sms_template_version
 
 
 logger = logging.getLogger(__name__)
 
+# America/Chicago timezone for schedule summaries
+CHICAGO_TZ = timezone('America/Chicago')
+
+# Twilio clients shared across SMSService instances, keyed by (account_sid, auth_token).
+# Client's default TwilioHttpClient keeps a pooled requests.Session, so reusing the
+# client keeps HTTPS connections alive between sends instead of re-handshaking.
+_TWILIO_CLIENT_CACHE: Dict[Tuple[str, str], Client] = {}
+_TWILIO_CLIENT_LOCK = threading.Lock()
+
+# Seconds a loaded SMS template is reused before re-reading settings
+SMS_TEMPLATE_CACHE_TTL = 30.0
+
+# Mock-mode message SIDs: a per-process random prefix plus a counter, so no
+# syscall is made per send and SIDs stay distinct across restarts
+_MOCK_SID_PREFIX = os.urandom(8).hex()
+_mock_sid_counter = itertools.count()
+
+# Upper bound on concurrent Twilio deliveries in send_batch_notifications
+BATCH_SEND_MAX_WORKERS = 10
+
+# Upper bound on concurrent Twilio status fetches in get_delivery_statuses
+DELIVERY_STATUS_MAX_WORKERS = 10
+
+# Escalation contact config key prefixes and their labels, in send order
+ESCALATION_CONTACT_SPECS = (
+    ("primary", "Primary Escalation Contact"),
+    ("secondary", "Secondary Escalation Contact"),
+)
+
+# Worker threads for escalation contact sends, shared across calls so each
+# summary reuses warm threads (and the pooled Twilio client) instead of
+# starting new ones. Threads are created on first use.
+_ESCALATION_SEND_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sms-escalation")
+
+# Twilio error classification used by SMSService._is_retryable_error
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503})
+_RETRYABLE_CODES = frozenset({20003, 21610, 30001, 30002, 30003, 30004, 30005, 30006})
+_NON_RETRYABLE_CODES = frozenset({21211, 21408, 21614, 21217, 21601})
+
 
 class SMSServiceError(Exception):
     """Base exception for SMS service errors."""
@@ -34,6 +80,51 @@ class SMSDeliveryError(SMSServiceError):
     """Raised when SMS delivery fails after all retry attempts."""
 
 
+@dataclass(frozen=True)
+class _SendCtx:
+    """
+    Everything needed to deliver one notification, read from the ORM once.
+
+    Built by SMSService._prepare_notification on the session's thread so the
+    delivery and logging steps never go back to the Schedule/TeamMember rows.
+    """
+
+    schedule_id: int
+    recipient_name: str
+    message_body: str
+    primary: str
+    secondary: Optional[str] = None
+
+    @property
+    def targets(self) -> List[Tuple[str, str]]:
+        """(phone, phone_type) pairs to deliver to, primary first."""
+        if self.secondary:
+            return [(self.primary, "primary"), (self.secondary, "secondary")]
+        return [(self.primary, "primary")]
+
+
+def _get_twilio_client(account_sid: str, auth_token: str) -> Client:
+    """
+    Get the shared Twilio client for a set of credentials, creating it on first use.
+
+    Args:
+        account_sid: Twilio account SID
+        auth_token: Twilio auth token
+
+    Returns:
+        Cached Twilio REST client
+    """
+    key = (account_sid, auth_token)
+    client = _TWILIO_CLIENT_CACHE.get(key)
+    if client is None:
+        with _TWILIO_CLIENT_LOCK:
+            client = _TWILIO_CLIENT_CACHE.get(key)
+            if client is None:
+                client = Client(account_sid, auth_token)
+                _TWILIO_CLIENT_CACHE[key] = client
+    return client
+
+
 class SMSService:
     """
     Service for sending SMS notifications via Twilio.
@@ -49,11 +140,20 @@ class SMSService:
         db: Database session
         twilio_client: Twilio REST client
         from_phone: Twilio phone number for sending messages
+        notify_service_sid: Optional Twilio Notify service (TWILIO_NOTIFY_SERVICE_SID)
+            used by send_batch_notifications to send identical messages in one request;
+            such sends carry no per-message twilio_sid
         max_retries: Maximum number of retry attempts
         base_delay: Base delay in seconds for exponential backoff
         notification_repo: Repository for logging notifications
         schedule_repo: Repository for schedule operations
         settings_service: Service for accessing application settings
+        _template_cache: (loaded_at, version, template) for the last SMS template
+            read, reused for SMS_TEMPLATE_CACHE_TTL seconds or until it changes
+        _log_buffer: Pending notification log rows while a batch is running,
+            None when log writes go straight to the database
+        retry_scheduler: Optional callable(schedule_id, phone_type, attempt, delay)
+            that queues a deferred retry instead of sleeping through the backoff
     """
 
     def __init__(
@@ -61,7 +161,8 @@ class SMSService:
         db: Session,
         max_retries: int = 3,
         base_delay: int = 60,
-        mock_mode: bool = False
+        mock_mode: bool = False,
+        retry_scheduler: Optional[Callable[[int, str, int, float], None]] = None
     ):
         """
         Initialize SMS service.
@@ -71,6 +172,9 @@ class SMSService:
             max_retries: Maximum retry attempts (default: 3)
             base_delay: Base delay in seconds for exponential backoff (default: 60)
             mock_mode: If True, skip Twilio client initialization for testing
+            retry_scheduler: If given, retryable failures are handed to this
+                callable as (schedule_id, phone_type, attempt, delay) rather than
+                retried in-process after a sleep
 
         Raises:
             TwilioConfigurationError: If Twilio credentials are missing
@@ -79,17 +183,21 @@ class SMSService:
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.mock_mode = mock_mode
+        self.retry_scheduler = retry_scheduler
 
         # Initialize repositories and services
         self.notification_repo = NotificationLogRepository(db)
         self.schedule_repo = ScheduleRepository(db)
         self.settings_service = SettingsService(db)
+        self._template_cache: Optional[Tuple[float, int, str]] = None
+        self._log_buffer: Optional[List[Dict[str, Any]]] = None
 
         # Initialize Twilio client
         if not mock_mode:
             account_sid = os.getenv('TWILIO_ACCOUNT_SID')
             auth_token = os.getenv('TWILIO_AUTH_TOKEN')
             self.from_phone = os.getenv('TWILIO_PHONE_NUMBER')
+            self.notify_service_sid = os.getenv('TWILIO_NOTIFY_SERVICE_SID')
 
             if not all([account_sid, auth_token, self.from_phone]):
                 raise TwilioConfigurationError(
@@ -98,13 +206,18 @@ class SMSService:
                 )
 
             try:
-                self.twilio_client = Client(account_sid, auth_token)
+                self.twilio_client = _get_twilio_client(account_sid, auth_token)
                 logger.info("Twilio client initialized successfully")
             except Exception as e:
                 raise TwilioConfigurationError(f"Failed to initialize Twilio client: {str(e)}")
         else:
             self.twilio_client = None
             self.from_phone = "+15551234567"  # Mock phone number
+            self.notify_service_sid = None
+            # Bind the in-memory transport once so the send path never
+            # re-checks mock_mode per message
+            self._send_sms = self._send_sms_mock
+            self.get_delivery_status = self._get_delivery_status_mock
             logger.info("SMS service initialized in mock mode")
 
     def send_notification(
@@ -121,6 +234,9 @@ class SMSService:
         - Attempt 3: After 120 seconds (base_delay * 2)
         - etc.
 
+        With a retry_scheduler configured, only attempt 1 runs here and later
+        attempts are queued through it (see retry_notification).
+
         Args:
             schedule: Schedule instance to send notification for
             force: If True, send even if already notified (default: False)
@@ -140,91 +256,181 @@ class SMSService:
         Raises:
             SMSServiceError: If schedule data is invalid
         """
+        early_result, ctx = self._prepare_notification(schedule, force)
+        if early_result is not None:
+            return early_result
+
+        targets = ctx.targets
+        if len(targets) == 1:
+            phone, phone_type = targets[0]
+            deliveries = {
+                phone_type: self._deliver_with_retries(
+                    phone, ctx.message_body, ctx.schedule_id, phone_type
+                )
+            }
+        else:
+            # Deliver to both phones concurrently - the Twilio calls (and any
+            # retry backoff) overlap, while DB work stays on this thread
+            # because the session is not thread-safe.
+            with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+                futures = {
+                    phone_type: executor.submit(
+                        self._deliver_with_retries,
+                        phone, ctx.message_body, ctx.schedule_id, phone_type
+                    )
+                    for phone, phone_type in targets
+                }
+                deliveries = {
+                    phone_type: future.result() for phone_type, future in futures.items()
+                }
+
+        return self._finish_notification(schedule, ctx, deliveries)
+
+    def _prepare_notification(
+        self,
+        schedule: Schedule,
+        force: bool,
+        retry_count: Optional[int] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[_SendCtx]]:
+        """
+        Run the database-side checks for a notification and compose its message.
+
+        Args:
+            schedule: Schedule instance to send notification for
+            force: If True, send even if already notified
+            retry_count: Prefetched attempt count for the schedule; queried
+                when None
+
+        Returns:
+            Tuple of (early_result, ctx). early_result is a final result dict
+            when nothing should be sent (already notified, retries exhausted);
+            otherwise ctx is the _SendCtx to deliver.
+
+        Raises:
+            SMSServiceError: If schedule data is invalid
+        """
+        schedule_id = schedule.id
+        team_member = schedule.team_member
+
         # Validate schedule
-        if not schedule.team_member:
-            raise SMSServiceError(f"Schedule {schedule.id} has no team member assigned")
+        if not team_member:
+            raise SMSServiceError(f"Schedule {schedule_id} has no team member assigned")
 
         if not schedule.shift:
-            raise SMSServiceError(f"Schedule {schedule.id} has no shift assigned")
+            raise SMSServiceError(f"Schedule {schedule_id} has no shift assigned")
 
         # Check for active override
         override_repo = ScheduleOverrideRepository(self.db)
-        override = override_repo.get_override_for_schedule(schedule.id)
+        override = override_repo.get_override_for_schedule(schedule_id)
 
         # Determine recipient (override member or original member)
         if override and override.is_active:
             recipient_member = override.override_member
             recipient_name = override.override_member_name
-            logger.info(f"Override active for schedule {schedule.id}: sending to {recipient_name}")
+            logger.info("Override active for schedule %d: sending to %s", schedule_id, recipient_name)
         else:
-            recipient_member = schedule.team_member
-            recipient_name = schedule.team_member.name
+            recipient_member = team_member
+            recipient_name = team_member.name
 
         # Check if already notified
         if schedule.notified and not force:
-            logger.info(f"Schedule {schedule.id} already notified, skipping")
-            return {
-                "success": True,
-                "schedule_id": schedule.id,
-                "twilio_sid": None,
-                "status": "skipped",
-                "message": "Already notified",
-                "attempts": 0,
-                "error": None
-            }
+            logger.info("Schedule %d already notified, skipping", schedule_id)
+            return self._skipped_result(schedule_id), None
 
         # Check retry count
-        retry_count = self.notification_repo.get_retry_count_for_schedule(schedule.id)
+        if retry_count is None:
+            retry_count = self.notification_repo.get_retry_count_for_schedule(schedule_id)
         if retry_count >= self.max_retries:
             logger.warning(
-                f"Schedule {schedule.id} exceeded max retries ({self.max_retries}), "
-                "marking as failed"
+                "Schedule %d exceeded max retries (%d), marking as failed",
+                schedule_id,
+                self.max_retries
             )
-            self.notification_repo.log_notification_attempt(
-                schedule_id=schedule.id,
-                status='failed',
-                error_message=f"Exceeded maximum retry attempts ({self.max_retries})",
-                recipient_name=recipient_name,
-                recipient_phone=recipient_member.phone
+            self._log_attempts(
+                schedule_id,
+                [{
+                    "status": "failed",
+                    "twilio_sid": None,
+                    "error_message": f"Exceeded maximum retry attempts ({self.max_retries})"
+                }],
+                recipient_name,
+                recipient_member.phone
             )
             return {
                 "success": False,
-                "schedule_id": schedule.id,
+                "schedule_id": schedule_id,
                 "twilio_sid": None,
                 "status": "failed",
                 "message": "Exceeded maximum retry attempts",
                 "attempts": retry_count,
                 "error": "Max retries exceeded"
-            }
+            }, None
+
+        # Primary phone (override member or original member), then secondary if configured
+        return None, _SendCtx(
+            schedule_id=schedule_id,
+            recipient_name=recipient_name,
+            message_body=self._compose_message(schedule, member_name=recipient_name),
+            primary=recipient_member.phone,
+            secondary=recipient_member.secondary_phone
+        )
+
+    @staticmethod
+    def _skipped_result(schedule_id: int) -> Dict[str, Any]:
+        """Result dict for a schedule skipped because it was already notified."""
+        return {
+            "success": True,
+            "schedule_id": schedule_id,
+            "twilio_sid": None,
+            "status": "skipped",
+            "message": "Already notified",
+            "attempts": 0,
+            "error": None
+        }
 
-        # Compose message
-        message_body = self._compose_message(schedule)
+    def _finish_notification(
+        self,
+        schedule: Schedule,
+        ctx: _SendCtx,
+        deliveries: Dict[str, Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        defer_commit: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Log delivery attempts, mark the schedule notified and build the result.
 
-        # Send to primary phone (override member or original member)
-        primary_result = self._send_to_single_phone(
-            phone=recipient_member.phone,
-            message_body=message_body,
-            schedule=schedule,
-            phone_type="primary",
-            recipient_name=recipient_name
-        )
+        Phones left in pending_retry are handed to retry_scheduler. If no
+        phone succeeded and a retry is queued, the result status is
+        "pending_retry" rather than "failed".
 
-        # Send to secondary phone if configured
-        secondary_result = None
-        if recipient_member.secondary_phone:
-            secondary_result = self._send_to_single_phone(
-                phone=recipient_member.secondary_phone,
-                message_body=message_body,
-                schedule=schedule,
-                phone_type="secondary",
-                recipient_name=recipient_name
-            )
+        Args:
+            schedule: Schedule instance the notification was sent for
+            ctx: Send context returned by _prepare_notification
+            deliveries: phone_type -> (result, attempts) from _deliver_with_retries
+            defer_commit: If True, leave marking the schedule notified to the
+                caller (send_batch_notifications does it in one UPDATE)
+
+        Returns:
+            Result dictionary as documented on send_notification
+        """
+        retry_pending = False
+        for phone, phone_type in ctx.targets:
+            result, attempts = deliveries[phone_type]
+            self._log_attempts(ctx.schedule_id, attempts, ctx.recipient_name, phone)
+            if result["status"] == "pending_retry":
+                retry_pending = True
+                self.retry_scheduler(
+                    ctx.schedule_id, phone_type, result["attempt"], result["next_attempt_in"]
+                )
+
+        primary_result = deliveries["primary"][0]
+        secondary_result = deliveries["secondary"][0] if "secondary" in deliveries else None
 
         # Mark as notified if EITHER phone succeeded (redundancy pattern)
         if primary_result['success'] or (secondary_result and secondary_result['success']):
-            schedule.notified = True
-            schedule.notified_at = datetime.now()
-            self.db.commit()
+            if not defer_commit:
+                schedule.notified = True
+                schedule.notified_at = datetime.now()
+                self.db.commit()
 
             # Determine which phone(s) succeeded
             if primary_result['success'] and secondary_result and secondary_result['success']:
@@ -236,7 +442,7 @@ class SMSService:
 
             return {
                 "success": True,
-                "schedule_id": schedule.id,
+                "schedule_id": ctx.schedule_id,
                 "twilio_sid": primary_result.get('twilio_sid') or (secondary_result.get('twilio_sid') if secondary_result else None),
                 "status": "sent",
                 "message": message,
@@ -246,120 +452,171 @@ class SMSService:
                 "secondary": secondary_result
             }
 
-        # Both phones failed
+        # Both phones failed (for now, if a retry is queued)
         return {
             "success": False,
-            "schedule_id": schedule.id,
+            "schedule_id": ctx.schedule_id,
             "twilio_sid": None,
-            "status": "failed",
-            "message": "Failed to send SMS to any phone",
+            "status": "pending_retry" if retry_pending else "failed",
+            "message": (
+                "SMS not yet delivered, retry scheduled" if retry_pending
+                else "Failed to send SMS to any phone"
+            ),
             "attempts": primary_result.get('attempts', 0),
             "error": primary_result.get('error'),
             "primary": primary_result,
             "secondary": secondary_result
         }
 
-    def _send_to_single_phone(
+    def retry_notification(
         self,
-        phone: str,
-        message_body: str,
         schedule: Schedule,
         phone_type: str,
-        recipient_name: str
+        attempt: int
     ) -> Dict[str, Any]:
         """
-        Send SMS to a single phone number with retry logic.
+        Make one deferred retry attempt for a single phone of a schedule.
+
+        Called by the job queued through retry_scheduler. The recipient and
+        message are resolved again so an override added in the meantime is
+        honoured. A further retryable failure queues the next attempt.
+
+        Args:
+            schedule: Schedule instance the notification is for
+            phone_type: "primary" or "secondary"
+            attempt: 1-based number of this attempt
+
+        Returns:
+            Result dict for this phone, as returned by _send_once
+
+        Raises:
+            SMSServiceError: If schedule data is invalid or the recipient has
+                no phone of the requested type
+        """
+        _, ctx = self._prepare_notification(schedule, force=True, retry_count=0)
+        phones = {target_type: phone for phone, target_type in ctx.targets}
+        phone = phones.get(phone_type)
+        if phone is None:
+            raise SMSServiceError(
+                f"Schedule {schedule.id} recipient has no {phone_type} phone"
+            )
+
+        result, record = self._send_once(
+            phone, ctx.message_body, ctx.schedule_id, phone_type, attempt
+        )
+        self._log_attempts(ctx.schedule_id, [record], ctx.recipient_name, phone)
+
+        if result["success"]:
+            if not schedule.notified:
+                schedule.notified = True
+                schedule.notified_at = datetime.now()
+                self.db.commit()
+        elif result["status"] == "pending_retry" and self.retry_scheduler is not None:
+            self.retry_scheduler(
+                schedule.id, phone_type, result["attempt"], result["next_attempt_in"]
+            )
+
+        return result
+
+    def _send_once(
+        self,
+        phone: str,
+        message_body: str,
+        schedule_id: int,
+        phone_type: str,
+        attempt: int
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Make a single delivery attempt to one phone, without touching the database.
+
+        Safe to run on a worker thread. A retryable failure with attempts left
+        does not wait; it returns status "pending_retry" with the backoff delay
+        so the caller decides whether to sleep or schedule the next attempt.
 
         Args:
             phone: Recipient phone number (E.164 format)
             message_body: SMS message text
-            schedule: Schedule instance for logging
+            schedule_id: Schedule ID for logging
             phone_type: "primary" or "secondary" for logging purposes
-            recipient_name: Name of actual recipient (override member or scheduled member)
+            attempt: 1-based number of this attempt
 
         Returns:
-            Dictionary with result information for this phone
+            Tuple of (result dict for this phone, attempt record with status,
+            twilio_sid and error_message keys). A pending_retry result also
+            carries "next_attempt_in" (seconds) and "attempt" (the next
+            attempt number).
         """
-        last_error = None
-        for attempt in range(self.max_retries):
-            try:
-                # Apply exponential backoff (except first attempt)
-                if attempt > 0:
-                    delay = self.base_delay * (2 ** (attempt - 1))
-                    logger.info(
-                        f"Retry attempt {attempt + 1}/{self.max_retries} "
-                        f"for {phone_type} phone of schedule {schedule.id} after {delay}s delay"
-                    )
-                    sleep(delay)
-
-                # Send SMS
-                result = self._send_sms(phone, message_body)
-
-                # Log successful send with recipient snapshot
-                _ = self.notification_repo.log_notification_attempt(
-                    schedule_id=schedule.id,
-                    status='sent',
-                    twilio_sid=result['sid'],
-                    error_message=None,
-                    recipient_name=recipient_name,
-                    recipient_phone=phone
-                )
+        retryable = True
+        try:
+            result = self._send_sms(phone, message_body)
 
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    f"SMS sent successfully to {phone_type} phone {self._sanitize_phone(phone)} "
-                    f"for schedule {schedule.id} (SID: {result['sid']})"
+                    "SMS sent successfully to %s phone %s for schedule %d (SID: %s)",
+                    phone_type,
+                    self._sanitize_phone(phone),
+                    schedule_id,
+                    result['sid']
                 )
 
-                return {
-                    "success": True,
-                    "twilio_sid": result['sid'],
-                    "status": "sent",
-                    "phone_type": phone_type,
-                    "attempts": attempt + 1,
-                    "error": None
-                }
+            return {
+                "success": True,
+                "twilio_sid": result['sid'],
+                "status": "sent",
+                "phone_type": phone_type,
+                "attempts": attempt,
+                "error": None
+            }, {
+                "status": "sent",
+                "twilio_sid": result['sid'],
+                "error_message": None
+            }
 
-            except TwilioRestException as e:
-                last_error = str(e)
-                error_msg = f"Twilio error on {phone_type} phone (attempt {attempt + 1}/{self.max_retries}): {str(e)}"
-                logger.error(error_msg)
+        except TwilioRestException as e:
+            last_error = str(e)
+            error_msg = f"Twilio error on {phone_type} phone (attempt {attempt}/{self.max_retries}): {str(e)}"
+            logger.error(error_msg)
 
-                # Log failed attempt
-                self.notification_repo.log_notification_attempt(
-                    schedule_id=schedule.id,
-                    status='failed',
-                    twilio_sid=None,
-                    error_message=error_msg,
-                    recipient_name=recipient_name,
-                    recipient_phone=phone
+            # Check if error is retryable
+            if not self._is_retryable_error(e):
+                logger.error(
+                    "Non-retryable Twilio error for %s phone of schedule %d: %s",
+                    phone_type,
+                    schedule_id,
+                    e
                 )
+                retryable = False
 
-                # Check if error is retryable
-                if not self._is_retryable_error(e):
-                    logger.error(
-                        f"Non-retryable Twilio error for {phone_type} phone of schedule {schedule.id}: {str(e)}"
-                    )
-                    break
+        except Exception as e:
+            last_error = str(e)
+            error_msg = f"Unexpected error on {phone_type} phone (attempt {attempt}/{self.max_retries}): {str(e)}"
+            logger.error(error_msg)
 
-            except Exception as e:
-                last_error = str(e)
-                error_msg = f"Unexpected error on {phone_type} phone (attempt {attempt + 1}/{self.max_retries}): {str(e)}"
-                logger.error(error_msg)
+        record = {
+            "status": "failed",
+            "twilio_sid": None,
+            "error_message": error_msg
+        }
 
-                # Log failed attempt
-                self.notification_repo.log_notification_attempt(
-                    schedule_id=schedule.id,
-                    status='failed',
-                    twilio_sid=None,
-                    error_message=error_msg,
-                    recipient_name=recipient_name,
-                    recipient_phone=phone
-                )
+        if retryable and attempt < self.max_retries:
+            return {
+                "success": False,
+                "twilio_sid": None,
+                "status": "pending_retry",
+                "phone_type": phone_type,
+                "attempts": attempt,
+                "attempt": attempt + 1,
+                "next_attempt_in": self.base_delay * (2 ** (attempt - 1)),
+                "error": last_error
+            }, record
 
         # All attempts failed for this phone
         logger.error(
-            f"Failed to send SMS to {phone_type} phone for schedule {schedule.id} after "
-            f"{self.max_retries} attempts. Last error: {last_error}"
+            "Failed to send SMS to %s phone for schedule %d after %d attempts. Last error: %s",
+            phone_type,
+            schedule_id,
+            self.max_retries,
+            last_error
         )
 
         return {
@@ -369,8 +626,188 @@ class SMSService:
             "phone_type": phone_type,
             "attempts": self.max_retries,
             "error": last_error
+        }, record
+
+    def _deliver_with_retries(
+        self,
+        phone: str,
+        message_body: str,
+        schedule_id: int,
+        phone_type: str
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Deliver SMS to a single phone with retry logic, without touching the database.
+
+        Safe to run on a worker thread. Each attempt is recorded and returned so
+        the caller can write the notification log on the session's own thread.
+
+        When a retry_scheduler is configured only the first attempt is made
+        here; a pending_retry result is handed to the scheduler by
+        _finish_notification instead of sleeping through the backoff.
+
+        Args:
+            phone: Recipient phone number (E.164 format)
+            message_body: SMS message text
+            schedule_id: Schedule ID for logging
+            phone_type: "primary" or "secondary" for logging purposes
+
+        Returns:
+            Tuple of (result dict for this phone, list of attempt records with
+            status, twilio_sid and error_message keys)
+        """
+        attempts = []
+        attempt = 1
+        while True:
+            result, record = self._send_once(
+                phone, message_body, schedule_id, phone_type, attempt
+            )
+            attempts.append(record)
+            if result["status"] != "pending_retry" or self.retry_scheduler is not None:
+                return result, attempts
+
+            delay = result["next_attempt_in"]
+            attempt = result["attempt"]
+            logger.info(
+                "Retry attempt %d/%d for %s phone of schedule %d after %ss delay",
+                attempt,
+                self.max_retries,
+                phone_type,
+                schedule_id,
+                delay
+            )
+            sleep(delay)
+
+    def _deliver_group(
+        self,
+        recipients: List[Tuple[str, int, str]],
+        message_body: str
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Deliver one message body to several phones, without touching the database.
+
+        Several recipients are sent in a single Twilio Notify request; if that
+        request fails, or there is only one recipient, each phone goes through
+        _deliver_with_retries instead.
+
+        A Notify request returns a notification SID (NT...), not per-phone
+        message SIDs, so Notify deliveries are reported with twilio_sid None:
+        per-message delivery status is not available for them.
+
+        Args:
+            recipients: (phone, schedule_id, phone_type) for each phone
+            message_body: SMS message text shared by all recipients
+
+        Returns:
+            (result, attempts) per recipient, in the order given
+        """
+        if len(recipients) > 1:
+            try:
+                sid = self._send_notify([phone for phone, _, _ in recipients], message_body)
+            except Exception as e:
+                logger.warning(
+                    "Twilio Notify send to %d phones failed, falling back to per-phone delivery: %s",
+                    len(recipients),
+                    e
+                )
+            else:
+                # The notification SID can't be looked up via messages(sid),
+                # so it is only logged here and not stored as a message SID
+                logger.info("SMS sent to %d phones via Twilio Notify (SID: %s)", len(recipients), sid)
+                return [
+                    ({
+                        "success": True,
+                        "twilio_sid": None,
+                        "status": "sent",
+                        "phone_type": phone_type,
+                        "attempts": 1,
+                        "error": None
+                    }, [{
+                        "status": "sent",
+                        "twilio_sid": None,
+                        "error_message": None
+                    }])
+                    for _, _, phone_type in recipients
+                ]
+
+        return [
+            self._deliver_with_retries(phone, message_body, schedule_id, phone_type)
+            for phone, schedule_id, phone_type in recipients
+        ]
+
+    def _send_notify(self, to_phones: List[str], message_body: str) -> str:
+        """
+        Send one SMS body to several phones with a single Twilio Notify request.
+
+        Args:
+            to_phones: Recipient phone numbers (E.164 format)
+            message_body: SMS message text
+
+        Returns:
+            Twilio Notify notification SID
+
+        Raises:
+            TwilioRestException: If Twilio API call fails
+        """
+        notification = self.twilio_client.notify.v1.services(
+            self.notify_service_sid
+        ).notifications.create(
+            body=message_body,
+            to_binding=[
+                json.dumps({"binding_type": "sms", "address": phone})
+                for phone in to_phones
+            ]
+        )
+        return notification.sid
+
+    def _log_attempts(
+        self,
+        schedule_id: int,
+        attempts: List[Dict[str, Any]],
+        recipient_name: str,
+        recipient_phone: str
+    ) -> None:
+        """
+        Write one notification log entry summarizing the attempts to a phone.
+
+        The entry takes the final attempt's status, SID and error, and records
+        how many attempts it covers, so a send that needed retries is a single
+        row rather than one row per attempt.
+
+        While a batch is running the entry is buffered and written by
+        flush_logs(); otherwise it is committed immediately.
+
+        Args:
+            schedule_id: Schedule ID the attempts belong to
+            attempts: Attempt records from _deliver_with_retries, oldest first
+            recipient_name: Name of actual recipient (snapshot)
+            recipient_phone: Phone the attempts were sent to (snapshot)
+        """
+        final = attempts[-1]
+        entry = {
+            "schedule_id": schedule_id,
+            "status": final["status"],
+            "twilio_sid": final["twilio_sid"],
+            "error_message": final["error_message"],
+            "recipient_name": recipient_name,
+            "recipient_phone": recipient_phone,
+            "attempts": len(attempts)
         }
 
+        if self._log_buffer is not None:
+            entry["sent_at"] = datetime.now()
+            self._log_buffer.append(entry)
+            return
+
+        self.notification_repo.log_notification_attempt(**entry)
+
+    def flush_logs(self) -> None:
+        """
+        Write any buffered notification log entries in a single commit.
+        """
+        if self._log_buffer:
+            entries, self._log_buffer = self._log_buffer, []
+            self.notification_repo.bulk_log_notification_attempts(entries)
+
     def _send_sms(self, to_phone: str, message_body: str) -> Dict[str, str]:
         """
         Send SMS via Twilio.
@@ -385,14 +822,6 @@ class SMSService:
         Raises:
             TwilioRestException: If Twilio API call fails
         """
-        if self.mock_mode:
-            # Mock mode for testing
-            logger.info(f"[MOCK] Sending SMS to {to_phone}: {message_body}")
-            return {
-                "sid": f"SM{os.urandom(16).hex()}",
-                "status": "sent"
-            }
-
         message = self.twilio_client.messages.create(
             body=message_body,
             from_=self.from_phone,
@@ -404,7 +833,24 @@ class SMSService:
             "status": message.status
         }
 
-    def _compose_message(self, schedule: Schedule) -> str:
+    def _send_sms_mock(self, to_phone: str, message_body: str) -> Dict[str, str]:
+        """
+        Mock-mode replacement for _send_sms; nothing leaves the process.
+
+        Args:
+            to_phone: Recipient phone number (E.164 format)
+            message_body: SMS message text
+
+        Returns:
+            Dictionary with a generated SID and "sent" status
+        """
+        logger.info("[MOCK] Sending SMS to %s: %s", to_phone, message_body)
+        return {
+            "sid": f"SM{_MOCK_SID_PREFIX}{next(_mock_sid_counter):016x}",
+            "status": "sent"
+        }
+
+    def _compose_message(self, schedule: Schedule, member_name: Optional[str] = None) -> str:
         """
         Compose SMS message for a schedule assignment using template from database.
 
@@ -416,6 +862,8 @@ class SMSService:
 
         Args:
             schedule: Schedule instance
+            member_name: Recipient name if the caller already resolved overrides;
+                looked up from the schedule's active override otherwise
 
         Returns:
             Formatted SMS message text from template
@@ -424,19 +872,11 @@ class SMSService:
             Exception: If template loading or formatting fails
         """
         try:
-            # Load template from database
-            template = self.settings_service.get_sms_template()
+            # Load template (cached across a batch of sends)
+            template = self._get_sms_template()
 
-            # Check for active override
-            override_repo = ScheduleOverrideRepository(self.db)
-            override = override_repo.get_override_for_schedule(schedule.id)
-
-            # Use override member if override exists and is active
-            if override and override.is_active:
-                member_name = override.override_member_name
-                logger.info(f"Using override member '{member_name}' for schedule {schedule.id}")
-            else:
-                member_name = schedule.team_member.name
+            if member_name is None:
+                member_name = self._resolve_member_name(schedule)
 
             # Prepare template variables
             duration_hours = schedule.shift.duration_hours
@@ -451,30 +891,68 @@ class SMSService:
                 duration=f"{duration_hours}h"
             )
 
-            logger.info(f"Composed message for schedule {schedule.id}: {len(message)} characters")
+            logger.info("Composed message for schedule %d: %d characters", schedule.id, len(message))
             return message
 
         except KeyError as e:
             # Missing template variable
-            logger.error(f"Template formatting error: missing variable {e}")
+            logger.error("Template formatting error: missing variable %s", e)
             raise Exception(f"SMS template missing required variable: {e}")
 
         except Exception as e:
             # Fallback to basic message if template loading fails
-            logger.error(f"Error loading SMS template: {str(e)}, using fallback")
+            logger.error("Error loading SMS template: %s, using fallback", e)
 
             # Check for active override (even in fallback)
-            override_repo = ScheduleOverrideRepository(self.db)
-            override = override_repo.get_override_for_schedule(schedule.id)
-
-            if override and override.is_active:
-                member_name = override.override_member_name
-            else:
-                member_name = schedule.team_member.name
+            if member_name is None:
+                member_name = self._resolve_member_name(schedule)
 
             end_time = schedule.end_datetime.strftime('%a %I:%M %p')
             return f"WhoseOnFirst: {member_name}, your on-call shift has started (until {end_time})"
 
+    def _resolve_member_name(self, schedule: Schedule) -> str:
+        """
+        Get the name of whoever is on call for a schedule, honouring active overrides.
+
+        Args:
+            schedule: Schedule instance
+
+        Returns:
+            Override member name if an override is active, else the scheduled member's name
+        """
+        override_repo = ScheduleOverrideRepository(self.db)
+        override = override_repo.get_override_for_schedule(schedule.id)
+
+        # Use override member if override exists and is active
+        if override and override.is_active:
+            member_name = override.override_member_name
+            logger.info("Using override member '%s' for schedule %d", member_name, schedule.id)
+            return member_name
+        return schedule.team_member.name
+
+    def _get_sms_template(self) -> str:
+        """
+        Get the SMS template, reusing the last loaded copy while it is fresh.
+
+        The cached template is dropped after SMS_TEMPLATE_CACHE_TTL seconds or as
+        soon as SettingsService writes a new template in this process.
+
+        Returns:
+            SMS template string
+        """
+        now = monotonic()
+        if self._template_cache is not None:
+            loaded_at, cached_version, template = self._template_cache
+            if (cached_version == get_sms_template_version()
+                    and now - loaded_at < SMS_TEMPLATE_CACHE_TTL):
+                return template
+
+        # Read the version after loading: on first use get_sms_template()
+        # seeds the default template, which bumps the version
+        template = self.settings_service.get_sms_template()
+        self._template_cache = (now, get_sms_template_version(), template)
+        return template
+
     def _compose_weekly_summary(self, schedules: list) -> str:
         """
         Compose weekly schedule summary message for escalation contacts.
@@ -502,41 +980,40 @@ class SMSService:
 
             Questions? Reply to this message.
         """
-        from datetime import datetime, timedelta
-        from pytz import timezone
-
-        # Get America/Chicago timezone
-        chicago_tz = timezone('America/Chicago')
-
         # Determine date range from schedules
         if not schedules:
-            now = datetime.now(chicago_tz)
+            now = datetime.now(CHICAGO_TZ)
             start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
         else:
             start_date = schedules[0].start_datetime
             if start_date.tzinfo is None:
-                start_date = chicago_tz.localize(start_date)
+                start_date = CHICAGO_TZ.localize(start_date)
             else:
-                start_date = start_date.astimezone(chicago_tz)
+                start_date = start_date.astimezone(CHICAGO_TZ)
 
         end_date = start_date + timedelta(days=6)
 
         # Format header with date range
         header = f"WhoseOnFirst Weekly Schedule ({start_date.strftime('%b %d')} - {end_date.strftime('%b %d')})"
 
-        # Build schedule lines
-        lines = []
+        # Build message lines, starting with the header and a blank line
+        lines = [header, ""]
+
+        # Create a map of Chicago date -> schedule for easy lookup. Naive
+        # datetimes are already Chicago wall time, so only aware ones need
+        # converting; localizing a naive value never changes its date.
+        schedule_map = {
+            (
+                schedule.start_datetime if schedule.start_datetime.tzinfo is None
+                else schedule.start_datetime.astimezone(CHICAGO_TZ)
+            ).date(): schedule
+            for schedule in schedules
+        }
 
-        # Create a map of date -> schedule for easy lookup
-        schedule_map = {}
-        for schedule in schedules:
-            sched_date = schedule.start_datetime
-            if sched_date.tzinfo is None:
-                sched_date = chicago_tz.localize(sched_date)
-            else:
-                sched_date = sched_date.astimezone(chicago_tz)
-            date_key = sched_date.date()
-            schedule_map[date_key] = schedule
+        # Precompute the 7 day dates and labels once
+        week_days = [start_date + timedelta(days=day_offset) for day_offset in range(7)]
+        day_dates = [day.date() for day in week_days]
+        day_labels = [day.strftime('%a %m/%d') for day in week_days]
 
         # Track 48h shifts to handle "continues" on second day
         previous_schedule = None
@@ -544,9 +1021,7 @@ class SMSService:
         is_continuation = False
 
         # Iterate through 7 days
-        for day_offset in range(7):
-            current_date = (start_date + timedelta(days=day_offset)).date()
-            day_name = (start_date + timedelta(days=day_offset)).strftime('%a %m/%d')
+        for current_date, day_name in zip(day_dates, day_labels):
 
             if current_date in schedule_map:
                 schedule = schedule_map[current_date]
@@ -600,10 +1075,9 @@ class SMSService:
                     previous_member_name = None
 
         # Build final message
-        message_lines = [header, ""] + lines
-        message = "\n".join(message_lines)
+        message = "\n".join(lines)
 
-        logger.info(f"Composed weekly summary: {len(message)} characters")
+        logger.info("Composed weekly summary: %d characters", len(message))
         return message
 
     def _is_retryable_error(self, error: TwilioRestException) -> bool:
@@ -628,24 +1102,17 @@ class SMSService:
             True if error is retryable, False otherwise
         """
         # HTTP status codes
-        if hasattr(error, 'status'):
-            if error.status in [429, 500, 502, 503]:
-                return True
-
-        # Twilio error codes
-        if hasattr(error, 'code'):
-            retryable_codes = [20003, 21610, 30001, 30002, 30003, 30004, 30005, 30006]
-            non_retryable_codes = [21211, 21408, 21614, 21217, 21601]
-
-            if error.code in non_retryable_codes:
-                return False
-            if error.code in retryable_codes:
-                return True
+        if getattr(error, 'status', None) in _RETRYABLE_STATUS:
+            return True
 
-        # Default to non-retryable for unknown errors
-        return False
+        # Twilio error codes (unknown codes default to non-retryable)
+        code = getattr(error, 'code', None)
+        if code in _NON_RETRYABLE_CODES:
+            return False
+        return code in _RETRYABLE_CODES
 
-    def _sanitize_phone(self, phone: str) -> str:
+    @staticmethod
+    def _sanitize_phone(phone: str) -> str:
         """
         Sanitize phone number for logging (mask last 4 digits).
 
@@ -655,9 +1122,7 @@ class SMSService:
         Returns:
             Sanitized phone number (e.g., +1555123XXXX)
         """
-        if len(phone) >= 4:
-            return phone[:-4] + 'XXXX'
-        return phone
+        return phone[:-4] + 'XXXX' if len(phone) >= 4 else phone
 
     def send_batch_notifications(
         self,
@@ -667,6 +1132,14 @@ class SMSService:
         """
         Send notifications for multiple schedules.
 
+        Database checks, message composition and logging run on the calling
+        thread; the Twilio deliveries for all schedules run concurrently on a
+        thread pool of up to BATCH_SEND_MAX_WORKERS workers.
+
+        Schedules should come with team_member and shift eagerly loaded (as
+        ScheduleRepository.get_pending_notifications does); any that are not
+        are loaded together in a single query up front.
+
         Args:
             schedules: List of Schedule instances
             force: If True, send even if already notified
@@ -677,59 +1150,178 @@ class SMSService:
                 "total": int,
                 "successful": int,
                 "failed": int,
+                "pending_retry": int,
                 "skipped": int,
                 "results": list of individual results
             }
+            Schedules whose delivery was handed to retry_scheduler count as
+            pending_retry, not failed.
         """
-        results = []
+        results: List[Optional[Dict[str, Any]]] = [None] * len(schedules)
         successful = 0
         failed = 0
+        pending_retry = 0
         skipped = 0
 
-        logger.info(f"Starting batch notification for {len(schedules)} schedules")
+        logger.info("Starting batch notification for %d schedules", len(schedules))
 
-        for schedule in schedules:
-            try:
-                result = self.send_notification(schedule, force=force)
-                results.append(result)
+        def error_result(schedule: Schedule, e: Exception) -> Dict[str, Any]:
+            error_msg = f"Error sending notification for schedule {schedule.id}: {str(e)}"
+            logger.error(error_msg)
+            return {
+                "success": False,
+                "schedule_id": schedule.id,
+                "twilio_sid": None,
+                "status": "error",
+                "message": error_msg,
+                "attempts": 0,
+                "error": str(e)
+            }
 
-                if result['success']:
-                    if result['status'] == 'skipped':
-                        skipped += 1
-                    else:
-                        successful += 1
-                else:
-                    failed += 1
+        # Already-notified schedules are skipped before any DB work
+        to_send = []
+        for index, schedule in enumerate(schedules):
+            if schedule.notified and not force:
+                results[index] = self._skipped_result(schedule.id)
+            else:
+                to_send.append((index, schedule))
+        if len(to_send) < len(schedules):
+            logger.info("Skipping %d already notified schedules", len(schedules) - len(to_send))
 
-            except Exception as e:
-                error_msg = f"Error sending notification for schedule {schedule.id}: {str(e)}"
-                logger.error(error_msg)
-                results.append({
-                    "success": False,
-                    "schedule_id": schedule.id,
-                    "twilio_sid": None,
-                    "status": "error",
-                    "message": error_msg,
-                    "attempts": 0,
-                    "error": str(e)
-                })
+        # Buffer notification log rows and write them once after the batch
+        self._log_buffer = []
+        try:
+            self._ensure_relationships_loaded([schedule for _, schedule in to_send])
+
+            # Phase 1: DB checks and message composition, with retry
+            # counts for the whole batch fetched in one query
+            retry_counts = self.notification_repo.get_retry_counts_for_schedules(
+                [schedule.id for _, schedule in to_send]
+            )
+            planned = []
+            for index, schedule in to_send:
+                try:
+                    early_result, ctx = self._prepare_notification(
+                        schedule, force, retry_count=retry_counts.get(schedule.id, 0)
+                    )
+                except Exception as e:
+                    results[index] = error_result(schedule, e)
+                    continue
+                if early_result is not None:
+                    results[index] = early_result
+                else:
+                    planned.append((index, schedule, ctx))
+
+            # Phase 2: concurrent Twilio delivery (no DB access on workers)
+            delivery_count = sum(len(ctx.targets) for _, _, ctx in planned)
+            if delivery_count:
+                with ThreadPoolExecutor(
+                    max_workers=min(delivery_count, BATCH_SEND_MAX_WORKERS)
+                ) as executor:
+                    # Group phones that can share one Twilio request: with a
+                    # Notify service, identical message bodies go out together;
+                    # otherwise each phone is delivered on its own.
+                    groups: Dict[Any, List[Tuple[int, str, str]]] = {}
+                    for position, (_, _, ctx) in enumerate(planned):
+                        for phone, phone_type in ctx.targets:
+                            key = (
+                                ctx.message_body if self.notify_service_sid
+                                else (position, phone_type)
+                            )
+                            groups.setdefault(key, []).append((position, phone, phone_type))
+
+                    # planned position -> phone_type -> (future, offset in its result list)
+                    phone_futures: List[Dict[str, Tuple[Any, int]]] = [{} for _ in planned]
+                    for members in groups.values():
+                        recipients = [
+                            (phone, planned[position][2].schedule_id, phone_type)
+                            for position, phone, phone_type in members
+                        ]
+                        future = executor.submit(
+                            self._deliver_group,
+                            recipients, planned[members[0][0]][2].message_body
+                        )
+                        for offset, (position, _, phone_type) in enumerate(members):
+                            phone_futures[position][phone_type] = (future, offset)
+
+                    # Phase 3: log attempts and build results, in input order
+                    notified_ids = []
+                    notified_at = datetime.now()
+                    for (index, schedule, ctx), by_type in zip(planned, phone_futures):
+                        try:
+                            deliveries = {
+                                phone_type: future.result()[offset]
+                                for phone_type, (future, offset) in by_type.items()
+                            }
+                            results[index] = self._finish_notification(
+                                schedule, ctx, deliveries, defer_commit=True
+                            )
+                        except Exception as e:
+                            results[index] = error_result(schedule, e)
+                            continue
+                        if results[index]["success"]:
+                            schedule.notified_at = notified_at
+                            notified_ids.append(ctx.schedule_id)
+
+                # Mark every delivered schedule in one UPDATE, committed
+                # together with the buffered log rows
+                if notified_ids:
+                    self.schedule_repo.mark_many_as_notified(notified_ids, commit=False)
+                    self.flush_logs()
+        finally:
+            try:
+                self.flush_logs()
+            finally:
+                self._log_buffer = None
+
+        for result in results:
+            if result['success']:
+                if result['status'] == 'skipped':
+                    skipped += 1
+                else:
+                    successful += 1
+            elif result['status'] == 'pending_retry':
+                pending_retry += 1
+            else:
                 failed += 1
 
         summary = {
             "total": len(schedules),
             "successful": successful,
             "failed": failed,
+            "pending_retry": pending_retry,
             "skipped": skipped,
             "results": results
         }
 
         logger.info(
-            f"Batch notification complete: {successful} successful, "
-            f"{failed} failed, {skipped} skipped out of {len(schedules)} total"
+            "Batch notification complete: %d successful, %d failed, %d pending retry, "
+            "%d skipped out of %d total",
+            successful,
+            failed,
+            pending_retry,
+            skipped,
+            len(schedules)
         )
 
         return summary
 
+    def _ensure_relationships_loaded(self, schedules: List[Schedule]) -> None:
+        """
+        Load team_member and shift for any schedules that lack them, in one query.
+
+        Avoids a lazy-load per relationship per schedule during a batch.
+
+        Args:
+            schedules: Schedule instances attached to this service's session
+        """
+        unloaded_ids = [
+            schedule.id for schedule in schedules
+            if {"team_member", "shift"} & inspect(schedule).unloaded
+        ]
+        if unloaded_ids:
+            self.schedule_repo.load_relationships(unloaded_ids)
+
     def send_manual_notification(
         self,
         team_member,
@@ -766,10 +1358,8 @@ class SMSService:
             >>> result['success']
             True
         """
-        logger.info(
-            f"Sending manual notification to {self._sanitize_phone(team_member.phone)} "
-            f"({team_member.name})"
-        )
+        masked_phone = self._sanitize_phone(team_member.phone)
+        logger.info("Sending manual notification to %s (%s)", masked_phone, team_member.name)
 
         try:
             # Send SMS via Twilio
@@ -786,8 +1376,10 @@ class SMSService:
             )
 
             logger.info(
-                f"Manual SMS sent successfully to {self._sanitize_phone(team_member.phone)} "
-                f"({team_member.name}, SID: {twilio_result['sid']})"
+                "Manual SMS sent successfully to %s (%s, SID: %s)",
+                masked_phone,
+                team_member.name,
+                twilio_result['sid']
             )
 
             return {
@@ -838,7 +1430,7 @@ class SMSService:
                 )
                 notification_id = log_entry.id
             except Exception as log_error:
-                logger.error(f"Failed to log manual notification attempt: {str(log_error)}")
+                logger.error("Failed to log manual notification attempt: %s", log_error)
                 notification_id = None
 
             return {
@@ -859,8 +1451,9 @@ class SMSService:
         Send weekly schedule summary SMS to all configured escalation contacts.
 
         Sends the provided message to all escalation contact phones (primary
-        and secondary contacts). Each send is logged individually with
-        schedule_id=NULL to indicate a weekly summary notification.
+        and secondary contacts). Each send gets its own log entry with
+        schedule_id=NULL to indicate a weekly summary notification; the
+        entries are written together once all sends are done.
 
         Args:
             message: The weekly summary message text
@@ -894,130 +1487,129 @@ class SMSService:
             "details": []
         }
 
-        # Collect all contacts to send to
-        contacts = []
-
-        # Primary escalation contact
-        if escalation_config.get('primary_name') and escalation_config.get('primary_phone'):
-            contacts.append({
-                "name": escalation_config['primary_name'],
-                "phone": escalation_config['primary_phone'],
-                "label": "Primary Escalation Contact"
-            })
-
-        # Secondary escalation contact
-        if escalation_config.get('secondary_name') and escalation_config.get('secondary_phone'):
-            contacts.append({
-                "name": escalation_config['secondary_name'],
-                "phone": escalation_config['secondary_phone'],
-                "label": "Secondary Escalation Contact"
-            })
-
-        # Send to each contact
-        for contact in contacts:
+        # Collect all contacts with both a name and phone configured
+        contacts = [
+            {"name": name, "phone": phone, "label": label}
+            for key, label in ESCALATION_CONTACT_SPECS
+            for name, phone in [(escalation_config.get(f"{key}_name"), escalation_config.get(f"{key}_phone"))]
+            if name and phone
+        ]
+
+        # Send to all contacts concurrently - the Twilio calls overlap, while
+        # log entries are collected and written on this thread afterwards
+        if len(contacts) > 1:
+            futures = [
+                _ESCALATION_SEND_EXECUTOR.submit(self._send_to_escalation_contact, contact, message)
+                for contact in contacts
+            ]
+            outcomes = [future.result() for future in futures]
+        else:
+            outcomes = [self._send_to_escalation_contact(contact, message) for contact in contacts]
+
+        pending_logs = []
+        for detail, log_entry in outcomes:
             results["total"] += 1
-            contact_name = contact["name"]
-            contact_phone = contact["phone"]
-            contact_label = contact["label"]
+            results["successful" if detail["status"] == "sent" else "failed"] += 1
+            results["details"].append(detail)
+            pending_logs.append(log_entry)
 
-            try:
-                logger.info(
-                    f"Sending weekly summary to {self._sanitize_phone(contact_phone)} "
-                    f"({contact_name} - {contact_label})"
-                )
+        # Write every log entry in one commit, then attach the new IDs
+        # (one entry per contact, in the same order as details)
+        try:
+            log_entries = self.notification_repo.log_notification_attempts(pending_logs)
+        except Exception as log_error:
+            logger.error("Failed to log notification attempts: %s", log_error)
+        else:
+            for detail, log_entry in zip(results["details"], log_entries):
+                detail["notification_id"] = log_entry.id
 
-                # Send SMS via Twilio
-                twilio_result = self._send_sms(contact_phone, message)
+        logger.info(
+            "Weekly escalation summary complete: %d successful, %d failed, %d total",
+            results['successful'],
+            results['failed'],
+            results['total']
+        )
 
-                # Log successful send (schedule_id=NULL for weekly summary)
-                log_entry = self.notification_repo.log_notification_attempt(
-                    schedule_id=None,  # NULL for weekly summaries
-                    status='sent',
-                    twilio_sid=twilio_result['sid'],
-                    error_message=None,
-                    recipient_name=contact_name,
-                    recipient_phone=contact_phone
-                )
+        return results
 
-                results["successful"] += 1
-                results["details"].append({
-                    "contact": contact_label,
-                    "name": contact_name,
-                    "phone": self._sanitize_phone(contact_phone),
-                    "status": "sent",
-                    "twilio_sid": twilio_result['sid'],
-                    "notification_id": log_entry.id
-                })
+    def _send_to_escalation_contact(
+        self,
+        contact: Dict[str, str],
+        message: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Send the weekly summary to one escalation contact, without touching the database.
 
-                logger.info(
-                    f"Weekly summary sent successfully to {self._sanitize_phone(contact_phone)} "
-                    f"(SID: {twilio_result['sid']})"
-                )
+        Safe to run on a worker thread.
 
-            except TwilioRestException as e:
-                error_msg = f"Twilio error: {str(e)}"
-                logger.error(f"Failed to send weekly summary to {contact_name}: {error_msg}")
+        Args:
+            contact: Contact dict with name, phone and label keys
+            message: The weekly summary message text
 
-                # Log failed send
-                try:
-                    log_entry = self.notification_repo.log_notification_attempt(
-                        schedule_id=None,
-                        status='failed',
-                        twilio_sid=None,
-                        error_message=error_msg,
-                        recipient_name=contact_name,
-                        recipient_phone=contact_phone
-                    )
-                    notification_id = log_entry.id
-                except Exception as log_error:
-                    logger.error(f"Failed to log notification attempt: {str(log_error)}")
-                    notification_id = None
-
-                results["failed"] += 1
-                results["details"].append({
-                    "contact": contact_label,
-                    "name": contact_name,
-                    "phone": self._sanitize_phone(contact_phone),
-                    "status": "failed",
-                    "error": str(e),
-                    "notification_id": notification_id
-                })
+        Returns:
+            Tuple of (details entry for the result, notification log entry
+            for the caller to write)
+        """
+        contact_name = contact["name"]
+        contact_phone = contact["phone"]
+        contact_label = contact["label"]
+        phone_masked = self._sanitize_phone(contact_phone)
 
-            except Exception as e:
-                error_msg = f"Unexpected error: {str(e)}"
-                logger.error(f"Failed to send weekly summary to {contact_name}: {error_msg}")
+        try:
+            logger.info(
+                "Sending weekly summary to %s (%s - %s)",
+                phone_masked,
+                contact_name,
+                contact_label
+            )
 
-                # Log failed send
-                try:
-                    log_entry = self.notification_repo.log_notification_attempt(
-                        schedule_id=None,
-                        status='failed',
-                        twilio_sid=None,
-                        error_message=error_msg,
-                        recipient_name=contact_name,
-                        recipient_phone=contact_phone
-                    )
-                    notification_id = log_entry.id
-                except Exception as log_error:
-                    logger.error(f"Failed to log notification attempt: {str(log_error)}")
-                    notification_id = None
-
-                results["failed"] += 1
-                results["details"].append({
-                    "contact": contact_label,
-                    "name": contact_name,
-                    "phone": self._sanitize_phone(contact_phone),
-                    "status": "failed",
-                    "error": str(e),
-                    "notification_id": notification_id
-                })
+            # Send SMS via Twilio
+            twilio_result = self._send_sms(contact_phone, message)
 
-        logger.info(
-            f"Weekly escalation summary complete: {results['successful']} successful, "
-            f"{results['failed']} failed, {results['total']} total"
-        )
+            logger.info(
+                "Weekly summary sent successfully to %s (SID: %s)",
+                phone_masked,
+                twilio_result['sid']
+            )
 
-        return results
+            # Log successful send (schedule_id=NULL for weekly summary)
+            return {
+                "contact": contact_label,
+                "name": contact_name,
+                "phone": phone_masked,
+                "status": "sent",
+                "twilio_sid": twilio_result['sid'],
+                "notification_id": None
+            }, {
+                "schedule_id": None,  # NULL for weekly summaries
+                "status": 'sent',
+                "twilio_sid": twilio_result['sid'],
+                "error_message": None,
+                "recipient_name": contact_name,
+                "recipient_phone": contact_phone
+            }
+
+        except Exception as e:
+            kind = "Twilio error" if isinstance(e, TwilioRestException) else "Unexpected error"
+            error_msg = f"{kind}: {str(e)}"
+            logger.error("Failed to send weekly summary to %s: %s", contact_name, error_msg)
+
+            # Log failed send
+            return {
+                "contact": contact_label,
+                "name": contact_name,
+                "phone": phone_masked,
+                "status": "failed",
+                "error": str(e),
+                "notification_id": None
+            }, {
+                "schedule_id": None,
+                "status": 'failed',
+                "twilio_sid": None,
+                "error_message": error_msg,
+                "recipient_name": contact_name,
+                "recipient_phone": contact_phone
+            }
 
     def get_delivery_status(self, twilio_sid: str) -> Optional[Dict[str, Any]]:
         """
@@ -1034,14 +1626,6 @@ class SMSService:
         Raises:
             TwilioRestException: If Twilio API call fails
         """
-        if self.mock_mode:
-            return {
-                "sid": twilio_sid,
-                "status": "delivered",
-                "error_code": None,
-                "error_message": None
-            }
-
         try:
             message = self.twilio_client.messages(twilio_sid).fetch()
             return {
@@ -1051,5 +1635,45 @@ class SMSService:
                 "error_message": message.error_message
             }
         except TwilioRestException as e:
-            logger.error(f"Failed to fetch message status for SID {twilio_sid}: {str(e)}")
+            logger.error("Failed to fetch message status for SID %s: %s", twilio_sid, e)
             return None
+
+    def _get_delivery_status_mock(self, twilio_sid: str) -> Optional[Dict[str, Any]]:
+        """
+        Mock-mode replacement for get_delivery_status; reports every message delivered.
+
+        Args:
+            twilio_sid: Twilio message SID
+
+        Returns:
+            Dictionary with "delivered" status information
+        """
+        return {
+            "sid": twilio_sid,
+            "status": "delivered",
+            "error_code": None,
+            "error_message": None
+        }
+
+    def get_delivery_statuses(self, twilio_sids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Query Twilio for the delivery status of several messages.
+
+        Fetches run concurrently (bounded by DELIVERY_STATUS_MAX_WORKERS) so a
+        batch of N lookups costs roughly N / workers round-trips.
+
+        Args:
+            twilio_sids: Twilio message SIDs
+
+        Returns:
+            Dictionary mapping each SID to its status information, or None if
+            the lookup failed
+        """
+        if self.mock_mode or len(twilio_sids) <= 1:
+            return {sid: self.get_delivery_status(sid) for sid in twilio_sids}
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(twilio_sids), DELIVERY_STATUS_MAX_WORKERS)
+        ) as executor:
+            statuses = list(executor.map(self.get_delivery_status, twilio_sids))
+        return dict(zip(twilio_sids, statuses))
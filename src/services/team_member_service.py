@@ -12,13 +12,20 @@ Key responsibilities:
 - Integration with schedule regeneration (Phase 2)
 """
 
+from functools import cached_property
 from typing import List, Optional, Dict, Any
+from weakref import WeakKeyDictionary
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from src.models.team_member import TeamMember
 from src.repositories.team_member_repository import TeamMemberRepository
 
+# One repository per session, shared by every service built on that session
+# (the repository is stateless beyond its session). Entries go away with the
+# session.
+_repo_by_session: "WeakKeyDictionary[Session, TeamMemberRepository]" = WeakKeyDictionary()
+
 
 class TeamMemberServiceError(Exception):
     """Base exception for team member service errors."""
@@ -46,6 +53,8 @@ class TeamMemberService:
     Attributes:
         db: SQLAlchemy database session
         repository: TeamMemberRepository instance for data access
+        _members_cache: All members from the first list/count call, or None
+            if not loaded yet. Cleared on any write through this service.
     """
 
     def __init__(self, db: Session):
@@ -56,7 +65,22 @@ class TeamMemberService:
             db: SQLAlchemy database session
         """
         self.db = db
-        self.repository = TeamMemberRepository(db)
+        self._members_cache: Optional[List[TeamMember]] = None
+
+    @cached_property
+    def repository(self) -> TeamMemberRepository:
+        """TeamMemberRepository for this service's session, created on first use."""
+        repository = _repo_by_session.get(self.db)
+        if repository is None:
+            repository = TeamMemberRepository(self.db)
+            _repo_by_session[self.db] = repository
+        return repository
+
+    def _all_members(self) -> List[TeamMember]:
+        """Load every member once per service instance (one per request)."""
+        if self._members_cache is None:
+            self._members_cache = self.repository.get_all()
+        return self._members_cache
 
     def create(self, member_data: Dict[str, Any]) -> TeamMember:
         """
@@ -95,12 +119,9 @@ class TeamMemberService:
         #     )
 
         try:
-            # Auto-assign rotation_order if not provided and member is active
-            if member_data.get("is_active", True) and "rotation_order" not in member_data:
-                max_order = self.repository.get_max_rotation_order()
-                member_data["rotation_order"] = 0 if max_order is None else max_order + 1
-
+            # Repository places active members at the end of the rotation
             member = self.repository.create(member_data)
+            self._members_cache = None
 
             # TODO: Phase 2 - Trigger schedule regeneration
             # if member.is_active:
@@ -154,26 +175,33 @@ class TeamMemberService:
             List of TeamMember instances
         """
         if active_only:
-            return self.repository.get_active()
-        return self.repository.get_all(skip=skip, limit=limit)
+            return self.get_active()
+        members = self._all_members()[skip:]
+        return members if limit is None else members[:limit]
 
     def get_active(self) -> List[TeamMember]:
         """
         Get all active team members.
 
         Returns:
-            List of active TeamMember instances
+            List of active TeamMember instances, ordered by name
         """
-        return self.repository.get_active()
+        return sorted(
+            (m for m in self._all_members() if m.is_active),
+            key=lambda m: m.name
+        )
 
     def get_inactive(self) -> List[TeamMember]:
         """
         Get all inactive team members.
 
         Returns:
-            List of inactive TeamMember instances
+            List of inactive TeamMember instances, ordered by name
         """
-        return self.repository.get_inactive()
+        return sorted(
+            (m for m in self._all_members() if not m.is_active),
+            key=lambda m: m.name
+        )
 
     def get_by_phone(self, phone: str) -> Optional[TeamMember]:
         """
@@ -230,6 +258,7 @@ class TeamMemberService:
 
         try:
             updated_member = self.repository.update(member_id, update_data)
+            self._members_cache = None
 
             # TODO: Phase 2 - Trigger schedule regeneration if is_active changed
             # if "is_active" in update_data:
@@ -266,6 +295,7 @@ class TeamMemberService:
         member = self.get_by_id(member_id)
 
         success = self.repository.delete(member_id)
+        self._members_cache = None
 
         # TODO: Phase 2 - Trigger schedule regeneration
         # if success:
@@ -299,16 +329,9 @@ class TeamMemberService:
         if not member.is_active:
             return member  # Already inactive
 
-        # Deactivate and clear rotation order
-        deactivated = self.repository.deactivate(member_id)
-        self.repository.update(member_id, {"rotation_order": None})
-        self.db.refresh(deactivated)
-
-        # Renumber remaining active members to maintain consecutive order
-        active_members = self.repository.get_ordered_for_rotation()
-        order_mapping = {str(m.id): i for i, m in enumerate(active_members)}
-        if order_mapping:
-            self.repository.update_rotation_orders(order_mapping)
+        # Deactivate, clear rotation order and renumber remaining active members
+        deactivated = self.repository.deactivate_and_renumber(member_id)
+        self._members_cache = None
 
         # TODO: Phase 2 - Trigger schedule regeneration
         # schedule_service = ScheduleService(self.db)
@@ -337,14 +360,9 @@ class TeamMemberService:
         if member.is_active:
             return member  # Already active
 
-        # Activate the member
+        # Activate and assign next available rotation order (starting from 0)
         activated = self.repository.activate(member_id)
-
-        # Assign next available rotation order (starting from 0)
-        max_order = self.repository.get_max_rotation_order()
-        next_order = 0 if max_order is None else max_order + 1
-        self.repository.update(member_id, {"rotation_order": next_order})
-        self.db.refresh(activated)
+        self._members_cache = None
 
         # TODO: Phase 2 - Trigger schedule regeneration
         # schedule_service = ScheduleService(self.db)
@@ -375,9 +393,10 @@ class TeamMemberService:
         Returns:
             Count of team members
         """
+        members = self._all_members()
         if active_only:
-            return self.repository.get_count_active()
-        return self.repository.count()
+            return sum(1 for m in members if m.is_active)
+        return len(members)
 
     def search_by_name(self, name: str) -> List[TeamMember]:
         """
@@ -414,11 +433,16 @@ class TeamMemberService:
             [<TeamMember 1>, <TeamMember 2>, <TeamMember 3>]
         """
         # Validate all member IDs exist before making any changes
-        for member_id in order_mapping.keys():
-            self.get_by_id(member_id)  # Raises MemberNotFoundError if not found
+        existing_ids = {m.id for m in self.repository.get_by_ids(list(order_mapping))}
+        missing_ids = set(order_mapping) - existing_ids
+        if missing_ids:
+            raise MemberNotFoundError(
+                f"Team member not found: {', '.join(str(i) for i in sorted(missing_ids))}"
+            )
 
         try:
             updated_members = self.repository.update_rotation_orders(order_mapping)
+            self._members_cache = None
 
             # TODO: Phase 2 - Consider triggering schedule regeneration if rotation order changes
             # schedule_service = ScheduleService(self.db)
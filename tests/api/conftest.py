@@ -2,6 +2,8 @@
 API test fixtures and configuration.
 """
 
+import contextlib
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -10,35 +12,110 @@ from src.main import app
 from src.api.dependencies import get_db
 from src.api.routes.auth import require_auth, require_admin
 from src.models.user import User, UserRole
+from src.auth.utils import hash_password
 
+# Hashed once at import; Argon2 is deliberately slow and no test verifies it
+_TEST_ADMIN_HASH = hash_password("test_password")
 
-@pytest.fixture
-def mock_admin_user(db_session: Session):
+
+@pytest.fixture(scope="session")
+def mock_admin_user(test_db_connection):
     """
     Create a mock admin user for testing.
 
+    Created once per run in the outer transaction (session fixtures are set
+    up before any module or test SAVEPOINT), so tests that never touch users,
+    such as the settings endpoints, don't pay for an INSERT each.
+
     Args:
-        db_session: Test database session
+        test_db_connection: Shared test connection (from conftest.py)
 
     Returns:
         User: Mock admin user instance
     """
     from src.repositories.user_repository import UserRepository
-    from src.auth.utils import hash_password
 
-    repo = UserRepository(db_session)
+    session = Session(
+        bind=test_db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
+    )
+    repo = UserRepository(session)
     user_data = {
         "username": "test_admin",
-        "password_hash": hash_password("test_password"),
+        "password_hash": _TEST_ADMIN_HASH,
         "role": UserRole.ADMIN,
         "is_active": True
     }
     user = repo.create(user_data)
+    session.close()
     return user
 
 
+@contextlib.contextmanager
+def _apply_overrides(overrides: dict):
+    """
+    Install dependency overrides on the app, restoring prior values on exit.
+
+    Overrides installed elsewhere (e.g. by session-scoped fixtures) survive
+    because only the given keys are touched.
+
+    Args:
+        overrides: Mapping of dependency to override callable
+    """
+    previous = {dep: app.dependency_overrides.get(dep) for dep in overrides}
+    app.dependency_overrides.update(overrides)
+    try:
+        yield
+    finally:
+        for dep, prev in previous.items():
+            if prev is None:
+                app.dependency_overrides.pop(dep, None)
+            else:
+                app.dependency_overrides[dep] = prev
+
+
+# Session and user the app's overridden dependencies hand out; set per test
+# by the ``client`` fixture
+_current: dict = {}
+
+
+def _override_get_db():
+    """Override database dependency with the current test's session."""
+    try:
+        yield _current["db"]
+    finally:
+        pass  # Session cleanup handled by db_session fixture
+
+
+def _override_current_user():
+    """Override authentication/admin requirement with the mock admin user."""
+    return _current["user"]
+
+
+@pytest.fixture(scope="session")
+def _test_client():
+    """
+    Session-wide TestClient so the app lifespan (scheduler start/stop)
+    runs once for the whole API suite.
+
+    The db/auth dependency overrides are installed once here and resolve
+    to whatever the ``client`` fixture has set for the running test.
+
+    Yields:
+        TestClient: Test client with db/auth overrides installed
+    """
+    overrides = {
+        get_db: _override_get_db,
+        require_auth: _override_current_user,
+        require_admin: _override_current_user,
+    }
+    with _apply_overrides(overrides), TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client(db_session: Session, mock_admin_user: User):
+def client(_test_client: TestClient, db_session: Session, mock_admin_user: User):
     """
     FastAPI test client with database and authentication overrides.
 
@@ -48,34 +125,32 @@ def client(db_session: Session, mock_admin_user: User):
     All requests are authenticated as the mock admin user by default.
 
     Args:
+        _test_client: Shared session-scoped test client
         db_session: Test database session (from conftest.py)
         mock_admin_user: Mock admin user for authentication
 
     Yields:
         TestClient: Configured test client with auth bypass
     """
-    def override_get_db():
-        """Override database dependency with test session."""
-        try:
-            yield db_session
-        finally:
-            pass  # Session cleanup handled by db_session fixture
-
-    def override_require_auth():
-        """Override authentication requirement for tests."""
-        return mock_admin_user
-
-    def override_require_admin():
-        """Override admin requirement for tests."""
-        return mock_admin_user
-
-    # Override dependencies
-    app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[require_auth] = override_require_auth
-    app.dependency_overrides[require_admin] = override_require_admin
-
-    with TestClient(app) as test_client:
-        yield test_client
+    _current.update(db=db_session, user=mock_admin_user)
+    yield _test_client
+    _current.clear()
+
+
+@pytest.fixture
+def post_expect(client: TestClient):
+    """
+    Factory that POSTs JSON and asserts the expected status in one place.
+
+    Args:
+        client: Test client (from the ``client`` fixture)
+
+    Returns:
+        Callable: post_expect(url, json, status=201) returning the parsed body
+    """
+    def _post_expect(url: str, json: dict, status: int = 201):
+        response = client.post(url, json=json)
+        assert response.status_code == status, response.text
+        return response.json()
 
-    # Clean up dependency overrides
-    app.dependency_overrides.clear()
+    return _post_expect
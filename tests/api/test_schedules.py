@@ -4,49 +4,144 @@ Schedules API endpoint tests.
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-from pytz import timezone
+from datetime import datetime
+from zoneinfo import ZoneInfo
 
 from src.models.team_member import TeamMember
 from src.models.shift import Shift
 from src.models.schedule import Schedule
+from src.services.schedule_service import ScheduleService
+from tests.fixtures_data import STANDARD_SHIFTS
 
 
 # Chicago timezone for testing
-CHICAGO_TZ = timezone('America/Chicago')
+CHICAGO_TZ = ZoneInfo('America/Chicago')
+
+# Fixed request timestamps as ISO strings (America/Chicago, CST)
+JAN_1_2025 = "2025-01-01T00:00:00-06:00"
+JAN_6_2025_8AM = "2025-01-06T08:00:00-06:00"
+JAN_14_2025_EOD = "2025-01-14T23:59:59-06:00"
+JAN_20_2025_8AM = "2025-01-20T08:00:00-06:00"
+JAN_31_2025_EOD = "2025-01-31T23:59:59-06:00"
+
+# Wall-clock reference for the "now"-relative endpoints (current/upcoming/next)
+FROZEN_NOW = datetime(2025, 1, 6, 8, 0, 0)
+NEXT_WEEK_8AM = "2025-01-13T08:00:00-06:00"
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always reads FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW if tz is None else FROZEN_NOW.replace(tzinfo=CHICAGO_TZ).astimezone(tz)
 
 
 @pytest.fixture
-def setup_team_and_shifts(db_session: Session):
+def frozen_now(monkeypatch):
+    """
+    Pin the schedule repository's clock at FROZEN_NOW so tests and the
+    "now"-relative endpoints agree on today regardless of when the suite runs.
+
+    Only the repository's datetime is replaced: freezegun swaps
+    datetime.datetime process-wide, which breaks pydantic's lazy schema
+    build for request bodies.
+    """
+    monkeypatch.setattr("src.repositories.schedule_repository.datetime", _FrozenDatetime)
+    return FROZEN_NOW
+
+
+@pytest.fixture(scope="module")
+def setup_team_and_shifts(test_db_connection):
     """
     Fixture to set up team members and shifts for testing.
 
-    Creates 3 active team members and 6 standard shifts.
+    Creates 3 active team members and 6 standard shifts once per module,
+    inside a SAVEPOINT that every test's own SAVEPOINT nests under; it is
+    rolled back after the last test in the module.
     """
-    # Create team members
-    members = [
-        TeamMember(name="Alice", phone="+15551111111", is_active=True),
-        TeamMember(name="Bob", phone="+15552222222", is_active=True),
-        TeamMember(name="Charlie", phone="+15553333333", is_active=True),
-    ]
-    db_session.add_all(members)
+    savepoint = test_db_connection.begin_nested()
+    session = Session(
+        bind=test_db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
+    )
+
+    # Create team members (one multi-row INSERT ... RETURNING)
+    members = session.scalars(
+        insert(TeamMember).returning(TeamMember, sort_by_parameter_order=True),
+        [
+            {"name": "Alice", "phone": "+15551111111", "is_active": True},
+            {"name": "Bob", "phone": "+15552222222", "is_active": True},
+            {"name": "Charlie", "phone": "+15553333333", "is_active": True},
+        ]
+    ).all()
 
     # Create standard 6-shift weekly rotation
-    shifts = [
-        Shift(shift_number=1, day_of_week="Monday", duration_hours=24, start_time="08:00"),
-        Shift(shift_number=2, day_of_week="Tuesday-Wednesday", duration_hours=48, start_time="08:00"),
-        Shift(shift_number=3, day_of_week="Thursday", duration_hours=24, start_time="08:00"),
-        Shift(shift_number=4, day_of_week="Friday", duration_hours=24, start_time="08:00"),
-        Shift(shift_number=5, day_of_week="Saturday", duration_hours=24, start_time="08:00"),
-        Shift(shift_number=6, day_of_week="Sunday", duration_hours=24, start_time="08:00"),
-    ]
-    db_session.add_all(shifts)
+    shifts = session.scalars(
+        insert(Shift).returning(Shift, sort_by_parameter_order=True),
+        [dict(row) for row in STANDARD_SHIFTS]
+    ).all()
+    session.commit()
+    session.close()
+
+    yield {"members": members, "shifts": shifts}
+
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="module")
+def _jan2025_schedule_rows(test_db_connection, setup_team_and_shifts):
+    """
+    Run the rotation for 4 weeks from 2025-01-06 once per module.
+
+    Generation happens in a SAVEPOINT that is rolled back straight away;
+    only the resulting rows are kept, for ``generated_schedule_jan2025``
+    to insert into each test that needs them.
+    """
+    savepoint = test_db_connection.begin_nested()
+    session = Session(bind=test_db_connection, join_transaction_mode="create_savepoint")
+    try:
+        schedules = ScheduleService(session).generate_schedule(
+            start_date=datetime.fromisoformat(JAN_6_2025_8AM), weeks=4, force=False
+        )
+        columns = [c.key for c in Schedule.__table__.columns if c.key != "id"]
+        rows = [{col: getattr(schedule, col) for col in columns} for schedule in schedules]
+    finally:
+        session.close()
+        savepoint.rollback()
+
+    return rows
+
+
+@pytest.fixture
+def generated_schedule_jan2025(db_session: Session, _jan2025_schedule_rows):
+    """
+    Schedule generated for 4 weeks from 2025-01-06, inserted with one
+    multi-row INSERT into the current test's SAVEPOINT.
+    """
+    db_session.execute(insert(Schedule), _jan2025_schedule_rows)
     db_session.commit()
+    return _jan2025_schedule_rows
+
+
+@pytest.fixture
+def without_seed_data(db_session: Session):
+    """
+    Remove the module's seeded members and shifts for the current test only.
 
-    return {"members": members, "shifts": shifts}
+    The deletes happen inside the test's SAVEPOINT, so the seed is back for
+    the next test.
+    """
+    db_session.query(Schedule).delete()
+    db_session.query(Shift).delete()
+    db_session.query(TeamMember).delete()
+    db_session.commit()
 
 
+@pytest.mark.usefixtures("frozen_now")
 class TestGetCurrentWeekSchedule:
     """Tests for GET /api/v1/schedules/current"""
 
@@ -57,20 +152,14 @@ class TestGetCurrentWeekSchedule:
         assert response.json() == []
 
     def test_get_current_week_with_schedules(
-        self, client: TestClient, db_session: Session, setup_team_and_shifts
+        self, client: TestClient, post_expect, db_session: Session, setup_team_and_shifts
     ):
         """Test getting current week schedule with existing schedules."""
         # Generate schedule for current week
-        start_date = CHICAGO_TZ.localize(datetime.now().replace(hour=8, minute=0, second=0, microsecond=0))
-        response = client.post(
+        post_expect(
             "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 1,
-                "force": False
-            }
+            {"start_date": JAN_6_2025_8AM, "weeks": 1, "force": False}
         )
-        assert response.status_code == 201
 
         # Get current week schedule
         response = client.get("/api/v1/schedules/current")
@@ -84,26 +173,19 @@ class TestGetCurrentWeekSchedule:
             assert "shift_number" in schedule
 
 
+@pytest.mark.usefixtures("frozen_now")
 class TestGetUpcomingSchedules:
     """Tests for GET /api/v1/schedules/upcoming"""
 
     def test_get_upcoming_default_weeks(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, post_expect, setup_team_and_shifts
     ):
         """Test getting upcoming schedules with default 4 weeks."""
         # Generate schedule for next 4 weeks
-        start_date = CHICAGO_TZ.localize(
-            (datetime.now() + timedelta(days=7)).replace(hour=8, minute=0, second=0, microsecond=0)
-        )
-        response = client.post(
+        post_expect(
             "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 4,
-                "force": False
-            }
+            {"start_date": NEXT_WEEK_8AM, "weeks": 4, "force": False}
         )
-        assert response.status_code == 201
 
         # Get upcoming schedules
         response = client.get("/api/v1/schedules/upcoming")
@@ -112,25 +194,17 @@ class TestGetUpcomingSchedules:
         assert len(data) > 0
 
     def test_get_upcoming_custom_weeks(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, post_expect, setup_team_and_shifts
     ):
         """Test getting upcoming schedules with custom week count."""
         # Generate schedule for next 8 weeks
-        start_date = CHICAGO_TZ.localize(
-            (datetime.now() + timedelta(days=7)).replace(hour=8, minute=0, second=0, microsecond=0)
-        )
-        response = client.post(
+        post_expect(
             "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 8,
-                "force": False
-            }
+            {"start_date": NEXT_WEEK_8AM, "weeks": 8, "force": False}
         )
-        assert response.status_code == 201
 
         # Get upcoming schedules for 8 weeks
-        response = client.get("/api/v1/schedules/upcoming?weeks=8")
+        response = client.get("/api/v1/schedules/upcoming", params={"weeks": 8})
         assert response.status_code == 200
         data = response.json()
         assert len(data) > 0
@@ -140,23 +214,9 @@ class TestGetSchedulesByDateRange:
     """Tests for GET /api/v1/schedules/"""
 
     def test_get_all_schedules(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, generated_schedule_jan2025
     ):
         """Test getting all schedules without filters."""
-        # Generate schedules
-        start_date = CHICAGO_TZ.localize(
-            datetime(2025, 1, 6, 8, 0, 0)
-        )
-        response = client.post(
-            "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 2,
-                "force": False
-            }
-        )
-        assert response.status_code == 201
-
         # Get all schedules
         response = client.get("/api/v1/schedules/")
         assert response.status_code == 200
@@ -164,27 +224,13 @@ class TestGetSchedulesByDateRange:
         assert len(data) > 0
 
     def test_get_schedules_with_date_range(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, generated_schedule_jan2025
     ):
         """Test getting schedules filtered by date range."""
-        # Generate schedules for January 2025
-        start_date = CHICAGO_TZ.localize(datetime(2025, 1, 6, 8, 0, 0))
-        response = client.post(
-            "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 4,
-                "force": False
-            }
-        )
-        assert response.status_code == 201
-
         # Get schedules for first two weeks of January
-        query_start = CHICAGO_TZ.localize(datetime(2025, 1, 1, 0, 0, 0))
-        query_end = CHICAGO_TZ.localize(datetime(2025, 1, 14, 23, 59, 59))
-
         response = client.get(
-            f"/api/v1/schedules/?start_date={query_start.isoformat()}&end_date={query_end.isoformat()}"
+            "/api/v1/schedules/",
+            params={"start_date": JAN_1_2025, "end_date": JAN_14_2025_EOD}
         )
         assert response.status_code == 200
         data = response.json()
@@ -195,23 +241,11 @@ class TestGetMemberSchedules:
     """Tests for GET /api/v1/schedules/member/{id}"""
 
     def test_get_member_schedules(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, setup_team_and_shifts, generated_schedule_jan2025
     ):
         """Test getting all schedules for a specific team member."""
         members = setup_team_and_shifts["members"]
 
-        # Generate schedules
-        start_date = CHICAGO_TZ.localize(datetime(2025, 1, 6, 8, 0, 0))
-        response = client.post(
-            "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 4,
-                "force": False
-            }
-        )
-        assert response.status_code == 201
-
         # Get schedules for first member
         member_id = members[0].id
         response = client.get(f"/api/v1/schedules/member/{member_id}")
@@ -227,48 +261,34 @@ class TestGenerateSchedule:
     """Tests for POST /api/v1/schedules/generate"""
 
     def test_generate_valid_schedule(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, post_expect, setup_team_and_shifts
     ):
         """Test generating a valid schedule."""
-        start_date = CHICAGO_TZ.localize(datetime(2025, 1, 6, 8, 0, 0))
 
-        response = client.post(
+        data = post_expect(
             "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 4,
-                "force": False
-            }
+            {"start_date": JAN_6_2025_8AM, "weeks": 4, "force": False}
         )
-
-        assert response.status_code == 201
-        data = response.json()
         assert len(data) > 0
         # With 3 members and 6 shifts per week, over 4 weeks = 24 assignments
         assert len(data) == 24
 
     def test_generate_duplicate_without_force(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, post_expect, setup_team_and_shifts
     ):
         """Test generating schedule when schedules already exist (without force)."""
-        start_date = CHICAGO_TZ.localize(datetime(2025, 1, 6, 8, 0, 0))
 
         # Generate first time
-        response = client.post(
+        post_expect(
             "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 2,
-                "force": False
-            }
+            {"start_date": JAN_6_2025_8AM, "weeks": 2, "force": False}
         )
-        assert response.status_code == 201
 
         # Try to generate again without force
         response = client.post(
             "/api/v1/schedules/generate",
             json={
-                "start_date": start_date.isoformat(),
+                "start_date": JAN_6_2025_8AM,
                 "weeks": 2,
                 "force": False
             }
@@ -277,38 +297,29 @@ class TestGenerateSchedule:
         assert "already exist" in response.json()["detail"].lower()
 
     def test_generate_with_force(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, post_expect, setup_team_and_shifts
     ):
         """Test force regenerating existing schedules."""
-        start_date = CHICAGO_TZ.localize(datetime(2025, 1, 6, 8, 0, 0))
 
         # Generate first time
-        response = client.post(
+        first = post_expect(
             "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 2,
-                "force": False
-            }
+            {"start_date": JAN_6_2025_8AM, "weeks": 2, "force": False}
         )
-        assert response.status_code == 201
-        first_schedule_count = len(response.json())
+        first_schedule_count = len(first)
 
         # Force regenerate
-        response = client.post(
+        second = post_expect(
             "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 2,
-                "force": True
-            }
+            {"start_date": JAN_6_2025_8AM, "weeks": 2, "force": True}
         )
-        assert response.status_code == 201
-        second_schedule_count = len(response.json())
+        second_schedule_count = len(second)
         # Should have same count
         assert second_schedule_count == first_schedule_count
 
-    def test_generate_without_team_members(self, client: TestClient, db_session: Session):
+    def test_generate_without_team_members(
+        self, client: TestClient, db_session: Session, without_seed_data
+    ):
         """Test generating schedule without any active team members."""
         # Create shifts but no team members
         shifts = [
@@ -317,11 +328,10 @@ class TestGenerateSchedule:
         db_session.add_all(shifts)
         db_session.commit()
 
-        start_date = CHICAGO_TZ.localize(datetime(2025, 1, 6, 8, 0, 0))
         response = client.post(
             "/api/v1/schedules/generate",
             json={
-                "start_date": start_date.isoformat(),
+                "start_date": JAN_6_2025_8AM,
                 "weeks": 1,
                 "force": False
             }
@@ -329,7 +339,9 @@ class TestGenerateSchedule:
         assert response.status_code == 400
         assert "no active team members" in response.json()["detail"].lower()
 
-    def test_generate_without_shifts(self, client: TestClient, db_session: Session):
+    def test_generate_without_shifts(
+        self, client: TestClient, db_session: Session, without_seed_data
+    ):
         """Test generating schedule without any configured shifts."""
         # Create team members but no shifts
         members = [
@@ -338,11 +350,10 @@ class TestGenerateSchedule:
         db_session.add_all(members)
         db_session.commit()
 
-        start_date = CHICAGO_TZ.localize(datetime(2025, 1, 6, 8, 0, 0))
         response = client.post(
             "/api/v1/schedules/generate",
             json={
-                "start_date": start_date.isoformat(),
+                "start_date": JAN_6_2025_8AM,
                 "weeks": 1,
                 "force": False
             }
@@ -355,27 +366,14 @@ class TestRegenerateSchedule:
     """Tests for POST /api/v1/schedules/regenerate"""
 
     def test_regenerate_from_date(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, generated_schedule_jan2025
     ):
         """Test regenerating schedules from a specific date."""
-        # Generate initial 4 weeks
-        start_date = CHICAGO_TZ.localize(datetime(2025, 1, 6, 8, 0, 0))
-        response = client.post(
-            "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 4,
-                "force": False
-            }
-        )
-        assert response.status_code == 201
-
         # Regenerate from week 3 onwards
-        regenerate_date = CHICAGO_TZ.localize(datetime(2025, 1, 20, 8, 0, 0))
         response = client.post(
             "/api/v1/schedules/regenerate",
             json={
-                "from_date": regenerate_date.isoformat(),
+                "from_date": JAN_20_2025_8AM,
                 "weeks": 2
             }
         )
@@ -384,28 +382,21 @@ class TestRegenerateSchedule:
         assert len(data) > 0
 
 
+@pytest.mark.usefixtures("frozen_now")
 class TestGetNextAssignment:
     """Tests for GET /api/v1/schedules/member/{id}/next"""
 
     def test_get_next_assignment(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, post_expect, setup_team_and_shifts
     ):
         """Test getting next assignment for a team member."""
         members = setup_team_and_shifts["members"]
 
         # Generate future schedules
-        start_date = CHICAGO_TZ.localize(
-            (datetime.now() + timedelta(days=7)).replace(hour=8, minute=0, second=0, microsecond=0)
-        )
-        response = client.post(
+        post_expect(
             "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 4,
-                "force": False
-            }
+            {"start_date": NEXT_WEEK_8AM, "weeks": 4, "force": False}
         )
-        assert response.status_code == 201
 
         # Get next assignment
         member_id = members[0].id
@@ -421,44 +412,36 @@ class TestScheduleIntegration:
     """Integration tests for schedule workflows."""
 
     def test_full_schedule_lifecycle(
-        self, client: TestClient, setup_team_and_shifts
+        self, client: TestClient, post_expect, setup_team_and_shifts
     ):
         """Test complete schedule lifecycle: generate -> query -> regenerate."""
         # Generate initial schedule
-        start_date = CHICAGO_TZ.localize(datetime(2025, 1, 6, 8, 0, 0))
-        response = client.post(
+        initial = post_expect(
             "/api/v1/schedules/generate",
-            json={
-                "start_date": start_date.isoformat(),
-                "weeks": 4,
-                "force": False
-            }
+            {"start_date": JAN_6_2025_8AM, "weeks": 4, "force": False}
         )
-        assert response.status_code == 201
-        initial_count = len(response.json())
+        initial_count = len(initial)
 
         # Query current week
         response = client.get("/api/v1/schedules/current")
         assert response.status_code == 200
 
         # Query upcoming
-        response = client.get("/api/v1/schedules/upcoming?weeks=4")
+        response = client.get("/api/v1/schedules/upcoming", params={"weeks": 4})
         assert response.status_code == 200
 
         # Query by date range
-        query_start = CHICAGO_TZ.localize(datetime(2025, 1, 1, 0, 0, 0))
-        query_end = CHICAGO_TZ.localize(datetime(2025, 1, 31, 23, 59, 59))
         response = client.get(
-            f"/api/v1/schedules/?start_date={query_start.isoformat()}&end_date={query_end.isoformat()}"
+            "/api/v1/schedules/",
+            params={"start_date": JAN_1_2025, "end_date": JAN_31_2025_EOD}
         )
         assert response.status_code == 200
 
         # Regenerate from midpoint
-        regenerate_date = CHICAGO_TZ.localize(datetime(2025, 1, 20, 8, 0, 0))
         response = client.post(
             "/api/v1/schedules/regenerate",
             json={
-                "from_date": regenerate_date.isoformat(),
+                "from_date": JAN_20_2025_8AM,
                 "weeks": 2
             }
         )
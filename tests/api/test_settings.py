@@ -2,10 +2,27 @@
 Tests for settings API endpoints.
 
 Tests cover auto-renewal configuration and SMS template management.
+
+Settings rows live in the test database, so every write here is rolled back
+with the test's SAVEPOINT; tests do not depend on each other's settings and
+can be spread across pytest-xdist workers.
 """
 
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from src.api.schemas.settings import SMSTemplateResponse
+
+
+# Structural check of SMS template responses against the app's response model
+_SMS_TEMPLATE_RESPONSE = TypeAdapter(SMSTemplateResponse)
+
+# Template over the 320-character limit
+_LONG_TEMPLATE = "Hi {name}, " + "x" * 350
+
+# Template at exactly the 320-character limit (2 SMS segments)
+_MAX_TEMPLATE = "Hi {name}, " + "x" * 298 + " {duration}"
 
 
 class TestAutoRenewEndpoints:
@@ -62,15 +79,12 @@ class TestSMSTemplateEndpoints:
         assert response.status_code == 200
         data = response.json()
 
-        # Verify response structure
-        assert "template" in data
+        # Verify response structure (last_updated is optional in the model)
+        template_response = _SMS_TEMPLATE_RESPONSE.validate_python(data)
         assert "last_updated" in data
-        assert "character_count" in data
-        assert "sms_count" in data
-        assert "variables" in data
 
         # Verify template content
-        template = data["template"]
+        template = template_response.template
         assert len(template) > 0
         assert "{name}" in template
         assert "{start_time}" in template
@@ -78,13 +92,9 @@ class TestSMSTemplateEndpoints:
         assert "{duration}" in template
 
         # Verify metadata
-        assert data["character_count"] == len(template)
-        assert data["sms_count"] >= 1
-        assert isinstance(data["variables"], list)
-        assert "name" in data["variables"]
-        assert "start_time" in data["variables"]
-        assert "end_time" in data["variables"]
-        assert "duration" in data["variables"]
+        assert template_response.character_count == len(template)
+        assert template_response.sms_count >= 1
+        assert set(template_response.variables) >= {"name", "start_time", "end_time", "duration"}
 
     def test_update_sms_template_valid(self, client: TestClient):
         """Test updating SMS template with valid content."""
@@ -112,42 +122,26 @@ class TestSMSTemplateEndpoints:
         detail = response.json()["detail"]
         assert isinstance(detail, list) or "String should have at least 1 character" in str(detail)
 
-    def test_update_sms_template_whitespace_only(self, client: TestClient):
-        """Test that whitespace-only template is rejected."""
-        response = client.put("/api/v1/settings/sms-template", json={
-            "template": "   \n   "
-        })
-
-        assert response.status_code == 400
-        assert "cannot be empty" in response.json()["detail"]
-
-    def test_update_sms_template_no_variables(self, client: TestClient):
-        """Test that template without variables is rejected."""
+    @pytest.mark.parametrize("template, expected_details", [
+        ("   \n   ", ["cannot be empty"]),  # whitespace only
+        ("This is a static message with no variables.", ["must contain at least one variable"]),
+        ("Hi {name}, your shift is {invalid_var}.", ["Invalid template variables", "invalid_var"]),
+    ], ids=["whitespace_only", "no_variables", "invalid_variables"])
+    def test_update_sms_template_rejected(self, client: TestClient, template, expected_details):
+        """Test that templates failing endpoint validation are rejected with 400."""
         response = client.put("/api/v1/settings/sms-template", json={
-            "template": "This is a static message with no variables."
-        })
-
-        assert response.status_code == 400
-        assert "must contain at least one variable" in response.json()["detail"]
-
-    def test_update_sms_template_invalid_variables(self, client: TestClient):
-        """Test that template with invalid variables is rejected."""
-        response = client.put("/api/v1/settings/sms-template", json={
-            "template": "Hi {name}, your shift is {invalid_var}."
+            "template": template
         })
 
         assert response.status_code == 400
         detail = response.json()["detail"]
-        assert "Invalid template variables" in detail
-        assert "invalid_var" in detail
+        for expected in expected_details:
+            assert expected in detail
 
     def test_update_sms_template_too_long(self, client: TestClient):
         """Test that template exceeding character limit is rejected."""
-        # Create a template > 320 characters
-        long_template = "Hi {name}, " + "x" * 350
-
         response = client.put("/api/v1/settings/sms-template", json={
-            "template": long_template
+            "template": _LONG_TEMPLATE
         })
 
         # Pydantic validation catches this before endpoint logic (422 vs 400)
@@ -157,12 +151,10 @@ class TestSMSTemplateEndpoints:
 
     def test_update_sms_template_max_length(self, client: TestClient):
         """Test template at exactly 320 characters (2 SMS segments)."""
-        # Create a template at exactly 320 chars
-        template = "Hi {name}, " + "x" * 298 + " {duration}"
-        assert len(template) == 320
+        assert len(_MAX_TEMPLATE) == 320
 
         response = client.put("/api/v1/settings/sms-template", json={
-            "template": template
+            "template": _MAX_TEMPLATE
         })
 
         assert response.status_code == 200
@@ -170,25 +162,23 @@ class TestSMSTemplateEndpoints:
         assert data["character_count"] == 320
         assert data["sms_count"] == 2
 
-    def test_sms_count_calculation(self, client: TestClient):
+    @pytest.mark.parametrize("template, expected_sms_count", [
+        ("Hi {name}!", 1),  # 10 chars = 1 SMS
+        ("Hi {name}, " + "x" * 148, 1),  # 159 chars = 1 SMS
+        ("Hi {name}, " + "x" * 149, 1),  # 160 chars = 1 SMS (exactly fills one segment)
+        ("Hi {name}, " + "x" * 150, 2),  # 161 chars = 2 SMS (spills to second segment)
+        ("Hi {name}, " + "x" * 309, 2),  # 320 chars = 2 SMS (max allowed)
+    ], ids=["10_chars", "159_chars", "160_chars", "161_chars", "320_chars"])
+    def test_sms_count_calculation(self, client: TestClient, template, expected_sms_count):
         """Test SMS segment count calculation for various lengths."""
-        test_cases = [
-            ("Hi {name}!", 1),  # 10 chars = 1 SMS
-            ("Hi {name}, " + "x" * 148, 1),  # 159 chars = 1 SMS
-            ("Hi {name}, " + "x" * 149, 1),  # 160 chars = 1 SMS (exactly fills one segment)
-            ("Hi {name}, " + "x" * 150, 2),  # 161 chars = 2 SMS (spills to second segment)
-            ("Hi {name}, " + "x" * 309, 2),  # 320 chars = 2 SMS (max allowed)
-        ]
-
-        for template, expected_sms_count in test_cases:
-            response = client.put("/api/v1/settings/sms-template", json={
-                "template": template
-            })
-
-            assert response.status_code == 200, f"Template length {len(template)} failed: {response.json()}"
-            data = response.json()
-            assert data["sms_count"] == expected_sms_count, \
-                f"Template of {len(template)} chars should be {expected_sms_count} SMS, got {data['sms_count']}"
+        response = client.put("/api/v1/settings/sms-template", json={
+            "template": template
+        })
+
+        data = response.json()
+        assert response.status_code == 200, f"Template length {len(template)} failed: {data}"
+        assert data["sms_count"] == expected_sms_count, \
+            f"Template of {len(template)} chars should be {expected_sms_count} SMS, got {data['sms_count']}"
 
     def test_template_persistence(self, client: TestClient):
         """Test that template changes persist across requests."""
@@ -2,11 +2,18 @@
 Shifts API endpoint tests.
 """
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from src.models.shift import Shift
+from tests.fixtures_data import STANDARD_SHIFTS
+
+
+# Standard rotation request bodies, JSON-encoded once at import
+_SHIFT_ROTATION_JSON = tuple(orjson.dumps(dict(row)) for row in STANDARD_SHIFTS)
+_JSON_HEADERS = {"content-type": "application/json"}
 
 
 class TestListShifts:
@@ -41,8 +48,7 @@ class TestGetShift:
         """Test getting an existing shift configuration."""
         shift = Shift(shift_number=1, day_of_week="Monday", duration_hours=24, start_time="08:00")
         db_session.add(shift)
-        db_session.commit()
-        db_session.refresh(shift)
+        db_session.flush()
 
         response = client.get(f"/api/v1/shifts/{shift.id}")
         assert response.status_code == 200
@@ -113,50 +119,21 @@ class TestCreateShift:
         assert response.status_code == 400
         assert "already exists" in response.json()["detail"].lower()
 
-    def test_create_invalid_duration(self, client: TestClient):
-        """Test creating shift with invalid duration."""
-        shift_data = {
-            "shift_number": 1,
-            "day_of_week": "Monday",
-            "duration_hours": 12,  # Invalid: must be 24 or 48
-            "start_time": "08:00:00"
-        }
-        response = client.post("/api/v1/shifts/", json=shift_data)
-        assert response.status_code == 422  # Pydantic validation error
-
-    def test_create_invalid_start_time_format(self, client: TestClient):
-        """Test creating shift with invalid start time format."""
-        shift_data = {
-            "shift_number": 1,
-            "day_of_week": "Monday",
-            "duration_hours": 24,
-            "start_time": "8:00"  # Invalid: must be HH:MM
-        }
-        response = client.post("/api/v1/shifts/", json=shift_data)
-        assert response.status_code == 422  # Pydantic validation error
-
-    def test_create_missing_required_fields(self, client: TestClient):
-        """Test creating shift without required fields."""
-        shift_data = {
-            "shift_number": 1,
-            "day_of_week": "Monday"
-            # Missing duration_hours and start_time
-        }
-        response = client.post("/api/v1/shifts/", json=shift_data)
-        assert response.status_code == 422  # Pydantic validation error
-
-    def test_create_empty_day_of_week(self, client: TestClient):
-        """Test creating shift with empty day of week."""
-        shift_data = {
-            "shift_number": 1,
-            "day_of_week": "   ",  # Whitespace only
-            "duration_hours": 24,
-            "start_time": "08:00:00"
-        }
+    @pytest.mark.parametrize("shift_data", [
+        # Invalid duration: must be 24 or 48
+        {"shift_number": 1, "day_of_week": "Monday", "duration_hours": 12, "start_time": "08:00:00"},
+        # Invalid start time: must be HH:MM
+        {"shift_number": 1, "day_of_week": "Monday", "duration_hours": 24, "start_time": "8:00"},
+        # Missing duration_hours and start_time
+        {"shift_number": 1, "day_of_week": "Monday"},
+        # Whitespace-only day of week
+        {"shift_number": 1, "day_of_week": "   ", "duration_hours": 24, "start_time": "08:00:00"},
+    ], ids=["invalid_duration", "invalid_start_time_format", "missing_required_fields", "empty_day_of_week"])
+    def test_create_invalid(self, client: TestClient, shift_data):
+        """Test that invalid shift payloads are rejected by Pydantic validation."""
         response = client.post("/api/v1/shifts/", json=shift_data)
         assert response.status_code == 422  # Pydantic validation error
 
-
 class TestUpdateShift:
     """Tests for PUT /api/v1/shifts/{id}"""
 
@@ -164,8 +141,7 @@ class TestUpdateShift:
         """Test updating shift day of week."""
         shift = Shift(shift_number=1, day_of_week="Monday", duration_hours=24, start_time="08:00")
         db_session.add(shift)
-        db_session.commit()
-        db_session.refresh(shift)
+        db_session.flush()
 
         update_data = {"day_of_week": "Tuesday"}
         response = client.put(f"/api/v1/shifts/{shift.id}", json=update_data)
@@ -179,8 +155,7 @@ class TestUpdateShift:
         """Test updating shift duration."""
         shift = Shift(shift_number=2, day_of_week="Tuesday", duration_hours=24, start_time="08:00")
         db_session.add(shift)
-        db_session.commit()
-        db_session.refresh(shift)
+        db_session.flush()
 
         update_data = {"duration_hours": 48, "day_of_week": "Tuesday-Wednesday"}
         response = client.put(f"/api/v1/shifts/{shift.id}", json=update_data)
@@ -193,8 +168,7 @@ class TestUpdateShift:
         """Test updating shift start time."""
         shift = Shift(shift_number=1, day_of_week="Monday", duration_hours=24, start_time="08:00")
         db_session.add(shift)
-        db_session.commit()
-        db_session.refresh(shift)
+        db_session.flush()
 
         update_data = {"start_time": "20:00"}
         response = client.put(f"/api/v1/shifts/{shift.id}", json=update_data)
@@ -208,12 +182,22 @@ class TestUpdateShift:
         response = client.put("/api/v1/shifts/999", json=update_data)
         assert response.status_code == 404
 
+    def test_update_nonexistent_shift_with_duplicate_number(
+        self, client: TestClient, db_session: Session
+    ):
+        """Test that a missing shift returns 404 even when the new number is taken."""
+        shift = Shift(shift_number=1, day_of_week="Monday", duration_hours=24, start_time="08:00")
+        db_session.add(shift)
+        db_session.flush()
+
+        response = client.put("/api/v1/shifts/999", json={"shift_number": 1})
+        assert response.status_code == 404
+
     def test_update_invalid_duration(self, client: TestClient, db_session: Session):
         """Test updating to invalid duration."""
         shift = Shift(shift_number=1, day_of_week="Monday", duration_hours=24, start_time="08:00")
         db_session.add(shift)
-        db_session.commit()
-        db_session.refresh(shift)
+        db_session.flush()
 
         update_data = {"duration_hours": 36}  # Invalid
         response = client.put(f"/api/v1/shifts/{shift.id}", json=update_data)
@@ -241,8 +225,7 @@ class TestDeleteShift:
         """Test deleting an existing shift."""
         shift = Shift(shift_number=1, day_of_week="Monday", duration_hours=24, start_time="08:00")
         db_session.add(shift)
-        db_session.commit()
-        db_session.refresh(shift)
+        db_session.flush()
         shift_id = shift.id
 
         response = client.delete(f"/api/v1/shifts/{shift_id}")
@@ -274,44 +257,28 @@ class TestShiftIntegration:
         assert response.status_code == 201
         shift_id = response.json()["id"]
 
-        # Read
-        response = client.get(f"/api/v1/shifts/{shift_id}")
-        assert response.status_code == 200
-        assert response.json()["day_of_week"] == "Monday"
-
-        # Update
-        update_data = {
-            "day_of_week": "Tuesday",
-            "duration_hours": 48
-        }
-        response = client.put(f"/api/v1/shifts/{shift_id}", json=update_data)
-        assert response.status_code == 200
-        assert response.json()["day_of_week"] == "Tuesday"
-        assert response.json()["duration_hours"] == 48
-
-        # Delete
-        response = client.delete(f"/api/v1/shifts/{shift_id}")
-        assert response.status_code == 204
-
-        # Verify deleted
-        response = client.get(f"/api/v1/shifts/{shift_id}")
-        assert response.status_code == 404
+        # Read -> update -> delete -> verify deleted, as
+        # (method, body, expected status, expected fields in the response)
+        steps = [
+            ("GET", None, 200, {"day_of_week": "Monday"}),
+            ("PUT", {"day_of_week": "Tuesday", "duration_hours": 48}, 200,
+             {"day_of_week": "Tuesday", "duration_hours": 48}),
+            ("DELETE", None, 204, None),
+            ("GET", None, 404, None),
+        ]
+        for method, body, expected_status, expected_fields in steps:
+            response = client.request(method, f"/api/v1/shifts/{shift_id}", json=body)
+            assert response.status_code == expected_status, f"{method}: {response.text}"
+            if expected_fields:
+                data = response.json()
+                assert {key: data[key] for key in expected_fields} == expected_fields
 
     def test_create_standard_weekly_rotation(self, client: TestClient):
         """Test creating a standard 6-shift weekly rotation."""
-        shifts = [
-            {"shift_number": 1, "day_of_week": "Monday", "duration_hours": 24, "start_time": "08:00"},
-            {"shift_number": 2, "day_of_week": "Tuesday-Wednesday", "duration_hours": 48, "start_time": "08:00"},
-            {"shift_number": 3, "day_of_week": "Thursday", "duration_hours": 24, "start_time": "08:00"},
-            {"shift_number": 4, "day_of_week": "Friday", "duration_hours": 24, "start_time": "08:00"},
-            {"shift_number": 5, "day_of_week": "Saturday", "duration_hours": 24, "start_time": "08:00"},
-            {"shift_number": 6, "day_of_week": "Sunday", "duration_hours": 24, "start_time": "08:00"},
-        ]
-
-        # Create all shifts
-        for shift_data in shifts:
-            response = client.post("/api/v1/shifts/", json=shift_data)
-            assert response.status_code == 201
+        # Create all shifts (sequentially: the endpoints share the test's session)
+        for body in _SHIFT_ROTATION_JSON:
+            response = client.post("/api/v1/shifts/", content=body, headers=_JSON_HEADERS)
+            assert response.status_code == 201, response.text
 
         # Verify all shifts exist
         response = client.get("/api/v1/shifts/")
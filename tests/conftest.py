@@ -6,8 +6,9 @@ and repository instances.
 """
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 from datetime import datetime, timedelta
 import pytz
 
@@ -19,110 +20,145 @@ from src.repositories import (
     ScheduleRepository,
     NotificationLogRepository
 )
+from tests.fixtures_data import STANDARD_SHIFTS
+
+
+# Looked up once; pytz (not zoneinfo) because tests call chicago_tz.localize()
+_CHICAGO_TZ = pytz.timezone('America/Chicago')
 
 
 # Database Configuration
 # ----------------------
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_db_engine():
     """
     Create an in-memory SQLite database engine for testing.
 
-    Scope: function - New database for each test
+    StaticPool hands every checkout the same DBAPI connection, so schema
+    creation and the test connection (used from the TestClient's thread too)
+    always see one in-memory database.
+
+    pysqlite's own transaction handling is disabled so SAVEPOINTs behave;
+    SQLAlchemy emits BEGIN itself.
+
+    Under pytest-xdist (``pytest -n auto``) every worker is a separate
+    process, so each gets its own private in-memory database from this same
+    URL; no per-worker database name is needed.
+
+    Scope: session - Schema is created once for the whole run (per worker)
     """
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
         echo=False
     )
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "connect")
+    def relax_durability(dbapi_connection, connection_record):
+        # Durability is irrelevant for a throwaway test database; journal
+        # and sync settings are near no-ops in memory but keep temp b-trees
+        # (sorts, DISTINCT, GROUP BY) off disk
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Create all tables in one transaction; the database is new, so skip
+    # the per-table existence checks
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn, checkfirst=False)
 
     yield engine
 
-    # Cleanup
-    Base.metadata.drop_all(bind=engine)
+    # Cleanup: the in-memory database goes away with its connection, so no
+    # drop_all is needed
     engine.dispose()
 
 
-@pytest.fixture(scope="function")
-def test_db_session(test_db_engine):
+@pytest.fixture(scope="session")
+def test_db_connection(test_db_engine):
     """
-    Create a database session for testing.
+    Single connection holding an outer transaction for the whole run.
 
-    Uses a nested transaction (savepoint) to automatically roll back
-    after each test, even if the code under test calls commit().
+    Nothing is ever committed to the database: module-level seed data and
+    each test live in SAVEPOINTs on this connection and are rolled back.
 
-    Scope: function - New session for each test
+    Scope: session
     """
-    from sqlalchemy import event
-
     connection = test_db_engine.connect()
     transaction = connection.begin()
 
-    SessionLocal = sessionmaker(
-        autocommit=False,
-        autoflush=False,
-        bind=connection
-    )
-
-    session = SessionLocal()
-
-    # Begin a nested transaction (savepoint)
-    nested = connection.begin_nested()
-
-    # Each time the session is committed, restart the savepoint
-    @event.listens_for(session, "after_transaction_end")
-    def restart_savepoint(session, transaction):
-        """Restart the savepoint after each commit."""
-        if transaction.nested and not transaction._parent.nested:
-            # Reopen the savepoint
-            session.begin_nested()
-
-    yield session
+    yield connection
 
-    # Rollback the outer transaction to undo all changes
-    session.close()
     transaction.rollback()
     connection.close()
 
 
 @pytest.fixture(scope="function")
-def db_session(test_db_session):
+def db_session(test_db_connection):
     """
-    Alias for test_db_session for service layer tests.
+    Create a database session for testing.
+
+    The test runs inside its own SAVEPOINT; the session joins it with
+    ``create_savepoint`` so code under test can commit() and rollback()
+    freely, and everything is undone when the test's SAVEPOINT is rolled
+    back.
 
-    Provides consistent naming across repository and service tests.
+    Used directly by repository, service and API tests alike.
+
+    Scope: function - New session for each test
     """
-    return test_db_session
+    savepoint = test_db_connection.begin_nested()
+
+    session = Session(
+        bind=test_db_connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint"
+    )
+
+    yield session
+
+    # Undo everything the test wrote
+    session.close()
+    savepoint.rollback()
 
 
 # Repository Fixtures
 # ------------------
 
 @pytest.fixture
-def team_member_repo(test_db_session):
+def team_member_repo(db_session):
     """TeamMemberRepository instance with test database."""
-    return TeamMemberRepository(test_db_session)
+    return TeamMemberRepository(db_session)
 
 
 @pytest.fixture
-def shift_repo(test_db_session):
+def shift_repo(db_session):
     """ShiftRepository instance with test database."""
-    return ShiftRepository(test_db_session)
+    return ShiftRepository(db_session)
 
 
 @pytest.fixture
-def schedule_repo(test_db_session):
+def schedule_repo(db_session):
     """ScheduleRepository instance with test database."""
-    return ScheduleRepository(test_db_session)
+    return ScheduleRepository(db_session)
 
 
 @pytest.fixture
-def notification_log_repo(test_db_session):
+def notification_log_repo(db_session):
     """NotificationLogRepository instance with test database."""
-    return NotificationLogRepository(test_db_session)
+    return NotificationLogRepository(db_session)
 
 
 # Test Data Factories
@@ -153,8 +189,7 @@ def sample_shift_data():
 def sample_schedule_data():
     """Sample schedule data factory (requires IDs to be filled in)."""
     def _make_schedule_data(team_member_id: int, shift_id: int, week_number: int = 1):
-        chicago_tz = pytz.timezone('America/Chicago')
-        start = datetime.now(chicago_tz)
+        start = datetime.now(_CHICAGO_TZ)
         return {
             "team_member_id": team_member_id,
             "shift_id": shift_id,
@@ -183,58 +218,95 @@ def sample_notification_log_data():
 # Pre-populated Test Data
 # -----------------------
 
+def _insert_rows(connection, model, rows) -> list:
+    """
+    Insert rows into model's table with one Core INSERT ... RETURNING.
+
+    Returns:
+        list: Every column of the inserted rows as plain dicts, in input order
+    """
+    table = model.__table__
+    result = connection.execute(
+        insert(table).returning(*table.c, sort_by_parameter_order=True),
+        rows
+    )
+    return [dict(row) for row in result.mappings()]
+
+
+@pytest.fixture(scope="session")
+def _seed_rows(test_db_connection):
+    """
+    Build the populated_* seed data once per run.
+
+    Members, shifts and schedules are inserted with one Core INSERT ...
+    RETURNING per table, straight on the connection, in a SAVEPOINT that is
+    rolled back straight away; only the returned column values, ids
+    included, are kept. The function-scoped populated_* fixtures restore
+    them into each test's SAVEPOINT.
+
+    Scope: session
+    """
+    savepoint = test_db_connection.begin_nested()
+    try:
+        # Active members get rotation_order 0..n-1, as TeamMemberRepository.create assigns
+        members = _insert_rows(test_db_connection, TeamMember, [
+            {"name": "Alice Smith", "phone": "+15551111111", "is_active": True, "rotation_order": 0},
+            {"name": "Bob Johnson", "phone": "+15552222222", "is_active": True, "rotation_order": 1},
+            {"name": "Charlie Brown", "phone": "+15553333333", "is_active": True, "rotation_order": 2},
+            {"name": "Diana Prince", "phone": "+15554444444", "is_active": False, "rotation_order": None},
+            {"name": "Eve Adams", "phone": "+15555555555", "is_active": True, "rotation_order": 3},
+        ])
+
+        shifts = _insert_rows(test_db_connection, Shift, [dict(row) for row in STANDARD_SHIFTS])
+
+        # Sample schedules for the current week
+        base_date = datetime.now(_CHICAGO_TZ)
+        current_week = base_date.isocalendar()[1]
+
+        schedules_data = []
+        for i, (member, shift) in enumerate(zip(members[:5], shifts[:5])):
+            start = base_date + timedelta(days=i)
+            schedules_data.append({
+                "team_member_id": member["id"],
+                "shift_id": shift["id"],
+                "week_number": current_week,
+                "start_datetime": start,
+                "end_datetime": start + timedelta(hours=shift["duration_hours"]),
+                "notified": i % 2 == 0  # Alternate notified status
+            })
+        schedules = _insert_rows(test_db_connection, Schedule, schedules_data)
+
+        return {TeamMember: members, Shift: shifts, Schedule: schedules}
+    finally:
+        savepoint.rollback()
+
+
+def _restore_seed(session: Session, seed_rows: dict, model) -> list:
+    """Insert the captured seed rows for model and return them as ORM objects."""
+    instances = session.scalars(
+        insert(model).returning(model, sort_by_parameter_order=True),
+        seed_rows[model]
+    ).all()
+    session.commit()
+    return instances
+
+
 @pytest.fixture
-def populated_team_members(team_member_repo):
+def populated_team_members(db_session, _seed_rows):
     """Create and return multiple team members in database."""
-    members_data = [
-        {"name": "Alice Smith", "phone": "+15551111111", "is_active": True},
-        {"name": "Bob Johnson", "phone": "+15552222222", "is_active": True},
-        {"name": "Charlie Brown", "phone": "+15553333333", "is_active": True},
-        {"name": "Diana Prince", "phone": "+15554444444", "is_active": False},
-        {"name": "Eve Adams", "phone": "+15555555555", "is_active": True},
-    ]
-
-    members = [team_member_repo.create(data) for data in members_data]
-    return members
+    return _restore_seed(db_session, _seed_rows, TeamMember)
 
 
 @pytest.fixture
-def populated_shifts(shift_repo):
+def populated_shifts(db_session, _seed_rows):
     """Create and return standard 6-day shift pattern."""
-    shifts_data = [
-        {"shift_number": 1, "day_of_week": "Monday", "duration_hours": 24, "start_time": "08:00:00"},
-        {"shift_number": 2, "day_of_week": "Tuesday-Wednesday", "duration_hours": 48, "start_time": "08:00:00"},
-        {"shift_number": 3, "day_of_week": "Thursday", "duration_hours": 24, "start_time": "08:00:00"},
-        {"shift_number": 4, "day_of_week": "Friday", "duration_hours": 24, "start_time": "08:00:00"},
-        {"shift_number": 5, "day_of_week": "Saturday", "duration_hours": 24, "start_time": "08:00:00"},
-        {"shift_number": 6, "day_of_week": "Sunday", "duration_hours": 24, "start_time": "08:00:00"},
-    ]
-
-    shifts = [shift_repo.create(data) for data in shifts_data]
-    return shifts
+    return _restore_seed(db_session, _seed_rows, Shift)
 
 
 @pytest.fixture
-def populated_schedules(schedule_repo, populated_team_members, populated_shifts):
+def populated_schedules(db_session, _seed_rows, populated_team_members, populated_shifts):
     """Create and return sample schedules for current week."""
-    chicago_tz = pytz.timezone('America/Chicago')
-    base_date = datetime.now(chicago_tz)
-    current_week = base_date.isocalendar()[1]
-
-    schedules_data = []
-    for i, (member, shift) in enumerate(zip(populated_team_members[:5], populated_shifts[:5])):
-        start = base_date + timedelta(days=i)
-        schedules_data.append({
-            "team_member_id": member.id,
-            "shift_id": shift.id,
-            "week_number": current_week,
-            "start_datetime": start,
-            "end_datetime": start + timedelta(hours=shift.duration_hours),
-            "notified": i % 2 == 0  # Alternate notified status
-        })
-
-    schedules = [schedule_repo.create(data) for data in schedules_data]
-    return schedules
+    return _restore_seed(db_session, _seed_rows, Schedule)
 
 
 # Utility Fixtures
@@ -243,7 +315,7 @@ def populated_schedules(schedule_repo, populated_team_members, populated_shifts)
 @pytest.fixture
 def chicago_tz():
     """Return Chicago timezone for datetime operations."""
-    return pytz.timezone('America/Chicago')
+    return _CHICAGO_TZ
 
 
 @pytest.fixture
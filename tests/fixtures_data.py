@@ -0,0 +1,19 @@
+"""
+Shared, read-only seed data for the test suite.
+
+Rows are MappingProxyType views so no test can mutate the shared copy;
+pass ``dict(row)`` (or a list of them) wherever a real dict is needed.
+"""
+
+from types import MappingProxyType
+
+
+# Standard 6-shift weekly rotation
+STANDARD_SHIFTS = tuple(MappingProxyType(row) for row in [
+    {"shift_number": 1, "day_of_week": "Monday", "duration_hours": 24, "start_time": "08:00:00"},
+    {"shift_number": 2, "day_of_week": "Tuesday-Wednesday", "duration_hours": 48, "start_time": "08:00:00"},
+    {"shift_number": 3, "day_of_week": "Thursday", "duration_hours": 24, "start_time": "08:00:00"},
+    {"shift_number": 4, "day_of_week": "Friday", "duration_hours": 24, "start_time": "08:00:00"},
+    {"shift_number": 5, "day_of_week": "Saturday", "duration_hours": 24, "start_time": "08:00:00"},
+    {"shift_number": 6, "day_of_week": "Sunday", "duration_hours": 24, "start_time": "08:00:00"},
+])
@@ -34,6 +34,29 @@ class TestNotificationLogRepositoryCRUD:
         assert log.status == "sent"
         assert log.twilio_sid == "SM123456"
 
+    def test_bulk_log_notification_attempts(self, notification_log_repo, populated_schedules):
+        """Test logging several attempts in one write."""
+        schedule_id = populated_schedules[0].id
+        notification_log_repo.bulk_log_notification_attempts([
+            {"schedule_id": schedule_id, "status": "failed", "error_message": "Timeout"},
+            {"schedule_id": schedule_id, "status": "sent", "twilio_sid": "SM654321"},
+        ])
+
+        logs = notification_log_repo.get_by_schedule(schedule_id)
+        assert sorted(log.status for log in logs) == ["failed", "sent"]
+        assert all(log.sent_at is not None for log in logs)
+
+    def test_log_notification_attempts(self, notification_log_repo):
+        """Test logging several attempts in one commit returns them with IDs."""
+        logs = notification_log_repo.log_notification_attempts([
+            {"schedule_id": None, "status": "sent", "twilio_sid": "SM111", "recipient_name": "A"},
+            {"schedule_id": None, "status": "failed", "error_message": "Timeout", "recipient_name": "B"},
+        ])
+
+        assert [log.recipient_name for log in logs] == ["A", "B"]
+        assert all(log.id is not None for log in logs)
+        assert notification_log_repo.log_notification_attempts([]) == []
+
 
 class TestNotificationLogRepositoryQueries:
     """Tests for notification log queries."""
@@ -43,9 +66,9 @@ class TestNotificationLogRepositoryQueries:
         schedule = populated_schedules[0]
 
         # Create multiple logs for same schedule
+        base = sample_notification_log_data(schedule.id)
         for status in ["sent", "failed", "delivered"]:
-            data = sample_notification_log_data(schedule.id, status=status)
-            notification_log_repo.create(data)
+            notification_log_repo.create({**base, "status": status})
 
         logs = notification_log_repo.get_by_schedule(schedule.id)
 
@@ -138,22 +161,53 @@ class TestNotificationLogRepositoryMetrics:
         """Test counting retry attempts for a schedule."""
         schedule = populated_schedules[0]
 
-        # Create multiple attempts
-        for _ in range(3):
-            data = sample_notification_log_data(schedule.id)
-            notification_log_repo.create(data)
+        # Create multiple attempts (one multi-row INSERT)
+        notification_log_repo.bulk_log_notification_attempts(
+            [sample_notification_log_data(schedule.id)] * 3
+        )
 
         count = notification_log_repo.get_retry_count_for_schedule(schedule.id)
 
         assert count == 3
 
+    def test_get_retry_counts_for_schedules(self, notification_log_repo, sample_notification_log_data, populated_schedules):
+        """Test counting retry attempts for several schedules in one call."""
+        first, second, untouched = populated_schedules[:3]
+        notification_log_repo.bulk_log_notification_attempts(
+            [sample_notification_log_data(schedule.id)
+             for schedule, attempts in [(first, 2), (second, 1)]
+             for _ in range(attempts)]
+        )
+
+        counts = notification_log_repo.get_retry_counts_for_schedules(
+            [first.id, second.id, untouched.id]
+        )
+
+        assert counts == {first.id: 2, second.id: 1}
+
+    def test_retry_counts_sum_summarized_attempts(self, notification_log_repo, populated_schedules):
+        """Test an entry covering several attempts counts each of them."""
+        schedule = populated_schedules[0]
+        notification_log_repo.log_notification_attempt(
+            schedule_id=schedule.id,
+            status="failed",
+            error_message="Server error",
+            attempts=3
+        )
+        notification_log_repo.log_notification_attempt(schedule_id=schedule.id, status="sent")
+
+        assert notification_log_repo.get_retry_count_for_schedule(schedule.id) == 4
+        assert notification_log_repo.get_retry_counts_for_schedules([schedule.id]) == {schedule.id: 4}
+
     def test_get_success_rate(self, notification_log_repo, sample_notification_log_data, populated_schedules):
         """Test calculating notification success rate."""
         # Create mix of successful and failed
         statuses = ["sent", "sent", "sent", "failed", "delivered"]
-        for i, status in enumerate(statuses):
-            data = sample_notification_log_data(populated_schedules[i].id, status=status)
-            notification_log_repo.create(data)
+        base = sample_notification_log_data(populated_schedules[0].id)
+        notification_log_repo.bulk_log_notification_attempts([
+            {**base, "schedule_id": schedule.id, "status": status}
+            for schedule, status in zip(populated_schedules, statuses)
+        ])
 
         metrics = notification_log_repo.get_success_rate()
 
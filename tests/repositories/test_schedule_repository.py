@@ -30,6 +30,29 @@ class TestScheduleRepositoryCRUD:
         assert schedule is not None
         assert schedule.id == populated_schedules[0].id
 
+    def test_load_relationships(self, schedule_repo, populated_schedules, db_session):
+        """Test eager-loading team_member and shift for existing instances."""
+        from sqlalchemy import inspect
+
+        for schedule in populated_schedules:
+            db_session.expire(schedule, ['team_member', 'shift'])
+
+        loaded = schedule_repo.load_relationships([s.id for s in populated_schedules])
+
+        assert len(loaded) == len(populated_schedules)
+        for schedule in populated_schedules:
+            assert not {'team_member', 'shift'} & inspect(schedule).unloaded
+
+    def test_mark_many_as_notified(self, schedule_repo, populated_schedules):
+        """Test marking several schedules notified in one update."""
+        pending = [s for s in populated_schedules if not s.notified]
+
+        updated = schedule_repo.mark_many_as_notified([s.id for s in pending])
+
+        assert updated == len(pending)
+        assert all(s.notified for s in populated_schedules)
+        assert schedule_repo.mark_many_as_notified([]) == 0
+
 
 class TestScheduleRepositoryDateQueries:
     """Tests for date-based schedule queries."""
@@ -101,6 +124,20 @@ class TestScheduleRepositoryMemberQueries:
 
         assert all(s.team_member_id == member.id for s in schedules)
 
+    def test_get_by_team_member_eager_loads_relationships(
+        self, schedule_repo, populated_schedules, populated_team_members
+    ):
+        """Test that member schedules come back with team_member and shift loaded."""
+        member_id = populated_team_members[0].id
+        schedule_repo.db.expunge_all()
+
+        schedules = schedule_repo.get_by_team_member(member_id)
+
+        assert schedules
+        for schedule in schedules:
+            assert "team_member" in schedule.__dict__
+            assert "shift" in schedule.__dict__
+
     def test_get_next_assignment_for_member(self, schedule_repo, populated_schedules, populated_team_members):
         """Test getting next upcoming assignment for member."""
         member = populated_team_members[0]
@@ -134,6 +171,29 @@ class TestScheduleRepositoryBulkOperations:
         assert len(created) == 3
         assert all(s.id is not None for s in created)
 
+    def test_bulk_create_keeps_order_and_loads_relationships(
+        self, schedule_repo, populated_team_members, populated_shifts, chicago_tz
+    ):
+        """Test bulk create returns rows in input order with relationships loaded."""
+        base_date = datetime.now(chicago_tz)
+        schedules_data = [
+            {
+                "team_member_id": populated_team_members[i].id,
+                "shift_id": populated_shifts[i].id,
+                "week_number": 1,
+                "start_datetime": base_date + timedelta(days=i),
+                "end_datetime": base_date + timedelta(days=i, hours=24),
+                "notified": False
+            }
+            for i in (2, 0, 1)
+        ]
+
+        created = schedule_repo.bulk_create(schedules_data)
+
+        assert [s.team_member_id for s in created] == [populated_team_members[i].id for i in (2, 0, 1)]
+        assert all("team_member" in s.__dict__ and "shift" in s.__dict__ for s in created)
+        assert schedule_repo.bulk_create([]) == []
+
     def test_delete_future_schedules(self, schedule_repo, populated_schedules, chicago_tz):
         """Test deleting schedules from a specific date forward."""
         # Use naive datetime to match what SQLite stores/retrieves
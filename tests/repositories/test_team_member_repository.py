@@ -50,6 +50,26 @@ class TestTeamMemberRepositoryRead:
         assert retrieved.id == created.id
         assert retrieved.name == created.name
 
+    def test_get_by_id_uses_identity_map(self, team_member_repo, sample_team_member_data):
+        """Test a member already loaded in the session is returned without SQL."""
+        from sqlalchemy import event
+
+        created = team_member_repo.create(sample_team_member_data)
+        statements = []
+        connection = team_member_repo.db.connection()
+
+        def record(*args):
+            statements.append(args[2])
+
+        event.listen(connection, "before_cursor_execute", record)
+        try:
+            retrieved = team_member_repo.get_by_id(created.id)
+        finally:
+            event.remove(connection, "before_cursor_execute", record)
+
+        assert retrieved is created
+        assert statements == []
+
     def test_get_by_id_not_found(self, team_member_repo):
         """Test retrieving non-existent team member returns None."""
         result = team_member_repo.get_by_id(99999)
@@ -162,6 +182,18 @@ class TestTeamMemberRepositorySoftDelete:
         assert activated.is_active is True
         assert activated.id == member.id
 
+    def test_deactivate_and_renumber(self, team_member_repo, populated_team_members):
+        """Test deactivation clears the member's slot and closes the gap."""
+        alice, bob = populated_team_members[:2]
+
+        member = team_member_repo.deactivate_and_renumber(alice.id)
+
+        assert member is alice
+        assert member.is_active is False
+        assert member.rotation_order is None
+        assert bob.rotation_order == 0
+        assert team_member_repo.deactivate_and_renumber(99999) is None
+
     def test_deactivate_non_existent(self, team_member_repo):
         """Test deactivating non-existent member returns None."""
         result = team_member_repo.deactivate(99999)
@@ -220,6 +252,36 @@ class TestTeamMemberRepositoryQueries:
         count = team_member_repo.get_count_active()
         assert count == 4  # 4 active members in fixture
 
+    def test_get_by_ids(self, team_member_repo, populated_team_members):
+        """Test loading several members by ID, skipping unknown IDs."""
+        wanted = [populated_team_members[0].id, populated_team_members[2].id, 99999]
+
+        results = team_member_repo.get_by_ids(wanted)
+
+        assert {m.id for m in results} == set(wanted[:2])
+
+    def test_update_rotation_orders(self, team_member_repo, populated_team_members):
+        """Test reordering several members with one bulk update."""
+        mapping = {m.id: i for i, m in enumerate(reversed(populated_team_members[:3]))}
+
+        results = team_member_repo.update_rotation_orders(mapping)
+
+        assert [m.id for m in results] == [m.id for m in reversed(populated_team_members[:3])]
+        assert [m.rotation_order for m in results] == [0, 1, 2]
+        assert populated_team_members[3].rotation_order is None
+
+    def test_renumber_active_rotation(self, team_member_repo, populated_team_members):
+        """Test gaps in active rotation order are closed, keeping order."""
+        alice, bob, charlie, diana, eve = populated_team_members
+        team_member_repo.update_rotation_orders({alice.id: 5, bob.id: 2, charlie.id: 9, eve.id: 7})
+
+        team_member_repo.renumber_active_rotation()
+
+        ordered = team_member_repo.get_ordered_for_rotation()
+        assert [m.id for m in ordered] == [bob.id, alice.id, eve.id, charlie.id]
+        assert [m.rotation_order for m in ordered] == [0, 1, 2, 3]
+        assert diana.rotation_order is None
+
     def test_search_by_name_exact(self, team_member_repo, populated_team_members):
         """Test searching by exact name match."""
         results = team_member_repo.search_by_name("Alice Smith")
@@ -255,6 +317,10 @@ class TestTeamMemberRepositoryCount:
         count = team_member_repo.count()
         assert count == len(populated_team_members)
 
+    def test_count_empty(self, team_member_repo):
+        """Test counting returns 0 when no members exist."""
+        assert team_member_repo.count() == 0
+
     def test_exists_true(self, team_member_repo, sample_team_member_data):
         """Test exists returns True for existing member."""
         member = team_member_repo.create(sample_team_member_data)
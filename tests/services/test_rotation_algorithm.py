@@ -28,6 +28,8 @@ from src.services.rotation_algorithm import (
     NoShiftsConfiguredError,
     InvalidWeekCountError,
 )
+from src.models.shift import Shift
+from src.models.team_member import TeamMember
 from src.repositories.team_member_repository import TeamMemberRepository
 from src.repositories.shift_repository import ShiftRepository
 
@@ -227,33 +229,27 @@ class TestRotationAlgorithmEdgeCases:
     ):
         """Test rotation with 7 members and 6 shifts (one person off each week)."""
         # Create 7 team members
-        member_repo = TeamMemberRepository(db_session)
-        members = []
-        for i in range(7):
-            member_data = {
-                "name": f"Member {i+1}",
-                "phone": f"+1555867{i:04d}",
-                "is_active": True
-            }
-            members.append(member_repo.create(member_data))
-
-        # Create 6 shifts
-        shift_repo = ShiftRepository(db_session)
-        shift_configs = [
-            (1, "Monday", 24),
-            (2, "Tuesday-Wednesday", 48),
-            (3, "Thursday", 24),
-            (4, "Friday", 24),
-            (5, "Saturday", 24),
-            (6, "Sunday", 24),
-        ]
-        for num, day, duration in shift_configs:
-            shift_repo.create({
-                "shift_number": num,
-                "day_of_week": day,
-                "duration_hours": duration,
-                "start_time": "08:00"
-            })
+        with db_session.no_autoflush:
+            members = [
+                TeamMember(name=f"Member {i+1}", phone=f"+1555867{i:04d}", is_active=True, rotation_order=i)
+                for i in range(7)
+            ]
+            db_session.add_all(members)
+
+            # Create 6 shifts
+            shift_configs = [
+                (1, "Monday", 24),
+                (2, "Tuesday-Wednesday", 48),
+                (3, "Thursday", 24),
+                (4, "Friday", 24),
+                (5, "Saturday", 24),
+                (6, "Sunday", 24),
+            ]
+            db_session.add_all([
+                Shift(shift_number=num, day_of_week=day, duration_hours=duration, start_time="08:00")
+                for num, day, duration in shift_configs
+            ])
+        db_session.flush()
 
         service = RotationAlgorithmService(db_session)
         start_date = chicago_tz.localize(datetime(2025, 11, 4))
@@ -275,31 +271,26 @@ class TestRotationAlgorithmEdgeCases:
     ):
         """Test rotation with 3 members and 6 shifts (members work multiple shifts)."""
         # Create 3 members
-        member_repo = TeamMemberRepository(db_session)
-        for i in range(3):
-            member_repo.create({
-                "name": f"Member {i+1}",
-                "phone": f"+1555123{i:04d}",
-                "is_active": True
-            })
-
-        # Create 6 shifts
-        shift_repo = ShiftRepository(db_session)
-        shift_configs = [
-            (1, "Monday", 24),
-            (2, "Tuesday", 24),
-            (3, "Wednesday", 24),
-            (4, "Thursday", 24),
-            (5, "Friday", 24),
-            (6, "Saturday", 24),
-        ]
-        for num, day, duration in shift_configs:
-            shift_repo.create({
-                "shift_number": num,
-                "day_of_week": day,
-                "duration_hours": duration,
-                "start_time": "08:00"
-            })
+        with db_session.no_autoflush:
+            db_session.add_all([
+                TeamMember(name=f"Member {i+1}", phone=f"+1555123{i:04d}", is_active=True, rotation_order=i)
+                for i in range(3)
+            ])
+
+            # Create 6 shifts
+            shift_configs = [
+                (1, "Monday", 24),
+                (2, "Tuesday", 24),
+                (3, "Wednesday", 24),
+                (4, "Thursday", 24),
+                (5, "Friday", 24),
+                (6, "Saturday", 24),
+            ]
+            db_session.add_all([
+                Shift(shift_number=num, day_of_week=day, duration_hours=duration, start_time="08:00")
+                for num, day, duration in shift_configs
+            ])
+        db_session.flush()
 
         service = RotationAlgorithmService(db_session)
         start_date = chicago_tz.localize(datetime(2025, 11, 4))
@@ -320,13 +311,11 @@ class TestRotationAlgorithmEdgeCases:
     ):
         """Test rotation with 6 members and 6 shifts (everyone works each week)."""
         # Create 6 members
-        member_repo = TeamMemberRepository(db_session)
-        for i in range(6):
-            member_repo.create({
-                "name": f"Member {i+1}",
-                "phone": f"+1555999{i:04d}",
-                "is_active": True
-            })
+        db_session.add_all([
+            TeamMember(name=f"Member {i+1}", phone=f"+1555999{i:04d}", is_active=True, rotation_order=i)
+            for i in range(6)
+        ])
+        db_session.flush()
 
         service = RotationAlgorithmService(db_session)
         start_date = chicago_tz.localize(datetime(2025, 11, 4))
@@ -353,13 +342,11 @@ class TestRotationAlgorithmEdgeCases:
     ):
         """Test rotation with 15 members (simulates large team)."""
         # Create 15 members
-        member_repo = TeamMemberRepository(db_session)
-        for i in range(15):
-            member_repo.create({
-                "name": f"Member {i+1:02d}",
-                "phone": f"+1555{i:07d}",
-                "is_active": True
-            })
+        db_session.add_all([
+            TeamMember(name=f"Member {i+1:02d}", phone=f"+1555{i:07d}", is_active=True, rotation_order=i)
+            for i in range(15)
+        ])
+        db_session.flush()
 
         service = RotationAlgorithmService(db_session)
         start_date = chicago_tz.localize(datetime(2025, 11, 4))
@@ -569,16 +556,13 @@ class TestRotationAlgorithmDateTime:
     ):
         """Test that all day names map to correct weekday offsets."""
         # Create shifts for each day of the week
-        shift_repo = ShiftRepository(db_session)
         days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
-        for i, day in enumerate(days, start=1):
-            shift_repo.create({
-                "shift_number": i,
-                "day_of_week": day,
-                "duration_hours": 24,
-                "start_time": "08:00"
-            })
+        db_session.add_all([
+            Shift(shift_number=i, day_of_week=day, duration_hours=24, start_time="08:00")
+            for i, day in enumerate(days, start=1)
+        ])
+        db_session.flush()
 
         service = RotationAlgorithmService(db_session)
         start_date = chicago_tz.localize(datetime(2025, 11, 4))  # Monday
@@ -93,6 +93,14 @@ class TestShiftServiceCreate:
                 "duration_hours": 24
             })
 
+        # Bool is an int subclass but not a valid shift number
+        with pytest.raises(InvalidShiftDataError):
+            service.create({
+                "shift_number": True,
+                "day_of_week": "Monday",
+                "duration_hours": 24
+            })
+
     def test_create_invalid_day_of_week(self, db_session: Session):
         """Test that invalid day_of_week raises error."""
         service = ShiftService(db_session)
@@ -307,6 +315,37 @@ class TestShiftServiceRead:
         assert len(monday_shifts) == 1
         assert monday_shifts[0].day_of_week == "Monday"
 
+    def test_get_filters_served_from_warm_cache(self, db_session: Session, sample_shift_data):
+        """Test duration/day filters use the cached list once get_all() has run."""
+        service = ShiftService(db_session)
+
+        days = [("Monday", 24), ("Tuesday-Wednesday", 48), ("Thursday", 24)]
+        for i, (day, duration) in enumerate(days):
+            data = sample_shift_data.copy()
+            data["shift_number"] = i + 1
+            data["day_of_week"] = day
+            data["duration_hours"] = duration
+            service.create(data)
+
+        service.get_all(ordered=True)
+        service.repository.get_by_duration = None  # Must not be called
+        service.repository.get_by_day_of_week = None
+
+        assert [s.shift_number for s in service.get_by_duration(24)] == [1, 3]
+        assert [s.shift_number for s in service.get_by_day_of_week("Tuesday")] == [2]
+
+    def test_cache_invalidated_on_create(self, db_session: Session, sample_shift_data):
+        """Test creating a shift clears the cached ordered list."""
+        service = ShiftService(db_session)
+        service.create(sample_shift_data)
+        assert len(service.get_all(ordered=True)) == 1
+
+        data = sample_shift_data.copy()
+        data["shift_number"] = 2
+        service.create(data)
+
+        assert len(service.get_by_duration(24)) == 2
+
     def test_get_by_day_of_week_invalid(self, db_session: Session):
         """Test that invalid day_of_week raises error."""
         service = ShiftService(db_session)
@@ -391,6 +430,16 @@ class TestShiftServiceUpdate:
         with pytest.raises(ShiftNotFoundError):
             service.update(99999, {"shift_number": 10})
 
+    def test_update_non_existent_shift_with_duplicate_number(
+        self, db_session: Session, sample_shift_data
+    ):
+        """Test that a missing shift is reported before the duplicate-number check."""
+        service = ShiftService(db_session)
+        existing = service.create(sample_shift_data)
+
+        with pytest.raises(ShiftNotFoundError):
+            service.update(99999, {"shift_number": existing.shift_number})
+
 
 class TestShiftServiceDelete:
     """Tests for deleting shifts."""
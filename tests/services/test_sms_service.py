@@ -16,7 +16,8 @@ from src.services.sms_service import (
     SMSService,
     SMSServiceError,
     TwilioConfigurationError,
-    SMSDeliveryError
+    SMSDeliveryError,
+    _TWILIO_CLIENT_CACHE
 )
 from src.models import TeamMember, Shift, Schedule, NotificationLog
 
@@ -25,22 +26,30 @@ from src.models import TeamMember, Shift, Schedule, NotificationLog
 CHICAGO_TZ = timezone('America/Chicago')
 
 
+@pytest.fixture(autouse=True)
+def clear_twilio_client_cache():
+    """Reset the shared Twilio client cache so patched Clients don't leak between tests."""
+    _TWILIO_CLIENT_CACHE.clear()
+    yield
+    _TWILIO_CLIENT_CACHE.clear()
+
+
 @pytest.fixture
-def team_member(test_db_session):
+def team_member(db_session):
     """Create a test team member."""
     member = TeamMember(
         name="John Doe",
         phone="+15551234567",
         is_active=True
     )
-    test_db_session.add(member)
-    test_db_session.commit()
-    test_db_session.refresh(member)
+    db_session.add(member)
+    db_session.commit()
+    db_session.refresh(member)
     return member
 
 
 @pytest.fixture
-def shift(test_db_session):
+def shift(db_session):
     """Create a test shift."""
     shift = Shift(
         shift_number=1,
@@ -48,14 +57,14 @@ def shift(test_db_session):
         start_time="08:00:00",
         duration_hours=24
     )
-    test_db_session.add(shift)
-    test_db_session.commit()
-    test_db_session.refresh(shift)
+    db_session.add(shift)
+    db_session.commit()
+    db_session.refresh(shift)
     return shift
 
 
 @pytest.fixture
-def schedule(test_db_session, team_member, shift):
+def schedule(db_session, team_member, shift):
     """Create a test schedule."""
     start = datetime.now(CHICAGO_TZ)
     end = start + timedelta(hours=24)
@@ -68,36 +77,36 @@ def schedule(test_db_session, team_member, shift):
         end_datetime=end,
         notified=False
     )
-    test_db_session.add(schedule)
-    test_db_session.commit()
-    test_db_session.refresh(schedule)
+    db_session.add(schedule)
+    db_session.commit()
+    db_session.refresh(schedule)
     return schedule
 
 
 @pytest.fixture
-def sms_service_mock_mode(test_db_session):
+def sms_service_mock_mode(db_session):
     """Create SMS service in mock mode (no Twilio client)."""
-    return SMSService(test_db_session, mock_mode=True)
+    return SMSService(db_session, mock_mode=True)
 
 
 class TestSMSServiceInitialization:
     """Tests for SMS service initialization."""
 
-    def test_initialization_mock_mode(self, test_db_session):
+    def test_initialization_mock_mode(self, db_session):
         """Test SMS service initialization in mock mode."""
-        service = SMSService(test_db_session, mock_mode=True)
+        service = SMSService(db_session, mock_mode=True)
 
-        assert service.db == test_db_session
+        assert service.db == db_session
         assert service.max_retries == 3
         assert service.base_delay == 60
         assert service.mock_mode is True
         assert service.twilio_client is None
         assert service.from_phone == "+15551234567"
 
-    def test_initialization_with_custom_params(self, test_db_session):
+    def test_initialization_with_custom_params(self, db_session):
         """Test SMS service initialization with custom parameters."""
         service = SMSService(
-            test_db_session,
+            db_session,
             max_retries=5,
             base_delay=30,
             mock_mode=True
@@ -107,10 +116,10 @@ class TestSMSServiceInitialization:
         assert service.base_delay == 30
 
     @patch.dict(os.environ, {}, clear=True)
-    def test_initialization_missing_credentials(self, test_db_session):
+    def test_initialization_missing_credentials(self, db_session):
         """Test initialization fails with missing Twilio credentials."""
         with pytest.raises(TwilioConfigurationError) as exc_info:
-            SMSService(test_db_session, mock_mode=False)
+            SMSService(db_session, mock_mode=False)
 
         assert "Twilio configuration missing" in str(exc_info.value)
 
@@ -120,14 +129,28 @@ class TestSMSServiceInitialization:
         'TWILIO_PHONE_NUMBER': '+15551234567'
     })
     @patch('src.services.sms_service.Client')
-    def test_initialization_with_credentials(self, mock_client, test_db_session):
+    def test_initialization_with_credentials(self, mock_client, db_session):
         """Test successful initialization with valid credentials."""
-        service = SMSService(test_db_session, mock_mode=False)
+        service = SMSService(db_session, mock_mode=False)
 
         assert service.twilio_client is not None
         assert service.from_phone == '+15551234567'
         mock_client.assert_called_once_with('AC123', 'token123')
 
+    @patch.dict(os.environ, {
+        'TWILIO_ACCOUNT_SID': 'AC123',
+        'TWILIO_AUTH_TOKEN': 'token123',
+        'TWILIO_PHONE_NUMBER': '+15551234567'
+    })
+    @patch('src.services.sms_service.Client')
+    def test_twilio_client_shared_across_instances(self, mock_client, db_session):
+        """Test services with the same credentials reuse one Twilio client."""
+        first = SMSService(db_session, mock_mode=False)
+        second = SMSService(db_session, mock_mode=False)
+
+        assert first.twilio_client is second.twilio_client
+        mock_client.assert_called_once_with('AC123', 'token123')
+
 
 class TestSendNotification:
     """Tests for sending individual notifications."""
@@ -148,6 +171,14 @@ class TestSendNotification:
         assert schedule.notified is True
         assert schedule.notified_at is not None
 
+    def test_mock_send_sids_unique(self, sms_service_mock_mode):
+        """Test mock sends return distinct Twilio-shaped SIDs."""
+        first = sms_service_mock_mode._send_sms("+15551234567", "test")['sid']
+        second = sms_service_mock_mode._send_sms("+15551234567", "test")['sid']
+
+        assert first != second
+        assert first.startswith("SM") and len(first) == 34
+
     def test_send_notification_already_notified_skip(self, sms_service_mock_mode, schedule):
         """Test notification skipped if already notified."""
         schedule.notified = True
@@ -192,6 +223,20 @@ class TestSendNotification:
         assert logs[0].twilio_sid == result['twilio_sid']
         assert logs[0].error_message is None
 
+    def test_send_notification_primary_and_secondary(self, sms_service_mock_mode, schedule):
+        """Test both phones are sent to and each send is logged."""
+        schedule.team_member.secondary_phone = "+15559876543"
+        sms_service_mock_mode.db.commit()
+
+        result = sms_service_mock_mode.send_notification(schedule)
+
+        assert result['success'] is True
+        assert result['message'] == "SMS sent successfully to both phones"
+        assert result['secondary']['success'] is True
+
+        logs = sms_service_mock_mode.notification_repo.get_by_schedule(schedule.id)
+        assert sorted(log.recipient_phone for log in logs) == ["+15551234567", "+15559876543"]
+
     def test_send_notification_max_retries_exceeded(self, sms_service_mock_mode, schedule):
         """Test notification fails if max retries already exceeded."""
         # Create 3 failed attempts
@@ -242,6 +287,12 @@ class TestRetryLogic:
         mock_sleep.assert_any_call(60)  # 2nd attempt: base_delay
         mock_sleep.assert_any_call(120)  # 3rd attempt: base_delay * 2
 
+        # All three attempts summarized in one log entry
+        logs = sms_service_mock_mode.notification_repo.get_by_schedule(schedule.id)
+        assert len(logs) == 1
+        assert logs[0].status == 'sent'
+        assert logs[0].attempts == 3
+
     def test_retry_stops_on_non_retryable_error(self, sms_service_mock_mode, schedule):
         """Test retry stops immediately for non-retryable errors."""
         # Mock _send_sms to raise non-retryable error (invalid phone number)
@@ -260,6 +311,31 @@ class TestRetryLogic:
         assert result['success'] is False
         assert result['attempts'] == 3  # Still tries max_retries, but doesn't retry
 
+    @patch('src.services.sms_service.sleep')
+    def test_retry_deferred_to_scheduler(self, mock_sleep, db_session, schedule):
+        """Test a configured retry_scheduler receives the retry instead of sleeping."""
+        retry_scheduler = Mock()
+        service = SMSService(db_session, mock_mode=True, retry_scheduler=retry_scheduler)
+        error = TwilioRestException(status=500, uri="http://test.com", msg="Server error", code=20003)
+
+        with patch.object(service, '_send_sms', side_effect=error):
+            result = service.send_notification(schedule)
+
+        assert result['success'] is False
+        assert result['status'] == 'pending_retry'
+        assert schedule.notified is False
+        mock_sleep.assert_not_called()
+        retry_scheduler.assert_called_once_with(schedule.id, 'primary', 2, 60)
+
+        # The queued attempt succeeds and marks the schedule notified
+        with patch.object(service, '_send_sms', return_value={"sid": "SM123", "status": "sent"}):
+            retry_result = service.retry_notification(schedule, 'primary', 2)
+
+        assert retry_result['success'] is True
+        assert retry_result['attempts'] == 2
+        assert schedule.notified is True
+        assert retry_scheduler.call_count == 1
+
 
 class TestMessageComposition:
     """Tests for SMS message composition."""
@@ -281,6 +357,27 @@ class TestMessageComposition:
 
         assert len(message) <= 160
 
+    def test_compose_message_reuses_cached_template(self, sms_service_mock_mode, schedule):
+        """Test the SMS template is read from settings once per batch of messages."""
+        settings = sms_service_mock_mode.settings_service
+        with patch.object(settings, 'get_sms_template', wraps=settings.get_sms_template) as spy:
+            sms_service_mock_mode._compose_message(schedule)
+            sms_service_mock_mode._compose_message(schedule)
+
+        assert spy.call_count == 1
+        with patch.object(settings, 'get_sms_template', wraps=settings.get_sms_template) as spy:
+            sms_service_mock_mode._compose_message(schedule)
+        assert spy.call_count == 0
+
+    def test_compose_message_picks_up_template_change(self, sms_service_mock_mode, schedule):
+        """Test writing a new template invalidates the cached copy."""
+        sms_service_mock_mode._compose_message(schedule)
+
+        sms_service_mock_mode.settings_service.set_sms_template("Hi {name}, on call now")
+        message = sms_service_mock_mode._compose_message(schedule)
+
+        assert message == f"Hi {schedule.team_member.name}, on call now"
+
     @pytest.mark.skip(reason="v1.5.0: SMS template changed in v1.1.0 - message length limits no longer apply")
     def test_compose_message_with_long_name(self, sms_service_mock_mode, schedule):
         """Test message handling with very long member name."""
@@ -293,10 +390,105 @@ class TestMessageComposition:
         assert len(message) <= 160
 
 
+class TestWeeklySummary:
+    """Tests for escalation weekly summary composition."""
+
+    def test_compose_weekly_summary_48h_continuation(self, sms_service_mock_mode, db_session, team_member, shift):
+        """Test 48h shifts show a continuation line and gaps show no assignment."""
+        shift_48h = Shift(
+            shift_number=2,
+            day_of_week="Tuesday-Wednesday",
+            start_time="08:00:00",
+            duration_hours=48
+        )
+        db_session.add(shift_48h)
+        db_session.commit()
+
+        monday = CHICAGO_TZ.localize(datetime(2025, 11, 24, 8, 0))
+        schedules = []
+        for day_offset, sched_shift in [(0, shift), (1, shift_48h)]:
+            start = monday + timedelta(days=day_offset)
+            schedules.append(Schedule(
+                team_member_id=team_member.id,
+                shift_id=sched_shift.id,
+                week_number=48,
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=sched_shift.duration_hours),
+                notified=False
+            ))
+        db_session.add_all(schedules)
+        db_session.commit()
+
+        message = sms_service_mock_mode._compose_weekly_summary(schedules)
+
+        assert message.split("\n") == [
+            "WhoseOnFirst Weekly Schedule (Nov 24 - Nov 30)",
+            "",
+            "Mon 11/24: John Doe +15551234567",
+            "Tue 11/25: John Doe +15551234567 (48h)",
+            "Wed 11/26: John Doe (continues)",
+            "Thu 11/27: No assignment",
+            "Fri 11/28: No assignment",
+            "Sat 11/29: No assignment",
+            "Sun 11/30: No assignment",
+        ]
+
+    def test_send_escalation_weekly_summary_logs_in_one_write(self, sms_service_mock_mode):
+        """Test contact sends are logged together and IDs attached to details."""
+        config = {
+            "primary_name": "Alice",
+            "primary_phone": "+15550000001",
+            "secondary_name": "Bob",
+            "secondary_phone": "+15550000002",
+        }
+
+        def mock_send_sms(to_phone, message_body):
+            if to_phone == "+15550000002":
+                raise TwilioRestException(status=400, uri="http://test.com", msg="Invalid", code=21211)
+            return {"sid": "SM123", "status": "sent"}
+
+        repo = sms_service_mock_mode.notification_repo
+        with patch.object(sms_service_mock_mode, '_send_sms', side_effect=mock_send_sms), \
+                patch.object(repo, 'log_notification_attempt') as per_send, \
+                patch.object(repo, 'log_notification_attempts', wraps=repo.log_notification_attempts) as bulk:
+            result = sms_service_mock_mode.send_escalation_weekly_summary("Summary", config)
+
+        per_send.assert_not_called()
+        bulk.assert_called_once()
+        assert result["successful"] == 1
+        assert result["failed"] == 1
+        assert [d["status"] for d in result["details"]] == ["sent", "failed"]
+        assert all(d["notification_id"] is not None for d in result["details"])
+
+    def test_send_escalation_weekly_summary_sends_concurrently(self, sms_service_mock_mode):
+        """Test both escalation contacts are sent to at the same time."""
+        import threading
+
+        config = {
+            "primary_name": "Alice",
+            "primary_phone": "+15550000001",
+            "secondary_name": "Bob",
+            "secondary_phone": "+15550000002",
+        }
+
+        # Each send waits for the other to be in flight; serial sends would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def mock_send_sms(to_phone, message_body):
+            barrier.wait()
+            return {"sid": "SM123", "status": "sent"}
+
+        with patch.object(sms_service_mock_mode, '_send_sms', side_effect=mock_send_sms):
+            result = sms_service_mock_mode.send_escalation_weekly_summary("Summary", config)
+
+        assert result["successful"] == 2
+        assert [d["name"] for d in result["details"]] == ["Alice", "Bob"]
+
+
 class TestBatchNotifications:
     """Tests for batch notification sending."""
 
-    def test_send_batch_notifications_success(self, sms_service_mock_mode, test_db_session, team_member, shift):
+    def test_send_batch_notifications_success(self, sms_service_mock_mode, db_session, team_member, shift):
         """Test successful batch notification sending."""
         # Create 3 schedules
         schedules = []
@@ -310,14 +502,16 @@ class TestBatchNotifications:
                 end_datetime=start + timedelta(hours=24),
                 notified=False
             )
-            test_db_session.add(schedule)
+            db_session.add(schedule)
             schedules.append(schedule)
 
-        test_db_session.commit()
+        db_session.commit()
         for s in schedules:
-            test_db_session.refresh(s)
+            db_session.refresh(s)
 
-        result = sms_service_mock_mode.send_batch_notifications(schedules)
+        repo = sms_service_mock_mode.schedule_repo
+        with patch.object(repo, 'mark_many_as_notified', wraps=repo.mark_many_as_notified) as mark:
+            result = sms_service_mock_mode.send_batch_notifications(schedules)
 
         assert result['total'] == 3
         assert result['successful'] == 3
@@ -325,7 +519,13 @@ class TestBatchNotifications:
         assert result['skipped'] == 0
         assert len(result['results']) == 3
 
-    def test_send_batch_notifications_mixed_results(self, sms_service_mock_mode, test_db_session, team_member, shift):
+        # All three marked notified by a single UPDATE
+        mark.assert_called_once_with([s.id for s in schedules], commit=False)
+        for s in schedules:
+            db_session.refresh(s)
+            assert s.notified is True
+
+    def test_send_batch_notifications_mixed_results(self, sms_service_mock_mode, db_session, team_member, shift):
         """Test batch notifications with mixed success/skip/fail."""
         # Create 3 schedules: 1 new, 1 already notified, 1 will fail
         schedules = []
@@ -339,7 +539,7 @@ class TestBatchNotifications:
             end_datetime=datetime.now(CHICAGO_TZ) + timedelta(hours=24),
             notified=False
         )
-        test_db_session.add(schedule1)
+        db_session.add(schedule1)
         schedules.append(schedule1)
 
         # Schedule 2: Already notified (will skip)
@@ -351,12 +551,12 @@ class TestBatchNotifications:
             end_datetime=datetime.now(CHICAGO_TZ) + timedelta(days=1, hours=24),
             notified=True
         )
-        test_db_session.add(schedule2)
+        db_session.add(schedule2)
         schedules.append(schedule2)
 
-        test_db_session.commit()
+        db_session.commit()
         for s in schedules:
-            test_db_session.refresh(s)
+            db_session.refresh(s)
 
         result = sms_service_mock_mode.send_batch_notifications(schedules)
 
@@ -365,6 +565,157 @@ class TestBatchNotifications:
         assert result['skipped'] == 1
         assert result['failed'] == 0
 
+    @patch('src.services.sms_service.sleep')
+    def test_send_batch_notifications_counts_pending_retry(self, mock_sleep, db_session, schedule):
+        """Test deliveries queued on retry_scheduler are not counted as failed."""
+        retry_scheduler = Mock()
+        service = SMSService(db_session, mock_mode=True, retry_scheduler=retry_scheduler)
+        error = TwilioRestException(status=500, uri="http://test.com", msg="Server error", code=20003)
+
+        with patch.object(service, '_send_sms', side_effect=error):
+            result = service.send_batch_notifications([schedule])
+
+        assert result['total'] == 1
+        assert result['pending_retry'] == 1
+        assert result['failed'] == 0
+        assert result['successful'] == 0
+        assert result['results'][0]['status'] == 'pending_retry'
+        retry_scheduler.assert_called_once()
+
+    def test_send_batch_notifications_buffers_log_writes(self, sms_service_mock_mode, db_session, team_member, shift):
+        """Test a batch writes its notification logs in a single bulk insert."""
+        schedules = []
+        for i in range(3):
+            start = datetime.now(CHICAGO_TZ) + timedelta(days=i)
+            schedules.append(Schedule(
+                team_member_id=team_member.id,
+                shift_id=shift.id,
+                week_number=i + 1,
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=24),
+                notified=False
+            ))
+        db_session.add_all(schedules)
+        db_session.commit()
+
+        repo = sms_service_mock_mode.notification_repo
+        with patch.object(repo, 'log_notification_attempt') as single_log, \
+                patch.object(repo, 'bulk_log_notification_attempts',
+                             wraps=repo.bulk_log_notification_attempts) as bulk_log:
+            sms_service_mock_mode.send_batch_notifications(schedules)
+
+        single_log.assert_not_called()
+        bulk_log.assert_called_once()
+        assert len(bulk_log.call_args[0][0]) == 3
+        assert sms_service_mock_mode._log_buffer is None
+
+    def test_send_batch_notifications_via_notify(self, sms_service_mock_mode, schedule):
+        """Test phones sharing a message body go out in one Notify request."""
+        schedule.team_member.secondary_phone = "+15559876543"
+        sms_service_mock_mode.db.commit()
+        sms_service_mock_mode.notify_service_sid = "IS123"
+
+        with patch.object(sms_service_mock_mode, '_send_notify', return_value="NT123") as notify, \
+                patch.object(sms_service_mock_mode, '_send_sms') as send_sms:
+            result = sms_service_mock_mode.send_batch_notifications([schedule])
+
+        notify.assert_called_once()
+        assert notify.call_args[0][0] == ["+15551234567", "+15559876543"]
+        send_sms.assert_not_called()
+        assert result['successful'] == 1
+        # Notify SIDs aren't message SIDs, so none is stored for status lookups
+        assert result['results'][0]['twilio_sid'] is None
+        logs = sms_service_mock_mode.notification_repo.get_by_schedule(schedule.id)
+        assert logs and all(log.twilio_sid is None for log in logs)
+
+    def test_send_batch_notifications_notify_falls_back(self, sms_service_mock_mode, schedule):
+        """Test a failed Notify request falls back to per-phone sends."""
+        schedule.team_member.secondary_phone = "+15559876543"
+        sms_service_mock_mode.db.commit()
+        sms_service_mock_mode.notify_service_sid = "IS123"
+
+        with patch.object(sms_service_mock_mode, '_send_notify', side_effect=Exception("Notify down")):
+            result = sms_service_mock_mode.send_batch_notifications([schedule])
+
+        assert result['successful'] == 1
+        assert result['results'][0]['message'] == "SMS sent successfully to both phones"
+
+    def test_send_batch_notifications_delivers_concurrently(self, sms_service_mock_mode, db_session, team_member, shift):
+        """Test batch deliveries overlap instead of running one after another."""
+        import threading
+
+        schedules = []
+        for i in range(3):
+            start = datetime.now(CHICAGO_TZ) + timedelta(days=i)
+            schedules.append(Schedule(
+                team_member_id=team_member.id,
+                shift_id=shift.id,
+                week_number=i + 1,
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=24),
+                notified=False
+            ))
+        db_session.add_all(schedules)
+        db_session.commit()
+
+        # Every send waits for all three to be in flight; serial sends would time out
+        barrier = threading.Barrier(3, timeout=5)
+
+        def mock_send_sms(to_phone, message_body):
+            barrier.wait()
+            return {"sid": "SM123", "status": "sent"}
+
+        with patch.object(sms_service_mock_mode, '_send_sms', side_effect=mock_send_sms):
+            result = sms_service_mock_mode.send_batch_notifications(schedules)
+
+        assert result['successful'] == 3
+        assert [r['schedule_id'] for r in result['results']] == [s.id for s in schedules]
+
+    def test_send_batch_notifications_prefetches_retry_counts(self, sms_service_mock_mode, schedule):
+        """Test a batch counts prior attempts with one query instead of one per schedule."""
+        for _ in range(3):
+            sms_service_mock_mode.notification_repo.log_notification_attempt(
+                schedule_id=schedule.id,
+                status='failed',
+                error_message='Test error'
+            )
+
+        repo = sms_service_mock_mode.notification_repo
+        with patch.object(repo, 'get_retry_count_for_schedule') as per_schedule:
+            result = sms_service_mock_mode.send_batch_notifications([schedule])
+
+        per_schedule.assert_not_called()
+        assert result['failed'] == 1
+        assert result['results'][0]['message'] == 'Exceeded maximum retry attempts'
+
+    def test_send_batch_notifications_loads_relationships_once(self, sms_service_mock_mode, db_session, schedule):
+        """Test schedules missing team_member/shift are loaded in one query."""
+        from sqlalchemy import inspect
+
+        db_session.expire(schedule, ['team_member', 'shift'])
+        assert {'team_member', 'shift'} <= inspect(schedule).unloaded
+
+        repo = sms_service_mock_mode.schedule_repo
+        with patch.object(repo, 'load_relationships', wraps=repo.load_relationships) as load:
+            result = sms_service_mock_mode.send_batch_notifications([schedule])
+
+        load.assert_called_once_with([schedule.id])
+        assert result['successful'] == 1
+
+    def test_send_batch_notifications_skips_notified_without_queries(self, sms_service_mock_mode, schedule):
+        """Test already notified schedules are skipped before any per-schedule DB work."""
+        schedule.notified = True
+
+        with patch.object(sms_service_mock_mode, '_prepare_notification') as prepare, \
+                patch.object(sms_service_mock_mode.notification_repo,
+                             'get_retry_counts_for_schedules', return_value={}) as counts:
+            result = sms_service_mock_mode.send_batch_notifications([schedule])
+
+        prepare.assert_not_called()
+        counts.assert_called_once_with([])
+        assert result['skipped'] == 1
+        assert result['results'][0]['status'] == 'skipped'
+
     def test_send_batch_notifications_empty_list(self, sms_service_mock_mode):
         """Test batch notifications with empty list."""
         result = sms_service_mock_mode.send_batch_notifications([])
@@ -440,7 +791,7 @@ class TestDeliveryStatus:
         'TWILIO_PHONE_NUMBER': '+15551234567'
     })
     @patch('src.services.sms_service.Client')
-    def test_get_delivery_status_real_mode(self, mock_client_class, test_db_session):
+    def test_get_delivery_status_real_mode(self, mock_client_class, db_session):
         """Test getting delivery status with real Twilio client."""
         # Setup mock
         mock_message = Mock()
@@ -455,12 +806,40 @@ class TestDeliveryStatus:
         mock_client.messages = mock_messages
         mock_client_class.return_value = mock_client
 
-        service = SMSService(test_db_session, mock_mode=False)
+        service = SMSService(db_session, mock_mode=False)
         status = service.get_delivery_status("SM123")
 
         assert status['sid'] == "SM123"
         assert status['status'] == "delivered"
 
+    @patch.dict(os.environ, {
+        'TWILIO_ACCOUNT_SID': 'AC123',
+        'TWILIO_AUTH_TOKEN': 'token123',
+        'TWILIO_PHONE_NUMBER': '+15551234567'
+    })
+    @patch('src.services.sms_service.Client')
+    def test_get_delivery_statuses_real_mode(self, mock_client_class, db_session):
+        """Test batch status lookup keeps results keyed by SID, including failures."""
+        def fetch_for(sid):
+            fetch = Mock()
+            if sid == "SM_BAD":
+                fetch.fetch.side_effect = TwilioRestException(404, "uri", "Not found")
+            else:
+                fetch.fetch.return_value = Mock(
+                    sid=sid, status="delivered", error_code=None, error_message=None
+                )
+            return fetch
+
+        service = SMSService(db_session, mock_mode=False)
+        service.twilio_client = Mock(messages=Mock(side_effect=fetch_for))
+
+        statuses = service.get_delivery_statuses(["SM1", "SM_BAD", "SM2"])
+
+        assert list(statuses) == ["SM1", "SM_BAD", "SM2"]
+        assert statuses["SM1"]["status"] == "delivered"
+        assert statuses["SM2"]["sid"] == "SM2"
+        assert statuses["SM_BAD"] is None
+
 
 class TestIntegration:
     """Integration tests for full notification workflow."""
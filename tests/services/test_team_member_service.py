@@ -328,6 +328,19 @@ class TestTeamMemberServiceActivation:
 
         assert deactivated.is_active is False
 
+    def test_deactivate_renumbers_rotation(self, db_session: Session, populated_team_members):
+        """Test deactivating a member closes the gap in rotation order."""
+        service = TeamMemberService(db_session)
+        removed = populated_team_members[1]
+
+        deactivated = service.deactivate(removed.id)
+
+        assert deactivated.is_active is False
+        assert deactivated.rotation_order is None
+        remaining = service.repository.get_ordered_for_rotation()
+        assert [m.rotation_order for m in remaining] == list(range(len(remaining)))
+        assert removed.id not in {m.id for m in remaining}
+
     def test_deactivate_already_inactive(self, db_session: Session, sample_team_member_data):
         """Test deactivating already inactive member (idempotent)."""
         service = TeamMemberService(db_session)
@@ -359,6 +372,17 @@ class TestTeamMemberServiceActivation:
 
         assert activated.is_active is True
 
+    def test_rotation_order_assigned_at_end(self, db_session: Session, populated_team_members):
+        """Test new and re-activated members join the end of the rotation."""
+        service = TeamMemberService(db_session)
+        inactive = populated_team_members[3]
+
+        assert [m.rotation_order for m in service.get_active()] == [0, 1, 2, 3]
+
+        activated = service.activate(inactive.id)
+
+        assert activated.rotation_order == 4
+
     def test_deactivate_non_existent_member(self, db_session: Session):
         """Test that deactivating non-existent member raises error."""
         service = TeamMemberService(db_session)
@@ -448,6 +472,32 @@ class TestTeamMemberServiceQueries:
 
         assert count == 2
 
+    def test_list_and_count_share_one_load(self, db_session: Session, populated_team_members, monkeypatch):
+        """Test list and count calls are served from one cached load."""
+        service = TeamMemberService(db_session)
+        service.get_all()
+        monkeypatch.setattr(service.repository, "get_all", None)  # Must not be called again
+
+        assert [m.name for m in service.get_active()] == [
+            "Alice Smith", "Bob Johnson", "Charlie Brown", "Eve Adams"
+        ]
+        assert [m.name for m in service.get_inactive()] == ["Diana Prince"]
+        assert service.get_count(active_only=True) == 4
+        assert service.get_count() == 5
+
+    def test_services_share_repository_per_session(self, db_session: Session):
+        """Test services on the same session reuse one repository."""
+        assert TeamMemberService(db_session).repository is TeamMemberService(db_session).repository
+
+    def test_member_cache_invalidated_on_deactivate(self, db_session: Session, populated_team_members):
+        """Test deactivating a member clears the cached member list."""
+        service = TeamMemberService(db_session)
+        assert service.get_count(active_only=True) == 4
+
+        service.deactivate(populated_team_members[0].id)
+
+        assert service.get_count(active_only=True) == 3
+
     def test_search_by_name_exact(self, db_session: Session, sample_team_member_data):
         """Test searching by exact name."""
         service = TeamMemberService(db_session)
@@ -486,3 +536,29 @@ class TestTeamMemberServiceQueries:
         results = service.search_by_name("NonExistent")
 
         assert len(results) == 0
+
+
+class TestTeamMemberServiceRotationOrder:
+    """Tests for reordering the rotation."""
+
+    def test_update_rotation_orders(self, db_session: Session, populated_team_members):
+        """Test reordering members in a single call."""
+        service = TeamMemberService(db_session)
+        first, second = populated_team_members[:2]
+
+        service.update_rotation_orders({first.id: 1, second.id: 0})
+
+        assert first.rotation_order == 1
+        assert second.rotation_order == 0
+
+    def test_update_rotation_orders_missing_member(self, db_session: Session, populated_team_members):
+        """Test that unknown IDs are rejected before any change is made."""
+        service = TeamMemberService(db_session)
+        member = populated_team_members[0]
+        original_order = member.rotation_order
+
+        with pytest.raises(MemberNotFoundError) as exc_info:
+            service.update_rotation_orders({member.id: 7, 99999: 0})
+
+        assert "99999" in str(exc_info.value)
+        assert member.rotation_order == original_order